@@ -3,7 +3,7 @@ import Link from 'next/link';
 import type { Metadata } from 'next';
 import { ExternalLink, Zap, ThumbsUp, ArrowLeft, Check, X, Info, Lightbulb } from 'lucide-react';
 import { SITE_NAME, SITE_URL, PRICING_CONFIG } from '@/lib/constants';
-import { getToolBySlug, getCategoryBySlug, getSimilarTools, getCategories, getTools, getToolBenchmarks, getToolExternalScores, getToolUpdates } from '@/lib/supabase/queries';
+import { getToolBySlug, getCategoryBySlug, getSimilarTools, getToolSlugs, getToolBenchmarks, getToolExternalScores, getToolUpdates } from '@/lib/supabase/queries';
 import { getPopularCompareTargets, getCompareUrl } from '@/lib/compare/popular-pairs';
 import { cn, getAvatarColor, formatVisitCount } from '@/lib/utils';
 import Badge from '@/components/ui/Badge';
@@ -40,8 +40,8 @@ export async function generateMetadata({ params }: Props): Promise<Metadata> {
 }
 
 export async function generateStaticParams() {
-  const tools = await getTools();
-  return tools.map((tool) => ({ slug: tool.slug }));
+  const slugs = await getToolSlugs();
+  return slugs.map((slug) => ({ slug }));
 }
 
 export default async function ToolDetailPage({ params }: Props) {
@@ -49,13 +49,12 @@ export default async function ToolDetailPage({ params }: Props) {
   const tool = await getToolBySlug(slug);
   if (!tool) notFound();
 
-  const categories = await getCategories();
-  const primaryCategory = tool.categories?.find(c => c.is_primary) || tool.categories?.[0];
-  const category = categories.find((c) => c.id === primaryCategory?.id);
+  // 첨부된 카테고리에 이름/slug가 있으므로 전체 카테고리 목록은 불러오지 않음
+  const category = tool.categories?.find(c => c.is_primary) || tool.categories?.[0];
   const [similarTools, benchmarks, toolUpdates] = await Promise.all([
     getSimilarTools(tool, 3),
-    tool.has_benchmark_data ? getToolBenchmarks(tool.id) : Promise.resolve([]),
-    getToolUpdates(tool.id),
+    tool.has_benchmark_data ? getToolBenchmarks(tool.id, tool.slug) : Promise.resolve([]),
+    getToolUpdates(tool.id, 10, tool.slug),
   ]);
   const pricingStyle = PRICING_CONFIG[tool.pricing_type];
   const pricingVariant = tool.pricing_type === 'Free' ? 'free' : tool.pricing_type === 'Freemium' ? 'freemium' : 'paid';
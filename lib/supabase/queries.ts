@@ -13,7 +13,6 @@ import type {
   DailyPick, CommunityPost, ToolUpdate, ToolUpdateType,
 } from '@/types';
 import { HERO_KEYWORDS } from '@/lib/constants';
-import seedData from '@/data/seed.json';
 
 // ==========================================
 // 컬렉션 시드 타입 (seed.json 전용, tool_ids 배열 사용)
@@ -61,42 +60,158 @@ async function db() {
 }
 
 // ==========================================
-// Seed 데이터 캐스팅
+// Seed 데이터 캐스팅 (지연 로딩)
 // ==========================================
-const seedRaw = seedData as Record<string, unknown>;
-const seed = {
-  tools: seedData.tools as unknown as Tool[],
-  categories: seedData.categories as unknown as Category[],
-  tool_categories: seedRaw.tool_categories as any[] | undefined,
-  // 새 2단계 분류
-  user_types: seedRaw.user_types as UserType[] | undefined,
-  purpose_tool_recommendations: seedRaw.purpose_tool_recommendations as PurposeToolRecommendation[] | undefined,
-  // 레거시 호환
-  job_categories: seedRaw.job_categories as JobCategory[] | undefined,
-  edu_levels: seedRaw.edu_levels as EduLevel[] | undefined,
-  job_tool_recommendations: seedRaw.job_tool_recommendations as JobToolRecommendation[] | undefined,
-  edu_tool_recommendations: seedRaw.edu_tool_recommendations as EduToolRecommendation[] | undefined,
-  // 기타 데이터
-  news: seedRaw.news as News[] | undefined,
-  guides: seedRaw.guides as Guide[] | undefined,
-  collections: seedRaw.collections as SeedCollection[] | undefined,
-  tool_benchmark_scores: seedRaw.tool_benchmark_scores as ToolBenchmarkScore[] | undefined,
-  tool_external_scores: seedRaw.tool_external_scores as ToolExternalScore[] | undefined,
-  tool_updates: seedRaw.tool_updates as ToolUpdate[] | undefined,
-  category_showcases: seedRaw.category_showcases as CategoryShowcase[] | undefined,
-  tool_showcases: seedRaw.tool_showcases as ToolShowcase[] | undefined,
-  role_showcases: seedRaw.role_showcases as RoleShowcase[] | undefined,
-  role_use_cases: seedRaw.role_use_cases as RoleUseCaseShowcase[] | undefined,
-};
+function castSeed(seedData: Record<string, unknown>) {
+  return {
+    tools: seedData.tools as Tool[],
+    categories: seedData.categories as Category[],
+    tool_categories: seedData.tool_categories as any[] | undefined,
+    // 새 2단계 분류
+    user_types: seedData.user_types as UserType[] | undefined,
+    purpose_tool_recommendations: seedData.purpose_tool_recommendations as PurposeToolRecommendation[] | undefined,
+    // 레거시 호환
+    job_categories: seedData.job_categories as JobCategory[] | undefined,
+    edu_levels: seedData.edu_levels as EduLevel[] | undefined,
+    job_tool_recommendations: seedData.job_tool_recommendations as JobToolRecommendation[] | undefined,
+    edu_tool_recommendations: seedData.edu_tool_recommendations as EduToolRecommendation[] | undefined,
+    // 기타 데이터
+    news: seedData.news as News[] | undefined,
+    guides: seedData.guides as Guide[] | undefined,
+    collections: seedData.collections as SeedCollection[] | undefined,
+    tool_benchmark_scores: seedData.tool_benchmark_scores as ToolBenchmarkScore[] | undefined,
+    tool_external_scores: seedData.tool_external_scores as ToolExternalScore[] | undefined,
+    tool_updates: seedData.tool_updates as ToolUpdate[] | undefined,
+    category_showcases: seedData.category_showcases as CategoryShowcase[] | undefined,
+    tool_showcases: seedData.tool_showcases as ToolShowcase[] | undefined,
+    role_showcases: seedData.role_showcases as RoleShowcase[] | undefined,
+    role_use_cases: seedData.role_use_cases as RoleUseCaseShowcase[] | undefined,
+  };
+}
+
+type Seed = ReturnType<typeof castSeed>;
+
+let seedPromise: Promise<Seed> | null = null;
+
+/**
+ * seed.json을 처음 필요할 때 한 번만 동적 임포트
+ * - 정적 임포트하지 않으므로 읽기 모델로 응답하는 상세 페이지는 seed 전체를 싣지 않음
+ */
+function loadSeed(): Promise<Seed> {
+  if (!seedPromise) {
+    seedPromise = import('@/data/seed.json').then((m) => castSeed(m.default as Record<string, unknown>));
+  }
+  return seedPromise;
+}
 
 // ==========================================
 // 다중 카테고리 헬퍼 함수
 // ==========================================
 
+// ==========================================
+// 도구별 읽기 모델 (data/tools/<slug>.json)
+// ==========================================
+
+/** scripts/build_read_model.py가 prebuild 단계에서 만드는 도구 1개 분량의 조인 결과 */
+interface ToolDocument {
+  seed_sha256: string | null;
+  tool: Tool;
+  external_scores: ToolExternalScore[];
+  benchmark_scores: ToolBenchmarkScore[];
+  showcases: (ToolShowcase & { showcase?: CategoryShowcase })[];
+  updates: ToolUpdate[];
+  /** getSimilarTools() 순서의 같은 주 카테고리 도구 slug (자기 자신 제외) */
+  similar_tools: string[];
+}
+
+/** 읽기 모델을 만든 seed.json의 상태 (data/tools/_stamp.json, 빌드 시 기록) */
+interface ReadModelStamp {
+  seed_sha256: string;
+  seed_size: number;
+  seed_mtime_ns: string;
+}
+
+/**
+ * 읽기 모델이 현재 seed.json으로 만들어졌으면 그 sha256, 아니면 null
+ * - 런타임에는 seed를 읽거나 해시하지 않고 stamp와 stat(크기/mtime)만 비교
+ *   (next dev에서 seed 수정 시 재빌드 전까지 seed 폴백)
+ * - seed.json이 번들에 없는 서버리스 배포에서는 빌드 시 stamp를 그대로 신뢰
+ * - stamp를 읽을 수 없으면 null
+ */
+async function readModelSeedDigest(): Promise<string | null> {
+  try {
+    const { readFile, stat } = await import('node:fs/promises');
+    const { join } = await import('node:path');
+    const stamp = JSON.parse(
+      await readFile(join(process.cwd(), 'data', 'tools', '_stamp.json'), 'utf-8'),
+    ) as ReadModelStamp;
+    const info = await stat(join(process.cwd(), 'data', 'seed.json'), { bigint: true }).catch(() => null);
+    if (info && (Number(info.size) !== stamp.seed_size || String(info.mtimeNs) !== stamp.seed_mtime_ns)) {
+      return null;
+    }
+    return stamp.seed_sha256;
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * 읽기 모델에서 도구 문서를 읽음
+ * - seed.json 전체를 조인하지 않고 해당 도구 파일 하나만 읽음
+ * - 파일이 없거나 (prebuild 전 dev 환경 등) 문서의 seed_sha256이 stamp와 다르거나
+ *   stamp가 현재 seed.json과 맞지 않으면 (seed 수정 후 재빌드 전) null 반환 → seed 폴백
+ * - fs는 동적 임포트로 불러 클라이언트 번들에 포함되지 않도록 함
+ * - 서버리스 배포에서는 next.config.ts의 outputFileTracingIncludes로 파일을 포함
+ */
+async function readToolDocument(slug: string): Promise<ToolDocument | null> {
+  if (!/^[a-z0-9][a-z0-9._-]*$/.test(slug)) return null;
+  try {
+    const { readFile } = await import('node:fs/promises');
+    const { join } = await import('node:path');
+    const body = await readFile(join(process.cwd(), 'data', 'tools', `${slug}.json`), 'utf-8');
+    const doc = JSON.parse(body) as ToolDocument;
+    const digest = await readModelSeedDigest();
+    if (!digest || doc.seed_sha256 !== digest) return null;
+    return doc;
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * toolId의 도구 문서 (slug를 아는 호출부용)
+ * - slug가 없거나 문서의 도구 id가 다르면 null → seed 폴백
+ */
+async function readToolDocumentFor(toolId: string, toolSlug?: string): Promise<ToolDocument | null> {
+  if (!toolSlug) return null;
+  const doc = await readToolDocument(toolSlug);
+  return doc?.tool.id === toolId ? doc : null;
+}
+
+/**
+ * 읽기 모델 manifest의 도구 slug 목록 (seed 순서)
+ * - stamp가 현재 seed.json과 맞지 않거나 manifest를 읽을 수 없으면 null
+ */
+async function readToolManifestSlugs(): Promise<string[] | null> {
+  const digest = await readModelSeedDigest();
+  if (!digest) return null;
+  try {
+    const { readFile } = await import('node:fs/promises');
+    const { join } = await import('node:path');
+    const manifest = JSON.parse(await readFile(join(process.cwd(), 'data', 'tools', 'manifest.json'), 'utf-8')) as {
+      source?: { seed_sha256?: string };
+      tools: Record<string, unknown>;
+    };
+    return manifest.source?.seed_sha256 === digest ? Object.keys(manifest.tools) : null;
+  } catch {
+    return null;
+  }
+}
+
 /**
  * Seed 데이터에서 도구에 카테고리 정보를 첨부
  */
-function attachCategoriesToTools(tools: Tool[]): Tool[] {
+function attachCategoriesToTools(seed: Seed, tools: Tool[]): Tool[] {
   if (!seed.tool_categories) {
     // tool_categories가 없으면 레거시 category_id 사용
     return tools.map(tool => {
@@ -174,6 +289,7 @@ export async function getCategories(): Promise<Category[]> {
     const { data } = await supabase.from('categories').select('*').order('sort_order');
     if (data?.length) return data as Category[];
   }
+  const seed = await loadSeed();
   return seed.categories.sort((a, b) => a.sort_order - b.sort_order);
 }
 
@@ -183,6 +299,7 @@ export async function getCategoryBySlug(slug: string): Promise<Category | undefi
     const { data } = await supabase.from('categories').select('*').eq('slug', slug).single();
     if (data) return data as Category;
   }
+  const seed = await loadSeed();
   return seed.categories.find((c) => c.slug === slug);
 }
 
@@ -196,7 +313,21 @@ export async function getTools(): Promise<Tool[]> {
     const { data } = await supabase.from('tools').select('*');
     if (data?.length) return data as Tool[];
   }
-  return attachCategoriesToTools(seed.tools);
+  const seed = await loadSeed();
+  return attachCategoriesToTools(seed, seed.tools);
+}
+
+/** 모든 도구 slug (상세 페이지 generateStaticParams용, 읽기 모델이 있으면 seed를 읽지 않음) */
+export async function getToolSlugs(): Promise<string[]> {
+  const supabase = await db();
+  if (supabase) {
+    const { data } = await supabase.from('tools').select('slug');
+    if (data?.length) return data.map((t: { slug: string }) => t.slug);
+  }
+  const slugs = await readToolManifestSlugs();
+  if (slugs) return slugs;
+  const seed = await loadSeed();
+  return seed.tools.map((t) => t.slug);
 }
 
 export async function getToolById(id: string): Promise<Tool | undefined> {
@@ -206,9 +337,10 @@ export async function getToolById(id: string): Promise<Tool | undefined> {
     const { data } = await supabase.from('tools').select('*').eq('id', id).single();
     if (data) return data as Tool;
   }
+  const seed = await loadSeed();
   const tool = seed.tools.find((t) => t.id === id);
   if (!tool) return undefined;
-  return attachCategoriesToTools([tool])[0];
+  return attachCategoriesToTools(seed, [tool])[0];
 }
 
 export async function getToolBySlug(slug: string): Promise<Tool | undefined> {
@@ -218,9 +350,12 @@ export async function getToolBySlug(slug: string): Promise<Tool | undefined> {
     const { data } = await supabase.from('tools').select('*').eq('slug', slug).single();
     if (data) return data as Tool;
   }
+  const doc = await readToolDocument(slug);
+  if (doc) return doc.tool;
+  const seed = await loadSeed();
   const tool = seed.tools.find((t) => t.slug === slug);
   if (!tool) return undefined;
-  return attachCategoriesToTools([tool])[0];
+  return attachCategoriesToTools(seed, [tool])[0];
 }
 
 export async function getToolsByCategory(categoryId: string): Promise<Tool[]> {
@@ -238,16 +373,17 @@ export async function getToolsByCategory(categoryId: string): Promise<Tool[]> {
   }
 
   // Seed data에서 tool_categories를 통해 필터링
+  const seed = await loadSeed();
   if (seed.tool_categories) {
     const toolIds = seed.tool_categories
       .filter(tc => tc.category_id === categoryId)
       .map(tc => tc.tool_id);
     const tools = seed.tools.filter(t => toolIds.includes(t.id));
-    return attachCategoriesToTools(tools).sort((a, b) => b.visit_count - a.visit_count);
+    return attachCategoriesToTools(seed, tools).sort((a, b) => b.visit_count - a.visit_count);
   }
 
   // 레거시: category_id 사용
-  return attachCategoriesToTools(
+  return attachCategoriesToTools(seed,
     seed.tools.filter((t) => (t as any).category_id === categoryId)
   ).sort((a, b) => b.visit_count - a.visit_count);
 }
@@ -264,7 +400,8 @@ export async function getEditorPicks(limit = 6): Promise<Tool[]> {
       .limit(limit);
     if (data?.length) return data as Tool[];
   }
-  return attachCategoriesToTools(
+  const seed = await loadSeed();
+  return attachCategoriesToTools(seed,
     seed.tools
       .filter((t) => t.is_editor_pick)
       .sort((a, b) => b.rating_avg - a.rating_avg)
@@ -296,20 +433,27 @@ export async function getSimilarTools(tool: Tool, limit = 3): Promise<Tool[]> {
     }
   }
 
+  const doc = await readToolDocumentFor(tool.id, tool.slug);
+  if (doc?.similar_tools) {
+    const docs = await Promise.all(doc.similar_tools.slice(0, limit).map(readToolDocument));
+    if (docs.every(Boolean)) return docs.map((d) => d!.tool);
+  }
+
   // Seed fallback
+  const seed = await loadSeed();
   if (seed.tool_categories && primaryCategoryId) {
     const toolIds = seed.tool_categories
       .filter(tc => tc.category_id === primaryCategoryId && tc.is_primary)
       .map(tc => tc.tool_id)
       .filter(id => id !== tool.id);
     const tools = seed.tools.filter(t => toolIds.includes(t.id));
-    return attachCategoriesToTools(tools)
+    return attachCategoriesToTools(seed, tools)
       .sort((a, b) => b.rating_avg - a.rating_avg)
       .slice(0, limit);
   }
 
   // Legacy fallback
-  return attachCategoriesToTools(
+  return attachCategoriesToTools(seed,
     seed.tools
       .filter((t) => (t as any).category_id === primaryCategoryId && t.id !== tool.id)
       .sort((a, b) => b.rating_avg - a.rating_avg)
@@ -328,7 +472,8 @@ export async function getLatestTools(limit = 4): Promise<Tool[]> {
       .limit(limit);
     if (data?.length) return data as Tool[];
   }
-  return attachCategoriesToTools(
+  const seed = await loadSeed();
+  return attachCategoriesToTools(seed,
     [...seed.tools]
       .sort((a, b) => new Date(b.created_at).getTime() - new Date(a.created_at).getTime())
       .slice(0, limit)
@@ -350,6 +495,7 @@ export async function getTrendingTools(limit = 4): Promise<Tool[]> {
     if (data?.length) return data as Tool[];
   }
   // seed fallback: trend_direction='up' 우선, 없으면 ranking_score 상위
+  const seed = await loadSeed();
   const trending = [...seed.tools]
     .filter(t => t.trend_direction === 'up')
     .sort((a, b) => (b.trend_magnitude ?? 0) - (a.trend_magnitude ?? 0));
@@ -384,6 +530,7 @@ export async function getTopToolsByCategorySlug(slug: string, limit = 4): Promis
       if (data?.length) return data as Tool[];
     }
   }
+  const seed = await loadSeed();
   const seedCat = seed.categories.find((c) => c.slug === slug);
   if (!seedCat) return [];
 
@@ -397,7 +544,7 @@ export async function getTopToolsByCategorySlug(slug: string, limit = 4): Promis
     tools = tools.filter((t) => (t as any).category_id === seedCat.id);
   }
 
-  return attachCategoriesToTools(tools)
+  return attachCategoriesToTools(seed, tools)
     .sort((a, b) => b.ranking_score - a.ranking_score)
     .slice(0, limit);
 }
@@ -437,6 +584,7 @@ export async function getRankings(categorySlug?: string): Promise<(Tool & { rank
   }
 
   // Seed fallback
+  const seed = await loadSeed();
   let tools = [...seed.tools];
   if (categorySlug) {
     const cat = seed.categories.find((c) => c.slug === categorySlug);
@@ -450,7 +598,7 @@ export async function getRankings(categorySlug?: string): Promise<(Tool & { rank
     }
   }
 
-  const toolsWithCategories = attachCategoriesToTools(tools);
+  const toolsWithCategories = attachCategoriesToTools(seed, tools);
 
   return toolsWithCategories
     .sort((a, b) => {
@@ -506,6 +654,7 @@ export async function getRankingsByBenchmark(categorySlug?: string): Promise<(To
   }
 
   // Seed fallback
+  const seed = await loadSeed();
   if (!tools.length) {
     let seedTools = seed.tools.filter(t => t.has_benchmark_data);
     if (categorySlug) {
@@ -517,7 +666,7 @@ export async function getRankingsByBenchmark(categorySlug?: string): Promise<(To
         seedTools = seedTools.filter(t => toolIds.includes(t.id));
       }
     }
-    tools = attachCategoriesToTools(seedTools);
+    tools = attachCategoriesToTools(seed, seedTools);
   }
 
   // 벤치마크 데이터 조인
@@ -581,6 +730,7 @@ export async function getMostUsedTools(limit = 5): Promise<Tool[]> {
       .limit(limit);
     if (data) return data;
   }
+  const seed = await loadSeed();
   return [...seed.tools].sort((a, b) => (b.visit_count || 0) - (a.visit_count || 0)).slice(0, limit);
 }
 
@@ -595,6 +745,7 @@ export async function getRecentlyPopularTools(limit = 5): Promise<Tool[]> {
       .limit(limit);
     if (data) return data;
   }
+  const seed = await loadSeed();
   return [...seed.tools].sort((a, b) => (b.weekly_visit_delta || 0) - (a.weekly_visit_delta || 0)).slice(0, limit);
 }
 
@@ -610,6 +761,7 @@ export async function getTopRatedTools(limit = 5): Promise<Tool[]> {
       .limit(limit);
     if (data) return data;
   }
+  const seed = await loadSeed();
   return [...seed.tools]
     .filter(t => (t.review_count || 0) >= 3)
     .sort((a, b) => (b.rating_avg || 0) - (a.rating_avg || 0))
@@ -628,6 +780,7 @@ export async function getFastestGrowingTools(limit = 5): Promise<Tool[]> {
       .limit(limit);
     if (data) return data;
   }
+  const seed = await loadSeed();
   return [...seed.tools]
     .filter(t => t.trend_direction === 'up')
     .sort((a, b) => (b.trend_magnitude || 0) - (a.trend_magnitude || 0))
@@ -675,6 +828,7 @@ export async function getTrending(limit = 10): Promise<Tool[]> {
       .limit(limit);
     if (fallback?.length) return fallback as Tool[];
   }
+  const seed = await loadSeed();
   return [...seed.tools]
     .sort((a, b) => {
       // trend_magnitude가 있으면 우선 사용
@@ -708,6 +862,7 @@ export async function getJobCategories(): Promise<JobCategory[]> {
     const { data } = await supabase.from('job_categories').select('*').order('sort_order');
     if (data?.length) return data as JobCategory[];
   }
+  const seed = await loadSeed();
   return (seed.job_categories || []).sort((a, b) => a.sort_order - b.sort_order);
 }
 
@@ -717,6 +872,7 @@ export async function getJobCategoryBySlug(slug: string): Promise<JobCategory |
     const { data } = await supabase.from('job_categories').select('*').eq('slug', slug).single();
     if (data) return data as JobCategory;
   }
+  const seed = await loadSeed();
   return (seed.job_categories || []).find((j) => j.slug === slug);
 }
 
@@ -739,6 +895,7 @@ export async function getJobRecommendations(jobSlug: string): Promise<JobToolRec
   }
 
   // Seed fallback
+  const seed = await loadSeed();
   const seedJob = (seed.job_categories || []).find((j) => j.slug === jobSlug);
   if (!seedJob) return [];
   const recs = (seed.job_tool_recommendations || [])
@@ -759,6 +916,7 @@ export async function getEduLevels(): Promise<EduLevel[]> {
     const { data } = await supabase.from('edu_levels').select('*').order('sort_order');
     if (data?.length) return data as EduLevel[];
   }
+  const seed = await loadSeed();
   return (seed.edu_levels || []).sort((a, b) => a.sort_order - b.sort_order);
 }
 
@@ -768,6 +926,7 @@ export async function getEduLevelBySlug(slug: string): Promise<EduLevel | undefi
     const { data } = await supabase.from('edu_levels').select('*').eq('slug', slug).single();
     if (data) return data as EduLevel;
   }
+  const seed = await loadSeed();
   return (seed.edu_levels || []).find((e) => e.slug === slug);
 }
 
@@ -790,6 +949,7 @@ export async function getEduRecommendations(levelSlug: string): Promise<EduToolR
   }
 
   // Seed fallback
+  const seed = await loadSeed();
   const seedLevel = (seed.edu_levels || []).find((e) => e.slug === levelSlug);
   if (!seedLevel) return [];
   const recs = (seed.edu_tool_recommendations || [])
@@ -812,6 +972,7 @@ export async function getAllJobRecommendations(): Promise<JobToolRecommendation[
       .select('*');
     if (data?.length) return data as JobToolRecommendation[];
   }
+  const seed = await loadSeed();
   return seed.job_tool_recommendations || [];
 }
 
@@ -823,6 +984,7 @@ export async function getAllEduRecommendations(): Promise<EduToolRecommendation[
       .select('*');
     if (data?.length) return data as EduToolRecommendation[];
   }
+  const seed = await loadSeed();
   return seed.edu_tool_recommendations || [];
 }
 
@@ -835,6 +997,7 @@ export async function getUserTypes(): Promise<UserType[]> {
     const { data } = await supabase.from('user_types').select('*').order('sort_order');
     if (data?.length) return data as UserType[];
   }
+  const seed = await loadSeed();
   return (seed.user_types || []).sort((a, b) => a.sort_order - b.sort_order);
 }
 
@@ -844,6 +1007,7 @@ export async function getUserTypeBySlug(slug: string): Promise<UserType | undefi
     const { data } = await supabase.from('user_types').select('*').eq('slug', slug).single();
     if (data) return data as UserType;
   }
+  const seed = await loadSeed();
   return (seed.user_types || []).find((u) => u.slug === slug);
 }
 
@@ -869,6 +1033,7 @@ export async function getPurposeRecommendations(
   }
 
   // Seed fallback
+  const seed = await loadSeed();
   let recs = (seed.purpose_tool_recommendations || [])
     .filter((r) => r.purpose_slug === purposeSlug);
   if (userTypeSlug) {
@@ -889,6 +1054,7 @@ export async function getAllPurposeRecommendations(): Promise<PurposeToolRecomme
       .select('*');
     if (data?.length) return data as PurposeToolRecommendation[];
   }
+  const seed = await loadSeed();
   return seed.purpose_tool_recommendations || [];
 }
 
@@ -916,6 +1082,7 @@ export async function getToolsByPurpose(purposeSlug: string, limit?: number): Pr
   }
 
   // Seed fallback: find category by slug
+  const seed = await loadSeed();
   const seedCat = seed.categories.find((c) => c.slug === purposeSlug);
   if (!seedCat) return [];
 
@@ -929,7 +1096,7 @@ export async function getToolsByPurpose(purposeSlug: string, limit?: number): Pr
     tools = tools.filter((t) => (t as any).category_id === seedCat.id);
   }
 
-  const toolsWithCategories = attachCategoriesToTools(tools).sort((a, b) => b.ranking_score - a.ranking_score);
+  const toolsWithCategories = attachCategoriesToTools(seed, tools).sort((a, b) => b.ranking_score - a.ranking_score);
   return limit ? toolsWithCategories.slice(0, limit) : toolsWithCategories;
 }
 
@@ -1041,11 +1208,12 @@ export async function searchTools(filters: SearchFilters): Promise<Tool[]> {
     }
   }
 
-  return searchToolsSeed(filters);
+  const seed = await loadSeed();
+  return searchToolsSeed(seed, filters);
 }
 
 /** Seed 데이터 기반 검색 (폴백용) */
-function searchToolsSeed(filters: SearchFilters): Tool[] {
+function searchToolsSeed(seed: Seed, filters: SearchFilters): Tool[] {
   let results = [...seed.tools];
 
   if (filters.query) {
@@ -1137,6 +1305,7 @@ export async function getAutocompleteSuggestions(query: string, limit = 5): Prom
   }
 
   const q = query.toLowerCase();
+  const seed = await loadSeed();
   return seed.tools
     .filter((t) => t.name.toLowerCase().includes(q) || t.tags.some((tag) => tag.toLowerCase().includes(q)))
     .sort((a, b) => b.visit_count - a.visit_count)
@@ -1156,6 +1325,7 @@ export async function getNews(limit?: number, category?: NewsCategory): Promise<
     if (data?.length) return data as News[];
   }
 
+  const seed = await loadSeed();
   let news = [...(seed.news || [])]
     .sort((a, b) => new Date(b.published_at).getTime() - new Date(a.published_at).getTime());
   if (category) news = news.filter((n) => n.category === category);
@@ -1168,6 +1338,7 @@ export async function getNewsById(id: string): Promise<News | undefined> {
     const { data } = await supabase.from('news').select('*').eq('id', id).single();
     if (data) return data as News;
   }
+  const seed = await loadSeed();
   return (seed.news || []).find((n) => n.id === id);
 }
 
@@ -1181,6 +1352,7 @@ export async function getHotNews(limit = 5): Promise<News[]> {
       .limit(limit);
     if (data?.length) return data as News[];
   }
+  const seed = await loadSeed();
   return [...(seed.news || [])]
     .sort((a, b) => b.view_count - a.view_count)
     .slice(0, limit);
@@ -1198,6 +1370,7 @@ export async function getGuides(category?: string): Promise<Guide[]> {
     if (data?.length) return data as Guide[];
   }
 
+  const seed = await loadSeed();
   let guides = [...(seed.guides || [])];
   if (category) guides = guides.filter((g) => g.category === category);
   return guides.sort((a, b) => new Date(b.created_at).getTime() - new Date(a.created_at).getTime());
@@ -1209,6 +1382,7 @@ export async function getGuideBySlug(slug: string): Promise<Guide | undefined> {
     const { data } = await supabase.from('guides').select('*').eq('slug', slug).single();
     if (data) return data as Guide;
   }
+  const seed = await loadSeed();
   return (seed.guides || []).find((g) => g.slug === slug);
 }
 
@@ -1222,6 +1396,7 @@ export async function getGuidesByJob(jobId: string): Promise<Guide[]> {
       .order('created_at', { ascending: false });
     if (data?.length) return data as Guide[];
   }
+  const seed = await loadSeed();
   return (seed.guides || []).filter((g) => g.related_job_id === jobId);
 }
 
@@ -1235,6 +1410,7 @@ export async function getGuidesByEdu(eduId: string): Promise<Guide[]> {
       .order('created_at', { ascending: false });
     if (data?.length) return data as Guide[];
   }
+  const seed = await loadSeed();
   return (seed.guides || []).filter((g) => g.related_edu_id === eduId);
 }
 
@@ -1258,6 +1434,7 @@ export async function getCollections(): Promise<(SeedCollection & { tools: Tool[
     }
   }
 
+  const seed = await loadSeed();
   return (seed.collections || [])
     .filter((c) => c.is_public)
     .sort((a, b) => b.like_count - a.like_count)
@@ -1285,6 +1462,7 @@ export async function getCollectionById(id: string): Promise<(SeedCollection & {
     }
   }
 
+  const seed = await loadSeed();
   const c = (seed.collections || []).find((col) => col.id === id);
   if (!c) return undefined;
   return {
@@ -1326,7 +1504,7 @@ export async function getHeroKeywordsOrdered(): Promise<typeof HERO_KEYWORDS[num
 /**
  * 도구의 벤치마크 점수를 조회합니다.
  */
-export async function getToolBenchmarks(toolId: string): Promise<ToolBenchmarkScore[]> {
+export async function getToolBenchmarks(toolId: string, toolSlug?: string): Promise<ToolBenchmarkScore[]> {
   const supabase = await db();
   if (supabase) {
     const { data } = await supabase
@@ -1335,14 +1513,17 @@ export async function getToolBenchmarks(toolId: string): Promise<ToolBenchmarkSc
       .eq('tool_id', toolId);
     if (data?.length) return data as ToolBenchmarkScore[];
   }
+  const doc = await readToolDocumentFor(toolId, toolSlug);
+  if (doc) return doc.benchmark_scores;
   // Seed fallback
+  const seed = await loadSeed();
   return (seed.tool_benchmark_scores || []).filter((b) => b.tool_id === toolId);
 }
 
 /**
  * 도구의 외부 점수 목록을 조회합니다.
  */
-export async function getToolExternalScores(toolId: string): Promise<ToolExternalScore[]> {
+export async function getToolExternalScores(toolId: string, toolSlug?: string): Promise<ToolExternalScore[]> {
   const supabase = await db();
   if (supabase) {
     const { data } = await supabase
@@ -1351,7 +1532,10 @@ export async function getToolExternalScores(toolId: string): Promise<ToolExterna
       .eq('tool_id', toolId);
     if (data?.length) return data as ToolExternalScore[];
   }
+  const doc = await readToolDocumentFor(toolId, toolSlug);
+  if (doc) return doc.external_scores;
   // Seed fallback
+  const seed = await loadSeed();
   return (seed.tool_external_scores || []).filter((s) => s.tool_id === toolId);
 }
 
@@ -1392,10 +1576,12 @@ export async function getScoringWeights(): Promise<ScoringWeight[]> {
 // 카테고리 쇼케이스 (프롬프트→결과 비교)
 // ==========================================
 export async function getCategoryShowcase(categorySlug: string): Promise<CategoryShowcase | undefined> {
+  const seed = await loadSeed();
   return (seed.category_showcases || []).find((s) => s.category_slug === categorySlug);
 }
 
 export async function getToolShowcasesByCategory(categorySlug: string): Promise<(ToolShowcase & { tool?: Tool })[]> {
+  const seed = await loadSeed();
   const showcase = (seed.category_showcases || []).find((s) => s.category_slug === categorySlug);
   if (!showcase) return [];
   const items = (seed.tool_showcases || [])
@@ -1408,6 +1594,9 @@ export async function getToolShowcasesByCategory(categorySlug: string): Promise<
 }
 
 export async function getToolShowcases(toolSlug: string): Promise<(ToolShowcase & { showcase?: CategoryShowcase })[]> {
+  const doc = await readToolDocument(toolSlug);
+  if (doc) return doc.showcases;
+  const seed = await loadSeed();
   const items = (seed.tool_showcases || []).filter((ts) => ts.tool_slug === toolSlug);
   return items.map((ts) => ({
     ...ts,
@@ -1416,6 +1605,7 @@ export async function getToolShowcases(toolSlug: string): Promise<(ToolShowcase
 }
 
 export async function getAllCategoryShowcases(): Promise<CategoryShowcase[]> {
+  const seed = await loadSeed();
   return (seed.category_showcases || []).sort((a, b) => a.sort_order - b.sort_order);
 }
 
@@ -1423,12 +1613,14 @@ export async function getAllCategoryShowcases(): Promise<CategoryShowcase[]> {
 // 역할별 AI 활용 쇼케이스 (직업/교육)
 // ==========================================
 export async function getRoleShowcase(targetType: 'job' | 'education', targetSlug: string): Promise<RoleShowcase | undefined> {
+  const seed = await loadSeed();
   return (seed.role_showcases || []).find(
     (rs) => rs.target_type === targetType && rs.target_slug === targetSlug
   );
 }
 
 export async function getRoleUseCases(roleShowcaseId: string): Promise<(RoleUseCaseShowcase & { tool?: Tool })[]> {
+  const seed = await loadSeed();
   const items = (seed.role_use_cases || [])
     .filter((ruc) => ruc.role_showcase_id === roleShowcaseId)
     .sort((a, b) => a.sort_order - b.sort_order);
@@ -1439,6 +1631,7 @@ export async function getRoleUseCases(roleShowcaseId: string): Promise<(RoleUseC
 }
 
 export async function getAllRoleShowcases(targetType?: 'job' | 'education'): Promise<RoleShowcase[]> {
+  const seed = await loadSeed();
   const all = (seed.role_showcases || []).sort((a, b) => a.sort_order - b.sort_order);
   return targetType ? all.filter((rs) => rs.target_type === targetType) : all;
 }
@@ -1521,6 +1714,7 @@ export async function getDailyPicks(limit = 8): Promise<(DailyPick & { tool?: To
   }
 
   // seed fallback: 트렌딩/신규/숨은명작/무료추천 자동 생성 (사실적 이유 포함)
+  const seed = await loadSeed();
   const trending = [...seed.tools]
     .filter(t => t.trend_direction === 'up')
     .sort((a, b) => (b.trend_magnitude ?? 0) - (a.trend_magnitude ?? 0))
@@ -1590,7 +1784,7 @@ export async function getTrendingQuestions(limit = 5): Promise<CommunityPost[]>
 // ==========================================
 
 /** 특정 도구의 업데이트 이력 */
-export async function getToolUpdates(toolId: string, limit = 10): Promise<ToolUpdate[]> {
+export async function getToolUpdates(toolId: string, limit = 10, toolSlug?: string): Promise<ToolUpdate[]> {
   const supabase = await db();
   if (supabase) {
     const { data } = await supabase
@@ -1601,6 +1795,9 @@ export async function getToolUpdates(toolId: string, limit = 10): Promise<ToolUp
       .limit(limit);
     if (data?.length) return data as ToolUpdate[];
   }
+  const doc = await readToolDocumentFor(toolId, toolSlug);
+  if (doc) return doc.updates.slice(0, limit);
+  const seed = await loadSeed();
   return (seed.tool_updates || [])
     .filter(u => u.tool_id === toolId)
     .sort((a, b) => new Date(b.announced_at).getTime() - new Date(a.announced_at).getTime())
@@ -1619,6 +1816,7 @@ export async function getRecentUpdates(limit = 20): Promise<ToolUpdate[]> {
     if (data?.length) return data as ToolUpdate[];
   }
   // seed fallback: tool 정보 수동 조인
+  const seed = await loadSeed();
   const updates = [...(seed.tool_updates || [])]
     .sort((a, b) => new Date(b.announced_at).getTime() - new Date(a.announced_at).getTime())
     .slice(0, limit);
@@ -1643,6 +1841,7 @@ export async function getRecentUpdatesByType(type: ToolUpdateType, limit = 20):
       .limit(limit);
     if (data?.length) return data as ToolUpdate[];
   }
+  const seed = await loadSeed();
   const updates = [...(seed.tool_updates || [])]
     .filter(u => u.update_type === type)
     .sort((a, b) => new Date(b.announced_at).getTime() - new Date(a.announced_at).getTime())
@@ -1,6 +1,11 @@
 import type { NextConfig } from "next";
 
 const nextConfig: NextConfig = {
+  // 도구 상세 읽기 모델(scripts/build_read_model.py)은 런타임에 fs로 읽으므로
+  // 이를 쓰는 도구 상세 페이지의 서버리스 함수 번들에만 명시적으로 포함
+  outputFileTracingIncludes: {
+    '/tools/[slug]': ['./data/tools/**/*'],
+  },
   async redirects() {
     return [
       // 카테고리 통일: 삭제/병합된 slug 리다이렉트
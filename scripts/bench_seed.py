@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Benchmark seed load / index / patch / validate / dump at growing catalog sizes
+
+Each tier's synthetic seed is cloned from data/seed.json (see seedkit.synth)
+in one process and benchmarked in another fresh one, so peak RSS covers
+only the measured stages of that tier. The stages run without the marshal
+sidecar: "load" parses the JSON and "dump" writes none. "validate" runs
+schema.check_batches() over every patched tool. The sidecar path is timed
+separately afterwards: "sidecar dump" is dump_seed() writing one and
+"sidecar load" reads it back. "legacy" times the pre-engine path (one
+json.load + linear `for tool in data['tools']` loop + indent=2 json.dump per
+batch script) in a process of its own, with its own peak RSS. Peak RSS
+comes from the resource module, which Windows lacks; there it is shown as "-".
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from seedkit import SeedIndex, apply_updates, dump_seed, load_seed
+from seedkit.batches import load_batches
+from seedkit.paths import SEED_PATH
+from seedkit.schema import SchemaError, check_batches
+from seedkit.synth import synthesize
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_TIERS = (231, 500, 5000, 50000)
+STAGES = ('load', 'index', 'apply', 'validate', 'dump')
+SIDECAR_STAGES = ('sidecar dump', 'sidecar load')
+
+
+def _peak_rss_mb():
+    """Peak RSS of this process in MiB, or None where the resource module is unavailable."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return peak / (1 << 20) if sys.platform == 'darwin' else peak / 1024
+
+
+def validate_tools(data):
+    """Check every tool against the migrations' schema. Returns the number of problems."""
+    try:
+        check_batches([{tool['slug']: tool for tool in data['tools']}], names=['tools'])
+    except SchemaError as e:
+        return len(e.issues)
+    return 0
+
+
+def legacy_run(path):
+    batches = [updates for _, updates in load_batches(SCRIPTS_DIR)]
+    t = time.perf_counter()
+    for updates in batches:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        for tool in data['tools']:
+            slug = tool['slug']
+            if slug in updates and updates[slug] != "SKIP":
+                for key, value in updates[slug].items():
+                    tool[key] = value
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+    return time.perf_counter() - t, _peak_rss_mb()
+
+
+def make_synthetic(template_path, n_tools, path):
+    template = load_seed(template_path)
+    dump_seed(synthesize(template, n_tools), path, use_sidecar=False)
+
+
+def run_tier(path):
+    batches = [updates for _, updates in load_batches(SCRIPTS_DIR)]
+    timings = {}
+
+    t = time.perf_counter()
+    data = load_seed(path, use_sidecar=False)
+    timings['load'] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    index = SeedIndex(data)
+    for section in ('tool_categories', 'tool_external_scores', 'tool_showcases'):
+        index.rows(section, data['tools'][0]['slug'])
+    timings['index'] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    apply_updates(data, *batches, index=index)
+    timings['apply'] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    issues = validate_tools(data)
+    timings['validate'] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    dump_seed(data, path, use_sidecar=False)
+    timings['dump'] = time.perf_counter() - t
+    rss_mb = _peak_rss_mb()
+
+    t = time.perf_counter()
+    dump_seed(data, path)
+    timings['sidecar dump'] = time.perf_counter() - t
+    del data, index
+
+    t = time.perf_counter()
+    load_seed(path)
+    timings['sidecar load'] = time.perf_counter() - t
+
+    return {'timings': timings, 'schema_issues': issues, 'rss_mb': rss_mb}
+
+
+def bench(n_tools, template_path, legacy):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'seed.json')
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            pool.submit(make_synthetic, template_path, n_tools, path).result()
+        size_mb = os.path.getsize(path) / (1 << 20)
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            result = pool.submit(run_tier, path).result()
+        if legacy:
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                result['timings']['legacy'], result['legacy_rss_mb'] = pool.submit(legacy_run, path).result()
+    return {'tools': n_tools, 'size_mb': size_mb, **result}
+
+
+def print_table(results):
+    cols = STAGES + ('total',) + SIDECAR_STAGES + ('legacy',)
+    width = {c: max(11, len(c) + 3) for c in cols}
+    print(f"{'tools':>7} {'MB':>7} " + ' '.join(f"{c + ' ms':>{width[c]}}" for c in cols)
+          + f" {'peak RSS MB':>12} {'legacy RSS':>11}")
+    for r in results:
+        t = r['timings']
+        t['total'] = sum(t[s] for s in STAGES)
+        cells = ' '.join(f"{t[c] * 1000:{width[c]}.1f}" if c in t else f"{'-':>{width[c]}}" for c in cols)
+        rss = f"{r['rss_mb']:12.1f}" if r['rss_mb'] is not None else f"{'-':>12}"
+        legacy_rss = (f"{r['legacy_rss_mb']:11.1f}" if r.get('legacy_rss_mb') is not None
+                      else f"{'-':>11}")
+        print(f"{r['tools']:7d} {r['size_mb']:7.2f} {cells} {rss} {legacy_rss}")
+        if r['schema_issues']:
+            print(f"        ! {r['schema_issues']} schema problems in the patched tools")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tiers', type=int, nargs='+', default=DEFAULT_TIERS, metavar='N',
+                        help=f"catalog sizes (default: {' '.join(map(str, DEFAULT_TIERS))})")
+    parser.add_argument('--template', default=SEED_PATH, help="seed to clone tools from")
+    parser.add_argument('--no-legacy', action='store_true', help="skip the per-batch legacy path")
+    parser.add_argument('--json', action='store_true', help="print raw results as JSON")
+    args = parser.parse_args()
+
+    results = [bench(n, args.template, not args.no_legacy) for n in args.tiers]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_table(results)
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Build the per-tool read model: one joined JSON document per tool slug (see seedkit.readmodel)"""
+import argparse
+import os
+import sys
+import time
+
+from seedkit import journal
+from seedkit.engine import load_seed
+from seedkit.paths import DATA_DIR, SEED_PATH, resolve_seed_path
+from seedkit.readmodel import seed_source, write_read_model
+
+READ_MODEL_DIR = os.path.join(DATA_DIR, 'tools')
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--seed', default=SEED_PATH, metavar='PATH',
+                        help="seed file (default: data/seed.json; bare names resolve in data/)")
+    parser.add_argument('--out', default=READ_MODEL_DIR,
+                        help="output directory (default: data/tools)")
+    parser.add_argument('-v', '--verbose', action='store_true', help="list the documents written and removed")
+    args = parser.parse_args()
+
+    path = resolve_seed_path(args.seed)
+    # The app reads the seed file itself, so the documents must not include journaled changes
+    pending = len(journal.read_journal(path))
+    if pending:
+        print(f"note: {pending} pending journal entries are not in the read model "
+              f"(scripts/seed_journal.py compact folds them into the seed)", file=sys.stderr)
+    # Stat and hash before loading: an edit in between leaves a stamp that no longer matches
+    source = seed_source(path)
+    data = load_seed(path)
+    started = time.perf_counter()
+    written, unchanged, removed = write_read_model(data, args.out, source)
+    elapsed = time.perf_counter() - started
+    print(f"{len(written)} written, {len(unchanged)} unchanged, {len(removed)} removed "
+          f"-> {args.out} ({elapsed * 1000:.0f} ms)")
+    if args.verbose:
+        for slug in written:
+            print(f"  + {slug}")
+        for slug in removed:
+            print(f"  - {slug}")
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Rewrite seed files in canonical form, or check that they already are (see seedkit.canonical)
+
+Seeds are written canonically by every seedkit writer; this is for files
+produced elsewhere and for a one-off normalization. A seed is canonical only
+if its bytes are exactly what dump_seed() would write (no trailing newline,
+no CRLF, no BOM). --check exits with status 1 if any seed would change,
+without writing.
+
+Rewriting a seed changes the base digest its ops journal is checked against,
+so a seed with a pending journal is not rewritten (exit status 1); fold the
+journal in with `seed_journal.py compact` first, as for merge_candidates.py.
+"""
+import argparse
+import os
+import sys
+
+from seedkit.canonical import dumps
+from seedkit.engine import dump_seed, load_seed
+from seedkit.journal import journal_path
+from seedkit.paths import resolve_seed_paths
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--seed', action='append', metavar='PATH',
+                        help="seed file (repeatable); defaults as for the update_tools_* batches")
+    parser.add_argument('--variants', action='store_true', help="also process the seed variants in data/")
+    parser.add_argument('--check', action='store_true', help="only report seeds that are not canonical")
+    args = parser.parse_args()
+
+    pending = refused = 0
+    for path in resolve_seed_paths(args.seed, variants=args.variants):
+        data = load_seed(path)
+        with open(path, 'rb') as f:
+            current = f.read()
+        if current == dumps(data).encode('utf-8'):
+            print(f"  {path}: canonical")
+            continue
+        pending += 1
+        if args.check:
+            print(f"  {path}: not canonical")
+        elif os.path.exists(journal_path(path)):
+            refused += 1
+            print(f"  {path}: not canonical, but {journal_path(path)} has pending entries; "
+                  f"compact it first (seed_journal.py compact)")
+        else:
+            digest = dump_seed(data, path)
+            print(f"  {path}: rewritten (sha256 {digest})")
+    sys.exit(1 if (args.check and pending) or refused else 0)
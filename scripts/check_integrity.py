@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Check every cross-section reference in seed files (see seedkit.integrity)
+
+Reads each seed in one streaming pass and lists dangling references,
+orphaned rows and duplicate keys. Exits with status 1 if any seed has a
+problem, so it can gate a commit or CI step.
+"""
+import argparse
+import sys
+from collections import Counter
+
+from seedkit.integrity import check_sections
+from seedkit.paths import resolve_seed_paths
+from seedkit.stream import iter_sections
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--seed', action='append', metavar='PATH',
+                        help="seed file (repeatable); defaults as for the update_tools_* batches")
+    parser.add_argument('--variants', action='store_true', help="also check the seed variants in data/")
+    parser.add_argument('-q', '--quiet', action='store_true', help="only print the per-seed summary")
+    args = parser.parse_args()
+
+    failed = False
+    for path in resolve_seed_paths(args.seed, variants=args.variants):
+        report = check_sections(iter_sections(path))
+        failed = failed or not report.ok
+        print("=" * 60)
+        print(f"  {path}")
+        print(f"  {report.checked} references: {len(report.dangling)} dangling, "
+              f"{len(report.orphans)} orphaned rows, {len(report.duplicates)} duplicate keys")
+        if args.quiet:
+            continue
+        for label, problems in (('orphan', report.orphans), ('dangling', report.dangling)):
+            counts = Counter((section, field) for section, _, field, _ in problems)
+            for (section, field), n in counts.items():
+                print(f"  {label}: {section}.{field} ({n})")
+            for section, pos, field, value in problems:
+                print(f"    {section}[{pos}].{field} = {value!r}")
+        for section, key, value in report.duplicates:
+            print(f"  duplicate: {section}.{key} = {value!r}")
+    sys.exit(1 if failed else 0)
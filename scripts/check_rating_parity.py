@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Compare seedkit.ratings with lib/pipeline/rating-aggregator.ts over a seed
+
+Runs scripts/rating-parity.mjs, which transpiles the TS aggregator and
+applies it to every tool the way /api/cron/aggregate-ratings does, and checks
+that aggregate_ratings() returns exactly the same fields: the same tools,
+bit-identical numbers and the same rating_sources order. Needs node and the
+typescript devDependency (npm ci). Exits with status 1 on any difference;
+.github/workflows/rating-parity.yml runs it whenever the aggregator, its
+constants, the port or the seed change.
+
+This compares the two implementations, not the seed: rating_sources already
+in seed.json may list the same sources in another order where
+generate-ratings.mjs wrote them (it keeps each tool's own source order, while
+aggregateRating() always goes app_store, play_store, g2, trustpilot,
+product_hunt, aipick).
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+from seedkit.engine import load_seed
+from seedkit.paths import REPO_ROOT, SEED_PATH, resolve_seed_path
+from seedkit.ratings import aggregate_ratings
+
+PARITY_SCRIPT = os.path.join(REPO_ROOT, 'scripts', 'rating-parity.mjs')
+
+
+def _same(a, b):
+    """Equal values of the same JSON type; floats compare exactly."""
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_same(x, y) for x, y in zip(a, b))
+    return type(a) is type(b) and a == b
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--seed', default=SEED_PATH, metavar='PATH',
+                        help="seed file (default: data/seed.json; bare names resolve in data/)")
+    parser.add_argument('--node', default='node', help="node executable (default: node)")
+    args = parser.parse_args()
+
+    path = resolve_seed_path(args.seed)
+    data = load_seed(path)
+    try:
+        run = subprocess.run([args.node, PARITY_SCRIPT, path], cwd=REPO_ROOT,
+                             capture_output=True, text=True, encoding='utf-8')
+    except FileNotFoundError:
+        sys.exit(f"{args.node}: not found")
+    if run.returncode:
+        sys.exit(f"rating-parity.mjs failed (exit {run.returncode}):\n{run.stderr.strip()}")
+    expected = json.loads(run.stdout)
+    actual = aggregate_ratings(data)
+
+    problems = []
+    for slug in sorted(expected.keys() | actual.keys()):
+        if slug not in actual:
+            problems.append(f"{slug}: only rating-aggregator.ts rates it")
+        elif slug not in expected:
+            problems.append(f"{slug}: only seedkit.ratings rates it")
+        else:
+            for field, value in expected[slug].items():
+                if not _same(actual[slug].get(field), value):
+                    problems.append(f"{slug}.{field}: ts {value!r}, python {actual[slug].get(field)!r}")
+
+    print(f"{path}: {len(expected)} tools rated by rating-aggregator.ts, "
+          f"{len(actual)} by seedkit.ratings, {len(problems)} differences")
+    for problem in problems:
+        print(f"  {problem}")
+    sys.exit(1 if problems else 0)
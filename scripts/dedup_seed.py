@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Flag near-duplicate tool texts (description, long_description, pros, cons, usage_tips) with MinHash LSH
+
+Records with too little text for that (the collected candidates) are compared
+on name + description with a lower threshold; the summary counts, per file,
+how many records were compared each way and how many had nothing to compare
+(listed with --show-sparse).
+
+--scale N checks that the name + description comparison stays far from all
+pairs: it runs it over the seed plus N/2 and then N synthetic candidate
+records, reports how the time and the pairs it had to check grow, and fails
+if at N it checks more than MAX_CHECKED of the pairs the exhaustive
+comparison would.
+"""
+import argparse
+import os
+import sys
+import time
+
+from seedkit.dedup import (BANDS, MIN_SHINGLES, ROWS, SHORT_THRESHOLD, brute_force, find_duplicates,
+                           load_records, short_pairs)
+from seedkit.engine import load_seed, load_tools
+from seedkit.paths import DATA_DIR, resolve_seed_paths
+from seedkit.synth import synthesize_candidates
+
+CANDIDATES_PATH = os.path.join(DATA_DIR, 'ai-tools-500.json')
+# Largest share of all short-record pairs --scale lets the prefix filter check
+MAX_CHECKED = 0.01
+
+
+def scaling_check(path, n_records, min_shingles, short_threshold):
+    """Run the short-record pass at n_records // 2 and n_records synthetic candidates; True if within MAX_CHECKED."""
+    template = load_seed(path)
+    runs = []
+    for size in (n_records // 2, n_records):
+        sources = [(os.path.basename(path), template['tools']), ('synthetic', synthesize_candidates(template, size))]
+        records, short, _ = load_records(sources, min_shingles)
+        started = time.perf_counter()
+        pairs, checked = short_pairs(records, short, short_threshold)
+        elapsed = time.perf_counter() - started
+        exhaustive = len(short) * len(records) + len(short) * (len(short) - 1) // 2
+        runs.append((checked, exhaustive, elapsed))
+        print(f"{size:6d} synthetic + {len(template['tools'])} seed records: {checked} of {exhaustive} pairs "
+              f"checked ({checked / exhaustive:.3%}), {len(pairs)} near-duplicates ({elapsed * 1000:.0f} ms)")
+    (checked_half, _, elapsed_half), (checked, exhaustive, elapsed) = runs
+    print(f"2x the records: {checked / max(checked_half, 1):.2f}x the checks, "
+          f"{elapsed / max(elapsed_half, 1e-9):.2f}x the time (all pairs: ~4x)")
+    return checked <= MAX_CHECKED * exhaustive
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--seed', action='append', metavar='PATH',
+                        help="seed file (repeatable); defaults as for the update_tools_* batches")
+    parser.add_argument('--candidates', action='store_true',
+                        help="also check data/ai-tools-500.json")
+    parser.add_argument('--threshold', type=float, default=0.5,
+                        help="minimum shingle Jaccard similarity to report (default: 0.5)")
+    parser.add_argument('--bands', type=int, default=BANDS, help=f"LSH bands (default: {BANDS})")
+    parser.add_argument('--rows', type=int, default=ROWS, help=f"rows per band (default: {ROWS})")
+    parser.add_argument('--min-shingles', type=int, default=MIN_SHINGLES,
+                        help=f"compare records with fewer text shingles on name + description "
+                             f"(default: {MIN_SHINGLES})")
+    parser.add_argument('--short-threshold', type=float, default=SHORT_THRESHOLD,
+                        help=f"minimum name + description similarity for those (default: {SHORT_THRESHOLD})")
+    parser.add_argument('--show-sparse', action='store_true',
+                        help="list the records that had nothing to compare")
+    parser.add_argument('--check', action='store_true',
+                        help="also run the quadratic all-pairs comparison and report LSH misses")
+    parser.add_argument('--scale', type=int, metavar='N',
+                        help="only run the scaling check with up to N synthetic candidates (e.g. 5000) "
+                             "built from the first seed")
+    args = parser.parse_args()
+
+    paths = resolve_seed_paths(args.seed)
+    if args.scale:
+        sys.exit(0 if scaling_check(paths[0], args.scale, args.min_shingles, args.short_threshold) else 1)
+
+    if args.candidates:
+        paths.append(CANDIDATES_PATH)
+    sources = [(os.path.basename(path), load_tools(path)) for path in paths]
+    records = sum(len(tools) for _, tools in sources)
+
+    started = time.perf_counter()
+    pairs, candidates, short, sparse = find_duplicates(sources, args.threshold, args.bands, args.rows,
+                                                       args.min_shingles, args.short_threshold)
+    elapsed = time.perf_counter() - started
+
+    for sim, a, b in pairs:
+        print(f"  {sim:.2f}  {a!r:40s} {b!r}")
+    print(f"\n{records} records, {candidates} LSH candidate pairs, {len(pairs)} near-duplicates "
+          f"({elapsed * 1000:.0f} ms)")
+    for name, tools in sources:
+        n_short = sum(1 for r in short if r.source == name)
+        n_sparse = sum(1 for r in sparse if r.source == name)
+        n_placeholder = sum(1 for r in short + sparse if r.source == name and r.placeholder)
+        print(f"  {name:28s} {len(tools) - n_short - n_sparse:4d} compared in full (>= {args.threshold}), "
+              f"{n_short:4d} on name + description (>= {args.short_threshold}), "
+              f"{n_sparse:4d} not compared; {n_placeholder} placeholder descriptions")
+    if args.show_sparse:
+        for record in sparse:
+            print(f"  sparse {record!r}")
+
+    if args.check:
+        started = time.perf_counter()
+        exact = brute_force(sources, args.threshold, args.min_shingles)
+        elapsed = time.perf_counter() - started
+        found = {(repr(a), repr(b)) for _, a, b in pairs}
+        missed = [(sim, a, b) for sim, a, b in exact if (repr(a), repr(b)) not in found]
+        print(f"all-pairs: {len(exact)} pairs ({elapsed * 1000:.0f} ms), {len(missed)} missed by LSH")
+        for sim, a, b in missed:
+            print(f"  {sim:.2f}  {a!r:40s} {b!r}")
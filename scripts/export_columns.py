@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Export tools and tool_external_scores as typed columns, and print per-group aggregates"""
+import argparse
+import os
+import sys
+import time
+
+from seedkit.columns import TOOL_NUMERIC, export
+from seedkit.engine import load_seed
+from seedkit.paths import DATA_DIR, SEED_PATH, resolve_seed_path
+
+COLUMNS_DIR = os.path.join(DATA_DIR, 'columns')
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--seed', default=SEED_PATH, metavar='PATH',
+                        help="seed file (default: data/seed.json; bare names resolve in data/)")
+    parser.add_argument('--out', default=COLUMNS_DIR,
+                        help="output directory, one subdirectory per table (default: data/columns)")
+    parser.add_argument('--by', default='category_id', choices=('category_id', 'pricing_type'),
+                        help="tools column to group by")
+    parser.add_argument('--stat', action='append', choices=TOOL_NUMERIC, metavar='COLUMN',
+                        help=f"numeric column to aggregate (repeatable; default: rating_avg, review_count). "
+                             f"One of {', '.join(TOOL_NUMERIC)}")
+    args = parser.parse_args()
+
+    data = load_seed(resolve_seed_path(args.seed))
+    started = time.perf_counter()
+    tools, scores = export(data, args.out)
+    elapsed = time.perf_counter() - started
+    print(f"{len(tools)} tools, {len(scores)} external scores -> {args.out} ({elapsed * 1000:.0f} ms)")
+
+    names = {c['id']: c['slug'] for c in data.get('categories', [])}
+    for stat in args.stat or ['rating_avg', 'review_count']:
+        started = time.perf_counter()
+        groups = tools.group_stats(stat, args.by)
+        elapsed = time.perf_counter() - started
+        print(f"\n{stat} by {args.by} ({elapsed * 1000:.2f} ms)")
+        print(f"  {'group':24s} {'n':>5} {'mean':>14} {'min':>14} {'max':>14}")
+        for label, g in sorted(groups.items(), key=lambda item: -item[1]['count']):
+            print(f"  {names.get(label, label):24s} {g['count']:5d} "
+                  f"{g['mean']:14.2f} {g['min']:14.2f} {g['max']:14.2f}")
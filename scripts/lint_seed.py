@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Lint tool records in seed files: description caps, list counts, duplicate tags, URLs, 【요금제】 section"""
+import argparse
+import collections
+import os
+import sys
+import time
+
+from seedkit.engine import load_tools
+from seedkit.lint import ERROR, lint_records
+from seedkit.paths import DATA_DIR, resolve_seed_paths
+
+CANDIDATES_PATH = os.path.join(DATA_DIR, 'ai-tools-500.json')
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--seed', action='append', metavar='PATH',
+                        help="seed file (repeatable); defaults as for the update_tools_* batches")
+    parser.add_argument('--candidates', action='store_true',
+                        help="also lint data/ai-tools-500.json")
+    parser.add_argument('--errors-only', action='store_true', help="hide warnings")
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help="worker processes (default: one per CPU, 1 = inline)")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    paths = resolve_seed_paths(args.seed)
+    if args.candidates:
+        paths.append(CANDIDATES_PATH)
+    sources = [(os.path.basename(path), load_tools(path)) for path in paths]
+    findings = lint_records(sources, jobs=args.jobs)
+    elapsed = time.perf_counter() - started
+
+    shown = [f for f in findings if f.severity == ERROR] if args.errors_only else findings
+    for f in shown:
+        mark = '✗' if f.severity == ERROR else '⚠'
+        print(f"  {mark} {f.source}#{f.position} {f.slug:24s} {f.rule:24s} {f.message}")
+
+    by_rule = collections.Counter((f.severity, f.rule) for f in findings)
+    records = sum(len(tools) for _, tools in sources)
+    errors = sum(n for (severity, _), n in by_rule.items() if severity == ERROR)
+    print(f"\n{records} records in {len(sources)} files, {errors} errors, "
+          f"{len(findings) - errors} warnings ({elapsed * 1000:.0f} ms)")
+    for (severity, rule), n in sorted(by_rule.items()):
+        print(f"  {severity:7s} {rule:26s} {n}")
+    sys.exit(1 if errors else 0)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Merge collected candidates (data/ai-tools-500.json) into a seed file
+
+Python replacement for merge-with-existing.mjs (see seedkit.merge):
+candidates are joined to seed tools on slug, then on URL domain; matched
+tools keep their enriched fields and only have empty ones filled, the rest
+are appended as new tools with a UUID id and a primary tool_categories row.
+The merged seed is written in one streaming pass, and fields where the two
+sides disagree are reported. Exits with status 1, writing nothing, if the
+merge would leave a broken reference.
+"""
+import argparse
+import json
+import os
+import sys
+from collections import Counter
+
+from seedkit.merge import MergeError, merge_candidates
+from seedkit.paths import DATA_DIR, SEED_PATH, resolve_seed_path
+
+CANDIDATES_PATH = os.path.join(DATA_DIR, 'ai-tools-500.json')
+OUTPUT_PATH = os.path.join(DATA_DIR, 'seed-merged.json')
+
+
+def short(value, width=50):
+    text = json.dumps(value, ensure_ascii=False)
+    return text if len(text) <= width else text[:width - 1] + '…'
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--seed', default=SEED_PATH, metavar='PATH',
+                        help="seed file to merge into (default: data/seed.json)")
+    parser.add_argument('--candidates', default=CANDIDATES_PATH, metavar='PATH',
+                        help="candidate list (default: data/ai-tools-500.json)")
+    out = parser.add_mutually_exclusive_group()
+    out.add_argument('--output', default=OUTPUT_PATH, metavar='PATH',
+                     help="merged seed to write (default: data/seed-merged.json)")
+    out.add_argument('--in-place', action='store_true', help="write the merge back into --seed")
+    parser.add_argument('--prefer', action='append', default=[], metavar='FIELD',
+                        help="let a non-empty candidate value win over the seed's for FIELD (repeatable)")
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help="list every conflict, filled field and rejected candidate")
+    args = parser.parse_args()
+
+    seed_path = resolve_seed_path(args.seed)
+    out_path = seed_path if args.in_place else resolve_seed_path(args.output)
+    with open(resolve_seed_path(args.candidates), 'r', encoding='utf-8') as f:
+        candidates = json.load(f)
+    if isinstance(candidates, dict):
+        candidates = candidates.get('tools', [])
+
+    try:
+        report = merge_candidates(seed_path, candidates, out_path, prefer=args.prefer)
+    except MergeError as e:
+        sys.exit(f"{e}\nNothing was written.")
+    by_how = Counter(how for _, how in report.matched.values())
+
+    print("=" * 60)
+    print(f"  {seed_path} + {len(candidates)} candidates -> {out_path}")
+    print(f"  matched: {len(report.matched)} ({by_how['slug']} by slug, {by_how['domain']} by domain)")
+    print(f"  added: {len(report.added)}")
+    print(f"  filled: {len(report.filled)} empty fields in {len({s for s, _ in report.filled})} tools")
+    print(f"  conflicts: {len(report.conflicts)}")
+    for field, n in Counter(field for _, field, _, _, _ in report.conflicts).most_common():
+        print(f"    {field:28s} {n}")
+    if report.recategorized:
+        print(f"  category ids remapped: {len(report.recategorized)}")
+        for (old, new), n in Counter((old, new) for _, old, new in report.recategorized).most_common():
+            print(f"    {old} -> {new or '(none)'}  {n}")
+    if report.rejected:
+        print(f"  rejected: {len(report.rejected)}")
+        for reason, n in Counter(reason for _, reason, _ in report.rejected).most_common():
+            print(f"    {reason:28s} {n}")
+
+    if args.verbose:
+        for seed_slug, (slug, how) in report.matched.items():
+            if how == 'domain':
+                print(f"  ~ {slug} -> {seed_slug} (domain)")
+        for slug, field, ours, theirs, kept in report.conflicts:
+            print(f"  ! {slug}.{field}: seed {short(ours)} / candidate {short(theirs)} -> {kept}")
+        for slug, field in report.filled:
+            print(f"  + {slug}.{field}")
+        for slug, reason, detail in report.rejected:
+            print(f"  x {slug}: {reason} ({detail})")
+        for slug in report.added:
+            print(f"  new {slug}")
+    if not report.integrity.ok:
+        print(f"  integrity: {len(report.integrity.dangling) + len(report.integrity.orphans)} broken "
+              f"references, {len(report.integrity.duplicates)} duplicate keys (all present before the merge)")
+    print(f"  sha256 {report.digest}")
@@ -6,6 +6,7 @@
 
 const fs = require('fs');
 const path = require('path');
+const { execFileSync } = require('child_process');
 
 const seedPath = path.join(__dirname, '../data/seed.json');
 const seed = JSON.parse(fs.readFileSync(seedPath, 'utf8'));
@@ -46,12 +47,9 @@ seed.tools.forEach(tool => {
 // seed.json에 tool_categories 추가
 seed.tool_categories = toolCategories;
 
-// 백업 생성
-const backupPath = path.join(__dirname, '../data/seed.backup.json');
-if (!fs.existsSync(backupPath)) {
-  fs.writeFileSync(backupPath, JSON.stringify(seed, null, 2));
-  console.log('✅ Backup created:', backupPath);
-}
+// 덮어쓰기 전 원본을 스냅샷으로 보관 (data/snapshots/, 복원: seed_snapshot.py restore)
+// - 스냅샷을 만들지 못하면 seed.json을 수정하지 않고 중단
+execFileSync('python3', [path.join(__dirname, 'seed_snapshot.py'), 'take', '--seed', seedPath], { stdio: 'inherit' });
 
 // 업데이트된 seed.json 저장
 fs.writeFileSync(seedPath, JSON.stringify(seed, null, 2));
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Query tools by tag, model identifier, pricing type, Korean support and description text
+
+Uses the inverted index next to the seed (<seed>.index.json, see
+seedkit.search), building it on first use and resyncing it only when the
+seed or its journal changed since. Conditions are ANDed, e.g.
+
+    python3 scripts/query_seed.py --model gpt-4o --tag 번역
+    python3 scripts/query_seed.py --text "이미지 생성" --pricing Free --korean
+"""
+import argparse
+import shlex
+import sys
+import time
+
+from seedkit import journal
+from seedkit.engine import load_current
+from seedkit.paths import SEED_PATH, resolve_seed_path
+from seedkit.search import SearchIndex, index_path
+from seedkit.storage import file_digest
+
+VOCAB_FIELDS = {'tag': 'tag:', 'model': 'model:', 'pricing': 'pricing:'}
+
+
+def open_index(seed_path, rebuild=False):
+    """The seed's index, brought up to date. Returns (index, tools reindexed)."""
+    path = index_path(seed_path)
+    index = None if rebuild else SearchIndex.load(path)
+    source = [file_digest(seed_path), len(journal.read_journal(seed_path))]
+    if index is not None and index.source == source:
+        return index, 0
+    data, _, _ = load_current(seed_path)
+    index = index or SearchIndex()
+    count = index.sync(data['tools'])
+    index.source = source
+    index.save(path)
+    return index, count
+
+
+def build_query_parser():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tag', action='append', default=[], help="tag (repeatable)")
+    parser.add_argument('--model', action='append', default=[], help="model identifier (repeatable)")
+    parser.add_argument('--pricing', help="pricing_type, e.g. Free, Freemium, Paid")
+    parser.add_argument('--korean', action=argparse.BooleanOptionalAction, default=None,
+                        help="supports_korean")
+    parser.add_argument('--text', help="words/phrase that must occur in description or long_description")
+    return parser
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    parser = build_query_parser()
+    parser.add_argument('--seed', default=SEED_PATH, metavar='PATH',
+                        help="seed file (default: data/seed.json; bare names resolve in data/)")
+    parser.add_argument('--rebuild', action='store_true', help="rebuild the index from scratch")
+    parser.add_argument('--vocab', choices=sorted(VOCAB_FIELDS),
+                        help="list the indexed values of a field with tool counts")
+    parser.add_argument('--batch', metavar='FILE',
+                        help="run one query per line of FILE ('-' for stdin), using the options above")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    index, reindexed = open_index(resolve_seed_path(args.seed), rebuild=args.rebuild)
+    elapsed = time.perf_counter() - started
+    print(f"index: {len(index)} tools, {len(index.postings)} terms, "
+          f"{reindexed} reindexed ({elapsed * 1000:.0f} ms)", file=sys.stderr)
+
+    if args.vocab:
+        vocab = index.vocabulary(VOCAB_FIELDS[args.vocab])
+        for value, n in sorted(vocab.items(), key=lambda item: (-item[1], item[0])):
+            print(f"{n:5d}  {value}")
+        sys.exit(0)
+
+    if args.batch == '-':
+        queries = [line.strip() for line in sys.stdin if line.strip() and not line.startswith('#')]
+    elif args.batch:
+        with open(args.batch, 'r', encoding='utf-8') as f:
+            queries = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+    else:
+        queries = [None]
+    for line in queries:
+        q = build_query_parser().parse_args(shlex.split(line)) if line is not None else args
+        slugs = index.query(tags=q.tag, models=q.model, pricing=q.pricing, korean=q.korean, text=q.text)
+        if line is not None:
+            print(f"# {line}  ({len(slugs)})")
+        for slug in slugs:
+            print(slug)
@@ -0,0 +1,75 @@
+/**
+ * lib/pipeline/rating-aggregator.ts를 seed.json 전체에 실행해 도구별 집계 결과를 출력
+ *
+ * /api/cron/aggregate-ratings와 같은 순서로 buildRatingDataFromScores() →
+ * aggregateRating()(기본 가중치)을 호출하고, 크론이 tools에 쓰는 필드를
+ * { slug: fields } JSON으로 stdout에 출력합니다.
+ * scripts/check_rating_parity.py가 seedkit.ratings 결과와 비교할 때 사용합니다.
+ *
+ * TS 소스는 devDependency인 typescript로 트랜스파일하므로 npm ci 이후 실행.
+ *
+ * Usage: node scripts/rating-parity.mjs [seed.json 경로]
+ */
+
+import { mkdtempSync, readFileSync, rmSync, writeFileSync } from 'fs';
+import { tmpdir } from 'os';
+import { join, dirname } from 'path';
+import { fileURLToPath, pathToFileURL } from 'url';
+import ts from 'typescript';
+
+const __dirname = dirname(fileURLToPath(import.meta.url));
+const ROOT = join(__dirname, '..');
+const SEED_PATH = process.argv[2] || join(ROOT, 'data', 'seed.json');
+
+// ==========================================
+// TS → ESM 트랜스파일 (타입 전용 import는 제거됨)
+// ==========================================
+function transpile(relPath, rewrites = {}) {
+  const source = readFileSync(join(ROOT, relPath), 'utf-8');
+  let code = ts.transpileModule(source, {
+    compilerOptions: { module: ts.ModuleKind.ESNext, target: ts.ScriptTarget.ES2022 },
+  }).outputText;
+  for (const [from, to] of Object.entries(rewrites)) {
+    code = code.replaceAll(`'${from}'`, `'${to}'`).replaceAll(`"${from}"`, `"${to}"`);
+  }
+  return code;
+}
+
+const outDir = mkdtempSync(join(tmpdir(), 'rating-parity-'));
+let aggregator;
+try {
+  writeFileSync(join(outDir, 'constants.mjs'), transpile('lib/constants.ts'));
+  writeFileSync(
+    join(outDir, 'rating-aggregator.mjs'),
+    transpile('lib/pipeline/rating-aggregator.ts', { '@/lib/constants': './constants.mjs' })
+  );
+  aggregator = await import(pathToFileURL(join(outDir, 'rating-aggregator.mjs')).href);
+} finally {
+  rmSync(outDir, { recursive: true, force: true });
+}
+const { aggregateRating, buildRatingDataFromScores } = aggregator;
+
+// ==========================================
+// 크론과 같은 방식으로 도구별 집계
+// ==========================================
+const seed = JSON.parse(readFileSync(SEED_PATH, 'utf-8'));
+const scoresByTool = new Map();
+for (const row of seed.tool_external_scores || []) {
+  if (!scoresByTool.has(row.tool_id)) scoresByTool.set(row.tool_id, []);
+  scoresByTool.get(row.tool_id).push(row);
+}
+
+const results = {};
+for (const tool of seed.tools) {
+  const aggregated = aggregateRating(buildRatingDataFromScores(scoresByTool.get(tool.id) || []), null);
+  if (aggregated.rating_sources.length === 0) continue;
+  results[tool.slug] = {
+    rating_avg: aggregated.rating_avg,
+    review_count: aggregated.total_review_count,
+    rating_sources: aggregated.rating_sources,
+    confidence_level: aggregated.confidence,
+    confidence_source_count: aggregated.rating_sources.length,
+  };
+}
+
+process.stdout.write(JSON.stringify(results));
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Recompute rating_avg, review_count, rating_sources and confidence from tool_external_scores
+
+Offline equivalent of /api/cron/aggregate-ratings (see seedkit.ratings); the
+results are written back through the patch engine like any UPDATES batch.
+Tools with no usable rating source are left as they are, as the cron does.
+"""
+import argparse
+import sys
+
+from seedkit.cli import seed_parser
+from seedkit.engine import load_current
+from seedkit.paths import resolve_seed_paths
+from seedkit.ratings import aggregate_ratings
+from seedkit.stream import auto_patch
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    parser = seed_parser(__doc__)
+    parser.formatter_class = argparse.RawDescriptionHelpFormatter
+    parser.add_argument('--dry-run', action='store_true', help="print the changes without writing")
+    args = parser.parse_args()
+
+    for path in resolve_seed_paths(args.seed, variants=args.variants):
+        data, _, _ = load_current(path)
+        updates = aggregate_ratings(data)
+        before = {t['slug']: t for t in data['tools']}
+        changed = {}
+        for slug, fields in updates.items():
+            keys = [k for k, v in fields.items() if before[slug].get(k) != v]
+            if keys:
+                changed[slug] = (fields, keys)
+
+        print("=" * 60)
+        print(f"  {path}")
+        print(f"  {len(updates)} tools with rating sources, {len(changed)} differ from the seed")
+        for slug, (fields, keys) in changed.items():
+            old = before[slug]
+            print(f"    {slug:28s} {old.get('rating_avg')!s:>4} -> {fields['rating_avg']!s:<4} "
+                  f"{fields['confidence_level']:6s} ({', '.join(keys)})")
+        if args.dry_run or not changed:
+            print("  Nothing written." if changed else "  Seed already up to date.")
+            continue
+        updates = {slug: fields for slug, (fields, _) in changed.items()}
+        report = auto_patch(path, updates, stream=args.stream, journal_only=args.journal)
+        if report.written:
+            print("  Written.")
+        elif report.journaled:
+            print(f"  Journaled {len(report.ops)} ops; seed file left untouched.")
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Recompute hybrid_score, internal/external scores and trends for every tool
+
+Incremental by default: <seed>.scores-state.json records an input hash per
+tool, and only tools whose inputs changed since the last run are rescored
+(see seedkit.scoring). It also keeps the rank snapshots the trends are
+measured against, so it is committed next to the seed: commit it together
+with the seed changes of each run. --full ignores the input hashes. Results
+go through the patch engine like any UPDATES batch.
+"""
+import argparse
+import json
+import sys
+import time
+
+from seedkit.cli import seed_parser
+from seedkit.engine import load_current
+from seedkit.paths import resolve_seed_paths
+from seedkit.scoring import score_catalog, state_path
+from seedkit.storage import atomic_write
+from seedkit.stream import auto_patch
+
+
+def load_state(path):
+    try:
+        with open(state_path(path), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def save_state(path, state):
+    with atomic_write(state_path(path)) as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    parser = seed_parser(__doc__)
+    parser.formatter_class = argparse.RawDescriptionHelpFormatter
+    parser.add_argument('--full', action='store_true', help="rescore every tool, ignoring the saved state")
+    parser.add_argument('--dry-run', action='store_true', help="print the changes without writing")
+    args = parser.parse_args()
+
+    for path in resolve_seed_paths(args.seed, variants=args.variants):
+        data, _, _ = load_current(path)
+        started = time.perf_counter()
+        updates, state, recomputed = score_catalog(data, None if args.full else load_state(path))
+        elapsed = time.perf_counter() - started
+
+        print("=" * 60)
+        print(f"  {path}")
+        print(f"  Rescored {len(recomputed)}/{len(data['tools'])} tools ({elapsed * 1000:.0f} ms), "
+              f"{len(updates)} with changed fields")
+        for slug, fields in updates.items():
+            print(f"    {slug:28s} " + ', '.join(f"{k}={v}" for k, v in fields.items()))
+        if args.dry_run:
+            print("  Nothing written.")
+            continue
+        if updates:
+            report = auto_patch(path, updates, stream=args.stream, journal_only=args.journal)
+            print("  Written." if report.written else f"  Journaled {len(report.ops)} ops.")
+        save_state(path, state)
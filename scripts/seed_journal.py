@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Inspect, replay and compact the seed.json ops journal written by --journal batch runs"""
+import argparse
+import json
+import sys
+
+from seedkit.engine import compact_seed, dump_seed, load_seed
+from seedkit.journal import check_base, journal_path, read_journal, replay
+from seedkit.paths import resolve_seed_paths
+from seedkit.storage import file_digest
+
+
+def cmd_log(seed_path, args):
+    entries = read_journal(seed_path)
+    print(f"{journal_path(seed_path)}: {len(entries)} entries")
+    for entry in entries:
+        slugs = [op['value'] for op in entry['ops'] if op['op'] == 'test']
+        print(f"  #{entry['seq']:<4d} {entry['at']}  {len(entry['ops']):4d} ops  {', '.join(slugs)}")
+
+
+def cmd_compact(seed_path, args):
+    entries = compact_seed(seed_path)
+    if entries:
+        print(f"{seed_path}: folded {len(entries)} entries "
+              f"({sum(len(e['ops']) for e in entries)} ops); journal removed")
+    else:
+        print(f"{seed_path}: no journal to compact")
+
+
+def cmd_replay(seed_path, args):
+    entries = read_journal(seed_path)
+    check_base(entries, file_digest(seed_path))
+    data = replay(load_seed(seed_path), entries, upto=args.upto)
+    if args.out:
+        dump_seed(data, args.out)
+        upto = args.upto if args.upto is not None else (entries[-1]['seq'] if entries else 0)
+        print(f"{seed_path} @ #{upto} -> {args.out}")
+    else:
+        json.dump(data, sys.stdout, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--seed', action='append', metavar='PATH',
+                        help="seed file (repeatable); defaults as for the update_tools_* batches")
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('log', help="list journal entries")
+    sub.add_parser('compact', help="fold the journal into the seed and remove it")
+    p_replay = sub.add_parser('replay', help="rebuild the seed as of a journal entry")
+    p_replay.add_argument('--upto', type=int, default=None, metavar='SEQ',
+                          help="last entry to apply (default: all)")
+    p_replay.add_argument('--out', metavar='PATH', help="write here instead of stdout")
+    args = parser.parse_args()
+
+    command = {'log': cmd_log, 'compact': cmd_compact, 'replay': cmd_replay}[args.command]
+    for seed_path in resolve_seed_paths(args.seed):
+        command(seed_path, args)
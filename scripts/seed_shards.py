@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Split a seed into per-category shards, join them back, and check shards against their manifest
+
+    python3 scripts/seed_shards.py split              # data/seed.json -> data/shards/
+    python3 scripts/update_tools_batch1.py --shards data/shards
+    python3 scripts/seed_shards.py join --out seed.json
+
+See seedkit.shards for the layout.
+"""
+import argparse
+import hashlib
+import os
+import sys
+
+from seedkit.engine import dump_seed, load_current
+from seedkit.paths import DATA_DIR, SEED_PATH, resolve_seed_path
+from seedkit.shards import ShardError, join_shards, load_manifest, write_shards
+
+SHARDS_DIR = os.path.join(DATA_DIR, 'shards')
+
+
+def cmd_split(args):
+    data, _, _ = load_current(resolve_seed_path(args.seed))
+    written, unchanged, removed = write_shards(data, args.dir)
+    print(f"{args.dir}: {len(written)} shards written, {len(unchanged)} unchanged, {len(removed)} removed")
+    for name in written:
+        print(f"  + {name}")
+    for name in removed:
+        print(f"  - {name}")
+
+
+def cmd_join(args):
+    data = join_shards(args.dir)
+    out = resolve_seed_path(args.out)
+    digest = dump_seed(data, out)
+    print(f"{args.dir} -> {out} ({len(data.get('tools', []))} tools, sha256 {digest})")
+
+
+def cmd_status(args):
+    manifest = load_manifest(args.dir)
+    stale = 0
+    print(f"  {'shard':28s} {'tools':>5} {'bytes':>9}  state")
+    for name, entry in manifest['shards'].items():
+        path = os.path.join(args.dir, entry['file'])
+        try:
+            with open(path, 'rb') as f:
+                state = 'ok' if hashlib.sha256(f.read()).hexdigest() == entry['sha256'] else 'MODIFIED'
+        except FileNotFoundError:
+            state = 'MISSING'
+        stale += state != 'ok'
+        print(f"  {name:28s} {len(entry['tools']):5d} {entry['bytes']:9d}  {state}")
+    return 1 if stale else 0
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dir', default=SHARDS_DIR, help="shard directory (default: data/shards)")
+    sub = parser.add_subparsers(dest='command', required=True)
+    p_split = sub.add_parser('split', help="(re)shard a seed; only changed shards are rewritten")
+    p_split.add_argument('--seed', default=SEED_PATH, metavar='PATH',
+                         help="seed file (default: data/seed.json; bare names resolve in data/)")
+    p_join = sub.add_parser('join', help="reassemble the seed from the shards")
+    p_join.add_argument('--out', default=SEED_PATH, metavar='PATH',
+                        help="seed file to write (default: data/seed.json)")
+    sub.add_parser('status', help="list shards and check their hashes against the manifest")
+    args = parser.parse_args()
+
+    command = {'split': cmd_split, 'join': cmd_join, 'status': cmd_status}[args.command]
+    try:
+        sys.exit(command(args))
+    except ShardError as e:
+        parser.exit(1, f"{e}\n")
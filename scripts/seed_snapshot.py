@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Take, list, diff and restore content-addressed snapshots of seed files"""
+import argparse
+import sys
+
+from seedkit.paths import resolve_seed_paths
+from seedkit.snapshots import STORE_DIR, SnapshotStore
+
+
+def cmd_take(store, args):
+    seed_paths = resolve_seed_paths(args.seed)
+    if args.name and len(seed_paths) > 1:
+        sys.exit("--name can only be used with a single seed")
+    for seed_path in seed_paths:
+        try:
+            manifest = store.take(seed_path, name=args.name)
+        except FileExistsError as e:
+            sys.exit(f"{e}; pick another --name")
+        records = sum(len(h) if isinstance(h, list) else 1 for _, h in manifest['sections'])
+        print(f"{manifest['name']}: {records} records, {manifest['new_objects']} new objects")
+
+
+def cmd_list(store, args):
+    for manifest in store.list():
+        tools = dict((s, h) for s, h in manifest['sections']).get('tools', [])
+        print(f"  {manifest['name']:40s} {manifest['created_at']}  {manifest['source']:28s} "
+              f"{len(tools):4d} tools  {manifest['digest'][:12]}")
+
+
+def cmd_diff(store, args):
+    changes = store.diff(args.old, args.new)
+    if not changes:
+        print("No differences.")
+    for section, diff in changes.items():
+        print(f"{section}:")
+        for kind, mark in (('added', '+'), ('removed', '-'), ('changed', '~')):
+            for identity in diff[kind]:
+                print(f"  {mark} {identity}")
+
+
+def cmd_restore(store, args):
+    exact = store.restore(args.name, args.out)
+    print(f"{args.name} -> {args.out} ({'byte-identical' if exact else 'content-identical, formatting differs'})")
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--store', default=STORE_DIR, help=f"snapshot store (default: {STORE_DIR})")
+    sub = parser.add_subparsers(dest='command', required=True)
+    p_take = sub.add_parser('take', help="snapshot seed files")
+    p_take.add_argument('--seed', action='append', metavar='PATH',
+                        help="seed file (repeatable); defaults as for the update_tools_* batches")
+    p_take.add_argument('--name', help="snapshot name (single seed only; default: timestamp-stem)")
+    sub.add_parser('list', help="list snapshots")
+    p_diff = sub.add_parser('diff', help="record-level changes between two snapshots")
+    p_diff.add_argument('old')
+    p_diff.add_argument('new')
+    p_restore = sub.add_parser('restore', help="write a snapshot back out as a seed file")
+    p_restore.add_argument('name')
+    p_restore.add_argument('--out', required=True, metavar='PATH')
+    args = parser.parse_args()
+
+    store = SnapshotStore(args.store)
+    {'take': cmd_take, 'list': cmd_list, 'diff': cmd_diff, 'restore': cmd_restore}[args.command](store, args)
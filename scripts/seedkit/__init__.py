@@ -0,0 +1,23 @@
+"""Shared tooling for the data/seed.json catalog used by the update_tools_* batches"""
+from seedkit.engine import SKIP, PatchReport, apply_updates, dump_seed, load_seed, patch_seed
+from seedkit.index import SeedIndex
+from seedkit.lazy import LazySeed
+from seedkit.schema import SchemaError, check_batches
+from seedkit.stream import SeedWriter, iter_sections, iter_tools, stream_patch
+
+__all__ = [
+    'SKIP',
+    'LazySeed',
+    'PatchReport',
+    'SchemaError',
+    'SeedIndex',
+    'SeedWriter',
+    'apply_updates',
+    'check_batches',
+    'dump_seed',
+    'iter_sections',
+    'iter_tools',
+    'load_seed',
+    'patch_seed',
+    'stream_patch',
+]
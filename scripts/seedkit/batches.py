@@ -0,0 +1,105 @@
+"""Discover update_tools_* batch scripts and read their UPDATES dicts without executing them"""
+import ast
+import glob
+import os
+
+BATCH_GLOB = "update_tools_*.py"
+RUNNER_NAME = "update_tools_all.py"
+# Precedence for a slug/field that several batches set differently: the batch
+# named here wins for that slug; any other conflict goes to the batch that
+# comes last in file-name order.
+PRECEDENCE = {
+    # batch6 re-wrote loom-ai, but the batch3 text is the one data/seed.json ships
+    'loom-ai': 'update_tools_batch3',
+}
+
+
+def read_updates(path):
+    """Return the literal UPDATES dict assigned at the top level of a batch script.
+
+    The module is parsed, never imported, so its load/dump side effects cannot run.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=path)
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == 'UPDATES' for target in node.targets
+        ):
+            return ast.literal_eval(node.value)
+    raise ValueError(f"{path}: no top-level UPDATES assignment")
+
+
+def discover_batches(scripts_dir):
+    """Batch script paths in file-name order (the order update_tools_all.py applies them in)."""
+    paths = sorted(glob.glob(os.path.join(scripts_dir, BATCH_GLOB)))
+    return [p for p in paths if os.path.basename(p) != RUNNER_NAME]
+
+
+def load_batches(scripts_dir):
+    """[(batch name, UPDATES)] for every batch script, in discover_batches() order."""
+    return [
+        (os.path.splitext(os.path.basename(path))[0], read_updates(path))
+        for path in discover_batches(scripts_dir)
+    ]
+
+
+def find_conflicts(batches):
+    """Slug/field pairs that more than one batch sets to different values.
+
+    `batches` is [(name, UPDATES)] as load_batches() returns. Returns
+    [(slug, field, [(batch name, value), ...])] in first-seen order. "SKIP"
+    only means "leave this tool alone", so it never conflicts with an update.
+    """
+    seen = {}
+    for name, updates in batches:
+        for slug, fields in updates.items():
+            if not isinstance(fields, dict):
+                continue
+            for field, value in fields.items():
+                seen.setdefault((slug, field), []).append((name, value))
+
+    conflicts = []
+    for (slug, field), values in seen.items():
+        distinct = []
+        for _, value in values:
+            if value not in distinct:
+                distinct.append(value)
+        if len(distinct) > 1:
+            conflicts.append((slug, field, values))
+    return conflicts
+
+
+def winner(slug, values):
+    """Batch whose value wins for one conflicting slug/field: PRECEDENCE, else the last file."""
+    names = [name for name, _ in values]
+    preferred = PRECEDENCE.get(slug)
+    return preferred if preferred in names else names[-1]
+
+
+def resolve_conflicts(batches, conflicts):
+    """Drop every losing value of `conflicts` from `batches`.
+
+    Returns (batches, [(slug, field, winning batch)]). Entries are copied
+    before a field is removed; an entry left empty is dropped.
+    """
+    losers = {}
+    resolved = []
+    for slug, field, values in conflicts:
+        name = winner(slug, values)
+        resolved.append((slug, field, name))
+        for other, _ in values:
+            if other != name:
+                losers.setdefault(other, {}).setdefault(slug, set()).add(field)
+    out = []
+    for name, updates in batches:
+        drop = losers.get(name)
+        if drop:
+            updates = dict(updates)
+            for slug, fields in drop.items():
+                kept = {k: v for k, v in updates[slug].items() if k not in fields}
+                if kept:
+                    updates[slug] = kept
+                else:
+                    del updates[slug]
+        out.append((name, updates))
+    return out, resolved
@@ -0,0 +1,112 @@
+"""Canonical form of seed data: fixed key order, stable numbers, NFC text
+
+json.dump(indent=2) writes dict keys in insertion order, so a batch that adds
+a field to some tools leaves the seed with several key orders and re-adding
+or reordering fields shows up as whole-record diffs. canonicalize() fixes
+each row's layout instead:
+
+- keys follow the section's table in supabase/migrations (tools_schema() for
+  tools, SEED_ONLY_COLUMNS included); keys the schema doesn't know come after,
+  sorted; rows of sections without a table keep their order;
+- NUMERIC(p,s) columns with a scale (rating_avg, hybrid_score, ...) are rounded
+  to that scale, and integral values are written as integers, as
+  JSON.stringify() does, so 4.5, 4.50000001 and 4.0 vs 4 can't drift;
+- every string, keys included, is Unicode NFC;
+- tuples become lists and non-string dict keys are spelled as json.dump
+  spells them, so canonical data is exactly what its JSON decodes to (the
+  marshal sidecar is written from it without a round trip).
+
+Canonicalizing canonical data is a no-op, and data parsed back from a
+canonical file is already canonical, so digests are reproducible.
+"""
+import functools
+import json
+import math
+import unicodedata
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+
+from seedkit.schema import table_schema, tools_schema
+
+
+@functools.lru_cache(maxsize=None)
+def layout(section):
+    """({column: position}, {column: scale}) for a section; (None, {}) if it has no table."""
+    columns = tools_schema() if section == 'tools' else table_schema(section)
+    if not columns:
+        return None, {}
+    scales = {name: c.scale for name, c in columns.items()
+              if c.sql_type == 'NUMERIC' and c.scale and not c.is_array}
+    return {name: i for i, name in enumerate(columns)}, scales
+
+
+def text(s):
+    return s if s.isascii() else unicodedata.normalize('NFC', s)
+
+
+def key(k):
+    # json.dump writes 1, 1.5, True and None keys as "1", "1.5", "true" and "null"
+    return text(k) if isinstance(k, str) else json.dumps(k)
+
+
+def normalize(value):
+    """`value` with every string (and dict key) in NFC and tuples as lists."""
+    if isinstance(value, str):
+        return text(value)
+    if isinstance(value, dict):
+        return {key(k): normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [normalize(v) for v in value]
+    return value
+
+
+def number(value, scale):
+    """`value` rounded to `scale` digits half away from zero, as Postgres NUMERIC and schema._fits_numeric do.
+
+    round() would round half to even on the binary float (4.25 -> 4.2 where
+    Postgres stores 4.3); the decimal text json.dumps() sends is rounded instead.
+    """
+    if isinstance(value, bool) or not isinstance(value, float) or not math.isfinite(value):
+        return value
+    try:
+        value = float(Decimal(repr(value)).quantize(Decimal(1).scaleb(-scale), rounding=ROUND_HALF_UP))
+    except InvalidOperation:  # more digits than the decimal context holds; the validator rejects it
+        return value
+    return int(value) if value.is_integer() else value
+
+
+def canonical_field(section, key, value):
+    """One field value of `section` in canonical form."""
+    value = normalize(value)
+    scale = layout(section)[1].get(key)
+    return value if scale is None else number(value, scale)
+
+
+def canonical_row(section, row):
+    """One record of `section` in canonical form."""
+    if not isinstance(row, dict):
+        return normalize(row)
+    row = normalize(row)
+    order, scales = layout(section)
+    for name, scale in scales.items():
+        if name in row:
+            row[name] = number(row[name], scale)
+    if order is None:
+        return row
+    keys = sorted(row, key=lambda k: (0, order[k], '') if k in order else (1, 0, k))
+    return {k: row[k] for k in keys}
+
+
+def canonical_section(section, value):
+    if isinstance(value, list):
+        return [canonical_row(section, row) for row in value]
+    return normalize(value)
+
+
+def canonicalize(data):
+    """A canonical copy of a seed dict; top-level sections keep their order."""
+    return {text(section): canonical_section(section, value) for section, value in data.items()}
+
+
+def dumps(data):
+    """Canonical seed text, in dump_seed()'s layout."""
+    return json.dumps(canonicalize(data), ensure_ascii=False, indent=2)
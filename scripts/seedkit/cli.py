@@ -0,0 +1,118 @@
+"""Command-line front end shared by the update_tools_* batches"""
+import argparse
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from seedkit.paths import SEED_ENV_VAR, SEED_VARIANTS, resolve_seed_paths
+from seedkit.schema import SchemaError, check_batches
+from seedkit.shards import patch_shards
+from seedkit.stream import STREAM_THRESHOLD, auto_patch
+
+
+def seed_parser(description):
+    """Parser with the seed selection and write options (--seed, --variants, --journal, --stream).
+
+    For scripts that patch one seed at a time; build_parser() adds the options
+    only patch_from_cli() implements.
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        '--seed', action='append', metavar='PATH',
+        help=f"seed file to patch (repeatable). Bare names resolve in data/. "
+             f"Defaults to ${SEED_ENV_VAR} (os.pathsep-separated), then data/seed.json",
+    )
+    parser.add_argument(
+        '--variants', action='store_true',
+        help=f"also patch the seed variants in data/ ({', '.join(SEED_VARIANTS)}); "
+             f"data/seed.json is included even when --seed names other files",
+    )
+    parser.add_argument(
+        '--journal', action='store_true',
+        help="append the changes to <seed>.journal.jsonl instead of rewriting the seed "
+             "(fold them in with scripts/seed_journal.py compact)",
+    )
+    parser.add_argument(
+        '--stream', action=argparse.BooleanOptionalAction, default=None,
+        help=f"patch record by record in constant memory (default: only for seeds of "
+             f"{STREAM_THRESHOLD >> 20} MiB or more)",
+    )
+    return parser
+
+
+def build_parser(description):
+    parser = seed_parser(description)
+    parser.add_argument(
+        '--shards', metavar='DIR',
+        help="patch the per-category shards in DIR instead of seed files, rewriting only "
+             "the shards this batch touches (see scripts/seed_shards.py)",
+    )
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=None,
+        help="worker processes when patching several seeds (default: one per seed)",
+    )
+    return parser
+
+
+def patch_seeds(paths, *batches, verify=False, journal_only=False, jobs=None, names=None,
+                stream=None):
+    """auto_patch() on every path; several paths run in parallel worker processes.
+
+    Batches are validated once up front. Returns the reports in the order of `paths`.
+    """
+    check_batches(batches, names)
+    options = {'verify': verify, 'journal_only': journal_only, 'validate': False,
+               'stream': stream}
+    if len(paths) == 1 or jobs == 1:
+        return [auto_patch(path, *batches, **options) for path in paths]
+    with ProcessPoolExecutor(max_workers=jobs or len(paths)) as pool:
+        futures = [pool.submit(auto_patch, path, *batches, **options) for path in paths]
+        return [future.result() for future in futures]
+
+
+def warn_integrity(report, file=sys.stderr):
+    """Print the references a patch broke by renaming tools, and a count of any other problems."""
+    check = report.integrity
+    if check is None or check.ok:
+        return
+    broken = check.broken()
+    if broken:
+        print(f"⚠ {report.path}: {len(broken)} references left pointing at renamed tools:", file=file)
+        for section, pos, field, old, new in broken:
+            print(f"    {section}[{pos}].{field} = {old!r} (now {new!r})", file=file)
+    others = len(check.dangling) + len(check.orphans) + len(check.duplicates) - len(broken)
+    if others:
+        print(f"  {report.path}: {others} other integrity problems "
+              f"(see scripts/check_integrity.py)", file=file)
+
+
+def patch_from_cli(description, *batches, verify=False, argv=None, names=None, parser=None):
+    """Parse the shared batch CLI and apply `batches` to every selected seed.
+
+    Pass `parser` to use a build_parser() parser the caller added options to.
+
+    Exits with status 2 and the list of problems if any batch fails validation.
+    Integrity problems in a patched seed are reported on stderr (warn_integrity).
+    """
+    if parser is None:
+        parser = build_parser(description)
+    args = parser.parse_args(argv)
+    if args.shards:
+        # None of the seed-file options apply to shards; refuse rather than ignore them
+        given = {'--seed': args.seed is not None, '--variants': args.variants, '--journal': args.journal,
+                 '--stream/--no-stream': args.stream is not None, '--jobs': args.jobs is not None}
+        unused = [option for option, present in given.items() if present]
+        if unused:
+            parser.error(f"--shards patches the shard directory only; drop {', '.join(unused)}")
+    paths = resolve_seed_paths(args.seed, variants=args.variants)
+    try:
+        if args.shards:
+            check_batches(batches, names)
+            reports = [patch_shards(args.shards, *batches, verify=verify, validate=False)]
+        else:
+            reports = patch_seeds(paths, *batches, verify=verify, journal_only=args.journal,
+                                  jobs=args.jobs, names=names, stream=args.stream)
+    except SchemaError as e:
+        parser.exit(2, f"{e}\nNo seed file was read or written.\n")
+    for report in reports:
+        warn_integrity(report)
+    return reports
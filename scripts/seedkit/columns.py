@@ -0,0 +1,195 @@
+"""Columnar view of the tools and tool_external_scores sections for analytics
+
+Each column is one typed stdlib array: numeric fields are float64 with NaN
+for missing/null values, string fields are dictionary-encoded (int32 codes
+into a label list, -1 for null). Aggregates run over flat arrays instead of
+dict lookups on every record: each DictColumn sorts its row indexes by
+code once, so group_stats() gathers a numeric column in group order with
+one itemgetter call, slices out each group and reduces it with
+statistics.fmean/min/max. save() writes every column as a raw
+little-endian buffer that numpy.fromfile() or Arrow can map without a parser.
+"""
+import bisect
+import itertools
+import json
+import math
+import operator
+import os
+import statistics
+import sys
+from array import array
+
+from seedkit.storage import atomic_write
+
+TOOL_NUMERIC = ('rating_avg', 'review_count', 'visit_count', 'hybrid_score', 'github_stars')
+TOOL_CATEGORICAL = ('slug', 'category_id', 'pricing_type')
+MANIFEST = 'manifest.json'
+NAN = math.nan
+
+
+class DictColumn:
+    """Dictionary-encoded strings: codes[i] indexes labels, -1 is null."""
+
+    def __init__(self, labels=None, codes=None):
+        self.labels = list(labels or [])
+        self.codes = codes if codes is not None else array('i')
+        self._lookup = {label: code for code, label in enumerate(self.labels)}
+        self._groups = None
+
+    @classmethod
+    def encode(cls, values):
+        column = cls()
+        for value in values:
+            column.append(value)
+        return column
+
+    def append(self, value):
+        self._groups = None
+        if value is None:
+            self.codes.append(-1)
+            return
+        code = self._lookup.get(value)
+        if code is None:
+            code = self._lookup[value] = len(self.labels)
+            self.labels.append(value)
+        self.codes.append(code)
+
+    def code(self, label):
+        return self._lookup.get(label, -1)
+
+    def groups(self):
+        """(take, bounds), built once: take(column) returns the column's non-null
+        rows ordered by code, and bounds[code] is that label's [start, end) slice."""
+        if self._groups is None:
+            key = self.codes.__getitem__
+            rows = sorted(range(len(self.codes)), key=key)
+            rows = rows[bisect.bisect_left(rows, 0, key=key):]
+            edges = [bisect.bisect_left(rows, code, key=key) for code in range(len(self.labels) + 1)]
+            if len(rows) > 1:
+                take = operator.itemgetter(*rows)
+            else:  # itemgetter() needs an index and returns a bare value for one
+                take = lambda column: [column[i] for i in rows]  # noqa: E731
+            self._groups = take, list(zip(edges, edges[1:]))
+        return self._groups
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, i):
+        code = self.codes[i]
+        return None if code < 0 else self.labels[code]
+
+    def __repr__(self):
+        return f"DictColumn(rows={len(self.codes)}, labels={len(self.labels)})"
+
+
+def numeric(values):
+    """float64 array of `values`; None and non-numbers become NaN."""
+    return array('d', (float(v) if isinstance(v, (int, float)) and not isinstance(v, bool) else NAN
+                       for v in values))
+
+
+class ColumnTable:
+    """Named, equal-length columns (array('d') or DictColumn)."""
+
+    def __init__(self, name, columns):
+        self.name = name
+        self.columns = columns
+        lengths = {len(c) for c in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"{name}: columns have different lengths {sorted(lengths)}")
+        self.rows = lengths.pop() if lengths else 0
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def __repr__(self):
+        return f"ColumnTable({self.name!r}, rows={self.rows}, columns={list(self.columns)})"
+
+    def group_stats(self, value, by):
+        """count/mean/min/max of numeric column `value` per label of DictColumn `by`.
+
+        NaN values are left out; groups with no values report count 0 and NaN
+        for the rest. Returns {label: {...}} in label order.
+        """
+        keys = self.columns[by]
+        take, bounds = keys.groups()
+        ordered = take(self.columns[value])
+        stats = {}
+        for label, (start, end) in zip(keys.labels, bounds):
+            group = list(itertools.filterfalse(math.isnan, ordered[start:end]))
+            stats[label] = {
+                'count': len(group),
+                'mean': statistics.fmean(group) if group else NAN,
+                'min': min(group, default=NAN),
+                'max': max(group, default=NAN),
+            }
+        return stats
+
+    def save(self, dirpath):
+        """Write each column as <dirpath>/<column>.bin plus a manifest.json."""
+        os.makedirs(dirpath, exist_ok=True)
+        manifest = {'table': self.name, 'rows': self.rows, 'byteorder': 'little', 'columns': {}}
+        for name, column in self.columns.items():
+            if isinstance(column, DictColumn):
+                data, entry = column.codes, {'type': 'dict', 'dtype': 'int32', 'labels': column.labels}
+            else:
+                data, entry = column, {'type': 'numeric', 'dtype': 'float64'}
+            if sys.byteorder != 'little':
+                data = array(data.typecode, data)
+                data.byteswap()
+            entry['file'] = f"{name}.bin"
+            with atomic_write(os.path.join(dirpath, entry['file']), 'wb') as f:
+                data.tofile(f)
+            manifest['columns'][name] = entry
+        with atomic_write(os.path.join(dirpath, MANIFEST)) as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def load(cls, dirpath):
+        with open(os.path.join(dirpath, MANIFEST), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        columns = {}
+        for name, entry in manifest['columns'].items():
+            data = array('i' if entry['type'] == 'dict' else 'd')
+            with open(os.path.join(dirpath, entry['file']), 'rb') as f:
+                data.fromfile(f, manifest['rows'])
+            if sys.byteorder != manifest['byteorder']:
+                data.byteswap()
+            columns[name] = DictColumn(entry['labels'], data) if entry['type'] == 'dict' else data
+        return cls(manifest['table'], columns)
+
+
+def tools_table(data):
+    tools = data['tools']
+    columns = {field: DictColumn.encode(t.get(field) for t in tools) for field in TOOL_CATEGORICAL}
+    columns.update((field, numeric(t.get(field) for t in tools)) for field in TOOL_NUMERIC)
+    return ColumnTable('tools', columns)
+
+
+def scores_table(data):
+    """tool_external_scores with raw_data's rating/review_count lifted into columns.
+
+    `tool` is the tool's slug (rows whose tool_id is not in tools get null).
+    """
+    slugs = {t['id']: t['slug'] for t in data['tools']}
+    rows = data.get('tool_external_scores') or []
+    raw = [row.get('raw_data') or {} for row in rows]
+    return ColumnTable('tool_external_scores', {
+        'tool': DictColumn.encode(slugs.get(row.get('tool_id')) for row in rows),
+        'source_key': DictColumn.encode(row.get('source_key') for row in rows),
+        'normalized_score': numeric(row.get('normalized_score') for row in rows),
+        'rating': numeric(r.get('rating') for r in raw),
+        'review_count': numeric(r.get('review_count') for r in raw),
+    })
+
+
+def export(data, dirpath):
+    """Build and save both tables under dirpath/tools and dirpath/tool_external_scores."""
+    tables = [tools_table(data), scores_table(data)]
+    for table in tables:
+        table.save(os.path.join(dirpath, table.name))
+    return tables
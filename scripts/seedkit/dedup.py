@@ -0,0 +1,233 @@
+"""Near-duplicate detection over tool texts with MinHash signatures and LSH banding
+
+Each record's description, long_description, pros, cons and usage_tips are
+normalized (lowercased, 【section】 headers and bullets dropped) and cut into
+character k-shingles. Signatures use one-permutation MinHash: every shingle
+is hashed once and kept as the minimum of one of NUM_BINS bins, with empty
+bins filled from the next non-empty one (densification), so a signature
+costs O(shingles) instead of O(shingles x permutations).
+
+Signatures are split into bands; records sharing any band bucket become
+candidates, and only candidates get an exact Jaccard check. With b bands of
+r rows a pair of similarity s is caught with probability 1 - (1 - s^r)^b,
+and the work grows with the number of records plus the number of candidate
+pairs rather than with all pairs.
+
+Placeholder descriptions ("<name> - AI 도구") are not text and are dropped.
+Records left with fewer than MIN_SHINGLES shingles (the collected candidates
+carry a name and a few words at most) are "short": they are compared on name
++ description instead, against the same name + description text of every
+other record, with SHORT_THRESHOLD, since LSH has little recall at such
+sizes. Those candidates come from prefix filtering rather than from all
+pairs: a set whose Jaccard with another is >= t shares at least ceil(t * n)
+of its n shingles with it, so with shingles in one global rarest-first order
+two such sets must share one of their first n - ceil(t * n) + 1. Only those
+prefix shingles are indexed, which keeps the check exact while pairing each
+record with the few that share a rare shingle. Records with no name or
+description text at all are sparse and not compared.
+"""
+import hashlib
+import math
+import re
+from collections import defaultdict
+
+from seedkit.lint import is_placeholder
+
+SHINGLE_SIZE = 4
+NUM_BINS = 128
+BANDS = 32
+ROWS = NUM_BINS // BANDS
+# Below this many shingles a record is compared on name + description ("short")
+MIN_SHINGLES = 32
+SHORT_THRESHOLD = 0.35
+TEXT_FIELDS = ('description', 'long_description')
+LIST_FIELDS = ('pros', 'cons', 'usage_tips')
+
+_MASK = (1 << 64) - 1
+_HEADER = re.compile(r'【[^】]*】')
+_NOISE = re.compile(r'[\s•·\-–—*#>|:,.()\[\]/]+')
+
+
+def record_text(tool):
+    parts = [tool.get(field) or '' for field in TEXT_FIELDS
+             if not is_placeholder(field, tool.get(field), tool)]
+    for field in LIST_FIELDS:
+        parts.extend(tool.get(field) or [])
+    text = _HEADER.sub(' ', '\n'.join(p for p in parts if isinstance(p, str)))
+    return _NOISE.sub(' ', text.lower()).strip()
+
+
+def brief_text(tool):
+    """Name and description, the only text a collected candidate reliably has."""
+    description = tool.get('description') or ''
+    if not isinstance(description, str) or is_placeholder('description', description, tool):
+        description = ''
+    return _NOISE.sub(' ', f"{tool.get('name') or ''} {description}".lower()).strip()
+
+
+def shingles(text, k=SHINGLE_SIZE):
+    """64-bit hashes of the text's character k-grams (the whole text if shorter)."""
+    if not text:
+        return set()
+    grams = {text[i:i + k] for i in range(max(len(text) - k + 1, 1))}
+    return {int.from_bytes(hashlib.blake2b(g.encode('utf-8'), digest_size=8).digest(), 'little')
+            for g in grams}
+
+
+def _mix(h):
+    # splitmix64 finalizer: spreads blake2b bits so bin index and value are independent
+    h = (h ^ (h >> 30)) * 0xbf58476d1ce4e5b9 & _MASK
+    h = (h ^ (h >> 27)) * 0x94d049bb133111eb & _MASK
+    return h ^ (h >> 31)
+
+
+def signature(hashes, bins=NUM_BINS):
+    """One-permutation MinHash with rotation densification; None for an empty set."""
+    if not hashes:
+        return None
+    empty = _MASK + 1
+    mins = [empty] * bins
+    for h in hashes:
+        h = _mix(h)
+        b = h % bins
+        v = h // bins
+        if v < mins[b]:
+            mins[b] = v
+    # Empty bins borrow from the next non-empty bin to the right (circularly), offset by distance
+    filled = [i for i, v in enumerate(mins) if v != empty]
+    if len(filled) < bins:
+        nxt = filled[0] + bins
+        for i in range(bins - 1, -1, -1):
+            if mins[i] != empty:
+                nxt = i
+            else:
+                mins[i] = mins[nxt % bins] + (nxt - i) * (empty >> 8)
+    return tuple(mins)
+
+
+def jaccard(a, b):
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class Record:
+    __slots__ = ('source', 'position', 'slug', 'placeholder', 'shingles', 'brief', 'signature')
+
+    def __init__(self, source, position, tool):
+        self.source = source
+        self.position = position
+        self.slug = tool.get('slug') or tool.get('name') or f"#{position}"
+        self.placeholder = is_placeholder('description', tool.get('description'), tool)
+        self.shingles = shingles(record_text(tool))
+        # name + description shingles, what short records are compared on
+        self.brief = shingles(brief_text(tool))
+        self.signature = signature(self.shingles)
+
+    def __repr__(self):
+        return f"{self.source}:{self.slug}"
+
+
+def candidate_pairs(records, bands=BANDS, rows=ROWS):
+    """Index pairs (i, j), i < j, of records that share at least one LSH band bucket."""
+    pairs = set()
+    for band in range(bands):
+        buckets = defaultdict(list)
+        lo = band * rows
+        for i, record in enumerate(records):
+            if record.signature is not None:
+                buckets[record.signature[lo:lo + rows]].append(i)
+        for members in buckets.values():
+            for a in range(len(members)):
+                for b in range(a + 1, len(members)):
+                    pairs.add((members[a], members[b]))
+    return pairs
+
+
+def load_records(sources, min_shingles=MIN_SHINGLES):
+    """(full records, short records, sparse records) of [(source name, tools list)]."""
+    records, short, sparse = [], [], []
+    for name, tools in sources:
+        for i, tool in enumerate(tools):
+            record = Record(name, i, tool)
+            if len(record.shingles) >= min_shingles:
+                records.append(record)
+            elif record.brief:
+                short.append(record)
+            else:
+                sparse.append(record)
+    return records, short, sparse
+
+
+def _prefix_length(n, threshold):
+    # Shingles a set of size n must share with any set it has Jaccard >= threshold with
+    overlap = max(math.ceil(threshold * n - 1e-9), 1)
+    return n - overlap + 1
+
+
+def short_pairs(records, short, threshold=SHORT_THRESHOLD):
+    """[(similarity, record_a, record_b)] of each short record against every other record, on name + description.
+
+    Returns (pairs, checked): checked is how many pairs got an exact Jaccard
+    check after prefix filtering.
+    """
+    pool = short + records
+    frequency = defaultdict(int)
+    for record in pool:
+        for h in record.brief:
+            frequency[h] += 1
+    # Prefix shingle -> pool indices, kept apart so full records are never paired with each other
+    short_postings, full_postings = defaultdict(list), defaultdict(list)
+    candidates = set()
+    for i, record in enumerate(pool):
+        is_short = i < len(short)
+        ordered = sorted(record.brief, key=lambda h: (frequency[h], h))
+        for h in ordered[:_prefix_length(len(ordered), threshold)]:
+            candidates.update((j, i) for j in short_postings[h])
+            if is_short:
+                candidates.update((j, i) for j in full_postings[h])
+            (short_postings if is_short else full_postings)[h].append(i)
+    pairs = []
+    for i, j in candidates:
+        a, b = pool[i], pool[j]
+        sim = jaccard(a.brief, b.brief)
+        if sim >= threshold:
+            pairs.append((sim, a, b) if (a.source, a.position) <= (b.source, b.position) else (sim, b, a))
+    return pairs, len(candidates)
+
+
+def find_duplicates(sources, threshold=0.5, bands=BANDS, rows=ROWS, min_shingles=MIN_SHINGLES,
+                    short_threshold=SHORT_THRESHOLD):
+    """Near-duplicate record pairs across [(source name, tools list)].
+
+    Returns (pairs, candidates, short, sparse): pairs is [(similarity,
+    record_a, record_b)], most similar first, of full records with exact
+    shingle Jaccard >= threshold plus short records whose name + description
+    Jaccard is >= short_threshold; candidates is how many pairs LSH proposed;
+    short and sparse list the records compared on name + description and the
+    ones not compared at all.
+    """
+    if bands * rows > NUM_BINS:
+        raise ValueError(f"bands x rows must not exceed {NUM_BINS}")
+    records, short, sparse = load_records(sources, min_shingles)
+    candidates = candidate_pairs(records, bands, rows)
+    pairs = []
+    for i, j in candidates:
+        sim = jaccard(records[i].shingles, records[j].shingles)
+        if sim >= threshold:
+            pairs.append((sim, records[i], records[j]))
+    pairs.extend(short_pairs(records, short, short_threshold)[0])
+    pairs.sort(key=lambda p: (-p[0], p[1].source, p[1].position, p[2].source, p[2].position))
+    return pairs, len(candidates), short, sparse
+
+
+def brute_force(sources, threshold=0.5, min_shingles=MIN_SHINGLES):
+    """All-pairs exact Jaccard of the full records; quadratic, for checking LSH recall on small inputs."""
+    records, _, _ = load_records(sources, min_shingles)
+    pairs = []
+    for n, a in enumerate(records):
+        for b in records[n + 1:]:
+            sim = jaccard(a.shingles, b.shingles)
+            if sim >= threshold:
+                pairs.append((sim, a, b))
+    return pairs
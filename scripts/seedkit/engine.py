@@ -0,0 +1,271 @@
+"""Seed patch engine: apply UPDATES dicts to seed.json with one load and one dump"""
+import hashlib
+import json
+import os
+
+from seedkit import journal, search, sidecar
+from seedkit.canonical import canonical_field, canonicalize
+from seedkit.index import SeedIndex
+from seedkit.integrity import check_integrity
+from seedkit.schema import SKIP, check_batches
+from seedkit.storage import atomic_write, file_digest
+
+_MISSING = object()
+
+
+class PatchReport:
+    """Outcome of applying one or more UPDATES batches to the tools list."""
+
+    def __init__(self):
+        self.path = None
+        self.updated = []
+        self.skipped = []
+        self.not_found = []
+        # slug -> {'changed': [...], 'new': [...], 'noop': [...]} field names
+        self.fields = {}
+        self.written = False
+        self.journaled = False
+        # RFC 6902 ops equivalent to the changed/new fields, in apply order
+        self.ops = []
+        # sha256 of the bytes written, and whether the file on disk matched it
+        self.digest = None
+        self.verified = None
+        self.stats = []
+        # 'slug' / 'id' -> {old: new} for tool keys this run changed
+        self.renamed = {}
+        # seedkit.integrity.IntegrityReport of the patched seed, when anything changed
+        self.integrity = None
+        # shard files rewritten (seedkit.shards.patch_shards)
+        self.shards = []
+
+    @property
+    def changed(self):
+        """True if any field value actually differs from what was in the seed."""
+        return any(diff['changed'] or diff['new'] for diff in self.fields.values())
+
+    @property
+    def noop(self):
+        """Updated slugs whose every field already matched the seed."""
+        return [slug for slug in self.updated
+                if not (self.fields[slug]['changed'] or self.fields[slug]['new'])]
+
+    def __repr__(self):
+        return (f"PatchReport(updated={len(self.updated)}, noop={len(self.noop)}, "
+                f"skipped={len(self.skipped)}, not_found={len(self.not_found)})")
+
+
+def _same(a, b):
+    # json treats 1/True and 1/1.0 differently on output; so must we.
+    return type(a) is type(b) and a == b
+
+
+def load_seed(path, use_sidecar=True):
+    """Parse a seed file, from its binary sidecar when that is current.
+
+    A missing or stale sidecar is not rebuilt here; dump_seed() writes a fresh
+    one, so read-only commands leave no files behind.
+    """
+    if use_sidecar:
+        data = sidecar.read_sidecar(path)
+        if data is not None:
+            return data
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_tools(path):
+    """Tools list of a seed file (dict with 'tools') or a bare tools list like ai-tools-500.json."""
+    data = load_seed(path)
+    return data if isinstance(data, list) else data['tools']
+
+
+class HashingWriter:
+    """File proxy that hashes the UTF-8 bytes of every chunk json.dump writes."""
+
+    def __init__(self, f):
+        self.f = f
+        self.sha = hashlib.sha256()
+
+    def write(self, chunk):
+        self.sha.update(chunk.encode('utf-8'))
+        return self.f.write(chunk)
+
+
+def dump_seed(data, path, use_sidecar=True, canonical=True):
+    """Write seed.json atomically; json.dump streams encoder chunks into the temp file.
+
+    Data is written in canonical form (seedkit.canonical) unless canonical=False.
+    The binary sidecar is regenerated to match; non-canonical data may not
+    decode back to itself, so its sidecar is removed instead. Returns the
+    sha256 hex digest of the bytes written.
+    """
+    if canonical:
+        data = canonicalize(data)
+    with atomic_write(path) as f:
+        writer = HashingWriter(f)
+        json.dump(data, writer, ensure_ascii=False, indent=2)
+    digest = writer.sha.hexdigest()
+    if use_sidecar and canonical:
+        sidecar.write_sidecar(path, data, digest)
+    elif use_sidecar:
+        sidecar.discard(path)
+    return digest
+
+
+def tool_stats(tool):
+    """Content-size summary of one tool record, as printed by the verify step."""
+    return {
+        'slug': tool['slug'],
+        'desc': len(tool.get('description') or ''),
+        'long': len(tool.get('long_description') or ''),
+        'tags': len(tool.get('tags') or []),
+        'pros': len(tool.get('pros') or []),
+        'cons': len(tool.get('cons') or []),
+        'tips': len(tool.get('usage_tips') or []),
+        'fqd': bool(tool.get('free_quota_detail')),
+    }
+
+
+def apply_fields(tool, fields, before):
+    """Set `fields` on `tool`, remembering each field's value before its first change in `before`.
+
+    Values are stored in canonical form, so a batch value that only differs
+    from the seed's in rounding or Unicode normalization is a no-op.
+    """
+    for key, value in fields.items():
+        if key not in before:
+            before[key] = tool.get(key, _MISSING)
+        tool[key] = canonical_field('tools', key, value)
+
+
+def record_diff(report, slug, pos, tool, before):
+    """Classify a patched tool's fields into report.fields[slug] and add its JSON Patch ops."""
+    diff = report.fields[slug] = {'changed': [], 'new': [], 'noop': []}
+    ops = []
+    for key, old in before.items():
+        pointer = f"/tools/{pos}/{journal.escape_pointer(key)}"
+        if old is _MISSING:
+            diff['new'].append(key)
+            ops.append({'op': 'add', 'path': pointer, 'value': tool[key]})
+        elif _same(old, tool[key]):
+            diff['noop'].append(key)
+        else:
+            diff['changed'].append(key)
+            ops.append({'op': 'replace', 'path': pointer, 'value': tool[key]})
+            if key in ('slug', 'id'):
+                report.renamed.setdefault(key, {})[old] = tool[key]
+    if ops:
+        report.ops.append({'op': 'test', 'path': f"/tools/{pos}/slug", 'value': slug})
+        report.ops.extend(ops)
+
+
+def apply_updates(data, *batches, index=None):
+    """Apply UPDATES batches in order; later batches win on overlapping fields.
+
+    A batch value of "SKIP" marks a slug that was intentionally left alone.
+    Pass an existing SeedIndex to reuse it across calls on the same data.
+    """
+    if index is None:
+        index = SeedIndex(data)
+    status = {}
+    # slug -> (position, tool, {field: original value or _MISSING}), captured on first touch
+    originals = {}
+
+    for updates in batches:
+        for slug, fields in updates.items():
+            tool = index.tool(slug)
+            if tool is None:
+                status.setdefault(slug, 'not_found')
+                continue
+            if fields == SKIP:
+                status.setdefault(slug, 'skipped')
+                continue
+            before = originals.setdefault(slug, (index.position(slug), tool, {}))[2]
+            apply_fields(tool, fields, before)
+            if 'slug' in fields or 'id' in fields:
+                index.rekey(slug)
+            status[slug] = 'updated'
+
+    report = PatchReport()
+    for slug, state in status.items():
+        getattr(report, state).append(slug)
+    for slug, (pos, tool, before) in originals.items():
+        record_diff(report, slug, pos, tool, before)
+    return report
+
+
+def changed_positions(report):
+    """Positions in the tools list of the records whose fields actually changed."""
+    return sorted({int(op['path'].split('/')[2]) for op in report.ops if op['op'] == 'test'})
+
+
+def load_current(path):
+    """Load a seed file with any pending journal entries replayed on top.
+
+    Returns (data, base digest or None, entries).
+    """
+    data = load_seed(path)
+    entries = journal.read_journal(path)
+    base = None
+    if entries:
+        base = file_digest(path)
+        journal.check_base(entries, base)
+        journal.replay(data, entries)
+    return data, base, entries
+
+
+def compact_seed(path):
+    """Fold the journal into the seed file and remove it. Returns the entries folded."""
+    data, _, entries = load_current(path)
+    if entries:
+        dump_seed(data, path)
+        journal.discard(path)
+    return entries
+
+
+def patch_seed(path, *batches, verify=False, journal_only=False, validate=True):
+    """Load seed.json once, apply every batch, write it back once.
+
+    The write is skipped (file bytes and mtime untouched) when no field changed.
+    With verify=True, the report carries tool_stats() for every updated slug,
+    computed from the in-memory records, and the file on disk is checked
+    against the digest of the bytes written instead of being re-parsed.
+
+    Pending journal entries are replayed before the batches. A full write
+    folds them into the file; with journal_only=True the seed is left as is
+    and only this run's ops are appended to the journal (see compact_seed()).
+
+    Batches are checked against the tools schema first (schema.check_batches);
+    a SchemaError is raised before the seed is even read. An existing search
+    index next to the seed is updated for the changed tools, and when anything
+    changed the result is checked for referential integrity (report.integrity).
+    """
+    if validate:
+        check_batches(batches)
+    data, base, entries = load_current(path)
+    index = SeedIndex(data)
+    report = apply_updates(data, *batches, index=index)
+    report.path = path
+    if report.changed:
+        report.integrity = check_integrity(data, report.renamed)
+    indexed = report.changed and os.path.exists(search.index_path(path))
+    if indexed or (report.changed and journal_only):
+        base = base or file_digest(path)
+    if report.changed and journal_only:
+        journal.append_entry(path, report.ops, base, entries)
+        report.journaled = True
+        source = [base, len(entries) + 1]
+    elif report.changed:
+        report.digest = dump_seed(data, path)
+        report.written = True
+        journal.discard(path)
+        source = [report.digest, 0]
+    if indexed:
+        search.update_index_file(path, [data['tools'][pos] for pos in changed_positions(report)],
+                                 [base, len(entries)], source, report.renamed)
+    if verify:
+        report.stats = [tool_stats(index.tool(slug))
+                        for slug in report.updated if slug in index]
+        if report.written:
+            report.verified = file_digest(path) == report.digest
+    return report
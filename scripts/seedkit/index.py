@@ -0,0 +1,97 @@
+"""In-memory indexes over a loaded seed: slug/id lookups and per-tool joins"""
+from collections import defaultdict
+
+# Sections that reference tools by UUID (tool_id) or by slug (tool_slug)
+TOOL_ID_SECTIONS = (
+    'tool_categories',
+    'tool_external_scores',
+    'tool_benchmark_scores',
+    'tool_updates',
+    'purpose_tool_recommendations',
+    'edu_tool_recommendations',
+)
+TOOL_SLUG_SECTIONS = (
+    'tool_showcases',
+    'role_use_cases',
+)
+
+
+class SeedIndex:
+    """slug -> position and id -> slug maps over data['tools'], plus lazily built
+    slug -> rows groupings for the sections that join against tools.
+
+    The index holds references into `data`; call rekey() after changing a tool's slug or id
+    in place, and add tools through append_tool(), so the maps stay in sync.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.tools = data['tools']
+        self.positions = {}
+        self.id_to_slug = {}
+        for i, tool in enumerate(self.tools):
+            self._register(i, tool)
+        self._groups = {}
+
+    def _register(self, position, tool):
+        slug = tool['slug']
+        if slug in self.positions:
+            raise ValueError(f"duplicate tool slug in seed: {slug}")
+        self.positions[slug] = position
+        if tool.get('id') is not None:
+            self.id_to_slug[tool['id']] = slug
+
+    def __len__(self):
+        return len(self.positions)
+
+    def __contains__(self, slug):
+        return slug in self.positions
+
+    def position(self, slug):
+        return self.positions.get(slug)
+
+    def tool(self, slug):
+        pos = self.positions.get(slug)
+        return None if pos is None else self.tools[pos]
+
+    def slug_for_id(self, tool_id):
+        return self.id_to_slug.get(tool_id)
+
+    def tool_by_id(self, tool_id):
+        slug = self.id_to_slug.get(tool_id)
+        return None if slug is None else self.tool(slug)
+
+    def append_tool(self, tool):
+        self._register(len(self.tools), tool)
+        self.tools.append(tool)
+        self._groups.clear()
+
+    def rekey(self, old_slug):
+        """Re-register a tool whose slug or id was changed in place."""
+        pos = self.positions.pop(old_slug)
+        for tool_id, slug in list(self.id_to_slug.items()):
+            if slug == old_slug:
+                del self.id_to_slug[tool_id]
+        self._register(pos, self.tools[pos])
+        self._groups.clear()
+
+    def rows(self, section, slug):
+        """Rows of `section` that belong to the tool with `slug` (empty list if none)."""
+        groups = self._groups.get(section)
+        if groups is None:
+            groups = self._groups[section] = self._group(section)
+        return groups.get(slug, [])
+
+    def _group(self, section):
+        if section in TOOL_ID_SECTIONS:
+            key, resolve = 'tool_id', self.id_to_slug.get
+        elif section in TOOL_SLUG_SECTIONS:
+            key, resolve = 'tool_slug', lambda slug: slug
+        else:
+            raise KeyError(f"section does not reference tools: {section}")
+        groups = defaultdict(list)
+        for row in self.data.get(section) or []:
+            slug = resolve(row.get(key))
+            if slug is not None:
+                groups[slug].append(row)
+        return dict(groups)
@@ -0,0 +1,137 @@
+"""Referential integrity across seed sections: every foreign key checked against hash sets
+
+IntegrityChecker takes rows section by section, in any order: rows of a
+referenced section add their keys to a set, rows of a referencing section
+queue (reference, position, value). finish() then resolves the queue with
+one set lookup per reference, so a check is linear in the number of rows
+and works the same over a loaded seed or a streamed one
+(seedkit.stream.iter_sections).
+
+Two kinds of broken reference are told apart:
+- orphans: rows owned by a missing parent (a tool_external_scores row whose
+  tool is gone), which are dead weight and should be removed;
+- dangling: rows that merely point at something missing (news.related_tool_id,
+  role_use_cases.tool_slug), which need repointing.
+"""
+from collections import defaultdict
+
+from seedkit.index import TOOL_ID_SECTIONS, TOOL_SLUG_SECTIONS
+
+# (section, field, referenced section, referenced key, row is owned by the referenced row)
+REFERENCES = (
+    *((section, 'tool_id', 'tools', 'id', section.startswith('tool_')) for section in TOOL_ID_SECTIONS),
+    *((section, 'tool_slug', 'tools', 'slug', section.startswith('tool_')) for section in TOOL_SLUG_SECTIONS),
+    ('news', 'related_tool_id', 'tools', 'id', False),
+    ('tools', 'category_id', 'categories', 'id', False),
+    ('tool_categories', 'category_id', 'categories', 'id', True),
+    ('category_showcases', 'category_slug', 'categories', 'slug', True),
+    ('tool_showcases', 'showcase_id', 'category_showcases', 'id', True),
+    ('role_use_cases', 'role_showcase_id', 'role_showcases', 'id', True),
+    ('purpose_tool_recommendations', 'user_type_slug', 'user_types', 'slug', False),
+)
+
+_BY_SECTION = defaultdict(list)
+_KEYS = defaultdict(set)
+for _ref in REFERENCES:
+    _BY_SECTION[_ref[0]].append(_ref)
+    _KEYS[_ref[2]].add(_ref[3])
+# (section, field) -> tool key, for the references a tool rename can break
+_TOOL_REFS = {(ref[0], ref[1]): ref[3] for ref in REFERENCES if ref[2] == 'tools'}
+
+
+class IntegrityReport:
+    """Outcome of an integrity check.
+
+    dangling/orphans are [(section, position, field, value)]; duplicates is
+    [(section, key, value)] for key values that occur more than once in a
+    referenced section. `renamed` maps field ('slug', 'id') -> {old: new} for
+    keys changed by the patch being checked; broken() picks the references
+    those renames left behind.
+    """
+
+    def __init__(self):
+        self.dangling = []
+        self.orphans = []
+        self.duplicates = []
+        self.checked = 0
+        self.renamed = {}
+
+    @property
+    def ok(self):
+        return not (self.dangling or self.orphans or self.duplicates)
+
+    def broken(self):
+        """(section, position, field, old value, new value) for references to a renamed tool key."""
+        out = []
+        for section, pos, field, value in self.orphans + self.dangling:
+            key = _TOOL_REFS.get((section, field))
+            new = self.renamed.get(key, {}).get(value)
+            if new is not None:
+                out.append((section, pos, field, value, new))
+        return sorted(out)
+
+    def __repr__(self):
+        return (f"IntegrityReport(checked={self.checked}, dangling={len(self.dangling)}, "
+                f"orphans={len(self.orphans)}, duplicates={len(self.duplicates)})")
+
+
+class IntegrityChecker:
+    """Collects keys and references row by row; finish() resolves them."""
+
+    def __init__(self):
+        # (section, key) -> set of values seen
+        self.keys = {(section, key): set() for section, keys in _KEYS.items() for key in keys}
+        self.duplicates = []
+        # (reference, position, value) awaiting resolution
+        self.pending = []
+        self._positions = defaultdict(int)
+
+    def add(self, section, row):
+        pos = self._positions[section]
+        self._positions[section] += 1
+        for key in _KEYS.get(section, ()):
+            value = row.get(key)
+            if value is None:
+                continue
+            seen = self.keys[section, key]
+            if value in seen:
+                self.duplicates.append((section, key, value))
+            seen.add(value)
+        for ref in _BY_SECTION.get(section, ()):
+            value = row.get(ref[1])
+            if value is not None:
+                self.pending.append((ref, pos, value))
+
+    def add_rows(self, section, rows):
+        """Feed a section's rows; yields them back, so it can sit inside a streaming pass."""
+        for row in rows:
+            self.add(section, row)
+            yield row
+
+    def feed(self, section, rows):
+        for _ in self.add_rows(section, rows):
+            pass
+
+    def finish(self, renamed=None):
+        report = IntegrityReport()
+        report.renamed = renamed or {}
+        report.duplicates = self.duplicates
+        report.checked = len(self.pending)
+        for (section, field, target, key, owned), pos, value in self.pending:
+            if value not in self.keys[target, key]:
+                (report.orphans if owned else report.dangling).append((section, pos, field, value))
+        return report
+
+
+def check_sections(sections, renamed=None):
+    """Check (name, rows) pairs: data.items() of a loaded seed, or iter_sections(path)."""
+    checker = IntegrityChecker()
+    for section, rows in sections:
+        if section in _BY_SECTION or section in _KEYS:
+            checker.feed(section, rows)
+    return checker.finish(renamed)
+
+
+def check_integrity(data, renamed=None):
+    """Check a loaded seed dict."""
+    return check_sections(data.items(), renamed)
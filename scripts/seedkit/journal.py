@@ -0,0 +1,118 @@
+"""Append-only RFC 6902 ops journal kept next to a seed file
+
+Each line of <seed>.journal.jsonl is one patch run:
+    {"seq": 3, "at": "...Z", "base": "<sha256 of the seed file>", "ops": [...]}
+Ops are JSON Patch operations ("test", "add", "replace", "remove") against
+the document produced by the base file plus every earlier entry. "base" pins
+the seed bytes the journal was started from, so a seed rewritten behind the
+journal's back is detected instead of replayed onto the wrong document.
+"""
+import json
+import os
+from datetime import datetime, timezone
+
+JOURNAL_SUFFIX = '.journal.jsonl'
+
+
+class JournalError(ValueError):
+    pass
+
+
+def journal_path(seed_path):
+    return os.path.splitext(seed_path)[0] + JOURNAL_SUFFIX
+
+
+def escape_pointer(token):
+    return str(token).replace('~', '~0').replace('/', '~1')
+
+
+def _unescape(token):
+    return token.replace('~1', '/').replace('~0', '~')
+
+
+def read_journal(seed_path):
+    """All journal entries for `seed_path`, oldest first ([] if there is no journal)."""
+    path = journal_path(seed_path)
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def check_base(entries, base_digest):
+    for entry in entries:
+        if entry['base'] != base_digest:
+            raise JournalError(
+                f"journal entry {entry['seq']} was recorded against a different seed file "
+                f"(base {entry['base'][:12]}, now {base_digest[:12]}); compact or discard the journal"
+            )
+
+
+def append_entry(seed_path, ops, base_digest, entries=None):
+    """Append one run's ops to the journal and fsync it. Returns the entry."""
+    if entries is None:
+        entries = read_journal(seed_path)
+    entry = {
+        'seq': entries[-1]['seq'] + 1 if entries else 1,
+        'at': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'base': base_digest,
+        'ops': ops,
+    }
+    with open(journal_path(seed_path), 'a', encoding='utf-8') as f:
+        f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        f.flush()
+        os.fsync(f.fileno())
+    return entry
+
+
+def _resolve(doc, pointer):
+    """(container, last token) for a JSON pointer; list tokens become ints."""
+    if not pointer.startswith('/'):
+        raise JournalError(f"invalid JSON pointer: {pointer!r}")
+    tokens = [_unescape(t) for t in pointer[1:].split('/')]
+    parent = doc
+    for token in tokens[:-1]:
+        parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+    last = tokens[-1]
+    if isinstance(parent, list):
+        last = len(parent) if last == '-' else int(last)
+    return parent, last
+
+
+def apply_ops(doc, ops):
+    """Apply JSON Patch ops to `doc` in place."""
+    for op in ops:
+        parent, key = _resolve(doc, op['path'])
+        kind = op['op']
+        if kind == 'test':
+            if parent[key] != op['value']:
+                raise JournalError(f"test failed at {op['path']}: {parent[key]!r} != {op['value']!r}")
+        elif kind == 'add':
+            if isinstance(parent, list):
+                parent.insert(key, op['value'])
+            else:
+                parent[key] = op['value']
+        elif kind == 'replace':
+            if isinstance(parent, dict) and key not in parent:
+                raise JournalError(f"replace of missing member at {op['path']}")
+            parent[key] = op['value']
+        elif kind == 'remove':
+            del parent[key]
+        else:
+            raise JournalError(f"unsupported op: {kind}")
+    return doc
+
+
+def replay(doc, entries, upto=None):
+    """Apply journal entries (optionally only those with seq <= upto) to `doc` in place."""
+    for entry in entries:
+        if upto is not None and entry['seq'] > upto:
+            break
+        apply_ops(doc, entry['ops'])
+    return doc
+
+
+def discard(seed_path):
+    path = journal_path(seed_path)
+    if os.path.exists(path):
+        os.unlink(path)
@@ -0,0 +1,249 @@
+"""Memory-mapped, lazily decoded reader for seed files
+
+LazySeed maps the file and locates each top-level section without decoding
+any values. Array sections are split into per-record byte spans on first
+access, and a record's fields are located (and decoded one by one) only
+when read, so `seed.tools[i]['slug']` never decodes that tool's
+long_description, and reading tool_external_scores never decodes a tool.
+
+Files written by dump_seed() (indent=2) are scanned by line indentation:
+JSON escapes newlines inside strings, so a line indented 2*d spaces always
+starts a value at depth d, and the C regex engine finds them directly. Any
+other layout falls back to a tokenizing scan of the structural bytes.
+"""
+import json
+import mmap
+import re
+from collections.abc import Mapping, Sequence
+
+_STRING = re.compile(rb'"(?:[^"\\]|\\.)*"')
+_TOKEN = re.compile(rb'(?P<str>"(?:[^"\\]|\\.)*")|(?P<open>[\[{])|(?P<close>[\]}])|(?P<comma>,)|(?P<colon>:)')
+_WS = b' \t\r\n'
+
+
+def _decode_key(buf, m):
+    raw = buf[m.start() + 1:m.end() - 1]
+    return json.loads(buf[m.start():m.end()]) if b'\\' in raw else raw.decode('utf-8')
+
+
+def _skip_ws(buf, pos):
+    while buf[pos] in _WS:
+        pos += 1
+    return pos
+
+
+def _rstrip(buf, pos):
+    while buf[pos - 1] in _WS:
+        pos -= 1
+    return pos
+
+
+_LINE_STARTS = {}
+
+
+def _line_start_re(indent):
+    if indent not in _LINE_STARTS:
+        _LINE_STARTS[indent] = re.compile(rb'\n' + b' ' * indent + rb'(?! )')
+    return _LINE_STARTS[indent]
+
+
+def _indented_child_spans(buf, start, end, indent):
+    """child_spans() for indent=2 output: children start on lines indented `indent` spaces."""
+    is_object = buf[start] == ord('{')
+    # lines at this indent either start a child or close the previous child's container
+    starts = [m.end() for m in _line_start_re(indent).finditer(buf, start, end)
+              if buf[m.end()] not in b']}']
+    children = []
+    for i, pos in enumerate(starts):
+        stop = _rstrip(buf, starts[i + 1]) - 1 if i + 1 < len(starts) else _rstrip(buf, end - 1)
+        key = None
+        if is_object:
+            m = _STRING.match(buf, pos)
+            key = _decode_key(buf, m)
+            pos = _skip_ws(buf, m.end() + 1)
+        children.append((key, pos, stop))
+    return children
+
+
+def child_spans(buf, start, end=None, indent=None):
+    """[(key or None, value start, value end)] for the container opening at buf[start].
+
+    Keys are decoded (they're short); values are only located. With `indent`
+    (the children's indentation in an indent=2 file) and the container's `end`,
+    the line-based fast path is used.
+    """
+    if indent is not None:
+        return _indented_child_spans(buf, start, end, indent)
+    is_object = buf[start] == ord('{')
+    children = []
+    depth = 0
+    key = None
+    child_start = None
+    for m in _TOKEN.finditer(buf, start):
+        kind = m.lastgroup
+        if kind == 'open':
+            depth += 1
+            if depth == 1 and not is_object:
+                child_start = _skip_ws(buf, m.end())
+        elif kind == 'close':
+            depth -= 1
+            if depth == 0:
+                end = _rstrip(buf, m.start())
+                if child_start is not None and child_start < end:
+                    children.append((key, child_start, end))
+                return children
+        elif depth != 1:
+            continue
+        elif kind == 'str':
+            if is_object and key is None:
+                key = _decode_key(buf, m)
+        elif kind == 'colon':
+            child_start = _skip_ws(buf, m.end())
+        elif kind == 'comma':
+            children.append((key, child_start, _rstrip(buf, m.start())))
+            key = None
+            child_start = None if is_object else _skip_ws(buf, m.end())
+    raise ValueError(f"unterminated container at byte {start}")
+
+
+class LazyRecord(Mapping):
+    """Read-only mapping over one JSON object in the buffer; fields decode on access."""
+
+    def __init__(self, buf, start, end, indent=None):
+        self._buf = buf
+        self._start = start
+        self._end = end
+        self._indent = indent
+        self._spans = None
+        self._values = {}
+
+    def _field_spans(self):
+        if self._spans is None:
+            self._spans = {key: (s, e) for key, s, e
+                           in child_spans(self._buf, self._start, self._end, self._indent)}
+        return self._spans
+
+    def __getitem__(self, key):
+        if key not in self._values:
+            s, e = self._field_spans()[key]
+            self._values[key] = json.loads(self._buf[s:e])
+        return self._values[key]
+
+    def __iter__(self):
+        return iter(self._field_spans())
+
+    def __len__(self):
+        return len(self._field_spans())
+
+    def raw(self):
+        return self._buf[self._start:self._end]
+
+    def decode(self):
+        """The whole record as a plain dict."""
+        return json.loads(self.raw())
+
+
+class LazyArray(Sequence):
+    """Read-only sequence over one JSON array in the buffer.
+
+    Object elements come back as LazyRecord, anything else is decoded.
+    """
+
+    def __init__(self, buf, start, end, indent=None):
+        self._buf = buf
+        self._start = start
+        self._end = end
+        self._indent = indent
+        self._spans = None
+        self._items = {}
+
+    def _element_spans(self):
+        if self._spans is None:
+            self._spans = [(s, e) for _, s, e
+                           in child_spans(self._buf, self._start, self._end, self._indent)]
+        return self._spans
+
+    def _child_indent(self):
+        return None if self._indent is None else self._indent + 2
+
+    def __len__(self):
+        return len(self._element_spans())
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        spans = self._element_spans()
+        if i < 0:
+            i += len(spans)
+        if i not in self._items:
+            s, e = spans[i]
+            if self._buf[s] == ord('{'):
+                self._items[i] = LazyRecord(self._buf, s, e, self._child_indent())
+            else:
+                self._items[i] = json.loads(self._buf[s:e])
+        return self._items[i]
+
+    def raw(self, i):
+        s, e = self._element_spans()[i]
+        return self._buf[s:e]
+
+    def decode(self):
+        return json.loads(self._buf[self._start:self._end])
+
+
+class LazySeed(Mapping):
+    """Lazily decoded view of a seed file's top-level sections.
+
+        with LazySeed('data/seed.json') as seed:
+            ratings = {t['slug']: t['rating_avg'] for t in seed['tools']}
+
+    Array sections come back as LazyArray, other sections are decoded.
+    The mapping must not be used after close().
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._buf = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        start = _skip_ws(self._buf, 0)
+        end = _rstrip(self._buf, len(self._buf))
+        # indent=2 layout: "{" then the first key on its own line, two spaces in
+        self._indent = 2 if self._buf[start:start + 5] == b'{\n  "' else None
+        self._spans = {key: (s, e) for key, s, e
+                       in child_spans(self._buf, start, end, self._indent)}
+        self._sections = {}
+
+    def __getitem__(self, name):
+        if name not in self._sections:
+            s, e = self._spans[name]
+            if self._buf[s] == ord('['):
+                indent = None if self._indent is None else self._indent + 2
+                self._sections[name] = LazyArray(self._buf, s, e, indent)
+            else:
+                self._sections[name] = json.loads(self._buf[s:e])
+        return self._sections[name]
+
+    def __iter__(self):
+        return iter(self._spans)
+
+    def __len__(self):
+        return len(self._spans)
+
+    @property
+    def tools(self):
+        return self['tools']
+
+    def span(self, name):
+        """(start, end) byte offsets of a section's value."""
+        return self._spans[name]
+
+    def close(self):
+        self._sections.clear()
+        self._buf.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,124 @@
+"""Content lint rules for tool records, fanned out over a process pool"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlsplit
+
+DESCRIPTION_MAX = 150
+DESCRIPTION_MIN = 20
+LONG_DESCRIPTION_MAX = 2000
+PRICING_SECTION = '【요금제】'
+
+# (field, min, max) item counts; below min or above max is a warning
+COUNT_LIMITS = (
+    ('pros', 3, 7),
+    ('cons', 2, 6),
+    ('usage_tips', 3, 10),
+    ('tags', 3, 15),
+)
+URL_FIELDS = ('url', 'logo_url')
+# collect-500-ai-services.mjs fills a missing description with "<name> - AI 도구"
+PLACEHOLDER_SUFFIX = ' - AI 도구'
+
+ERROR = 'error'
+WARNING = 'warning'
+
+
+class Finding:
+    __slots__ = ('source', 'position', 'slug', 'rule', 'severity', 'message')
+
+    def __init__(self, source, position, slug, rule, severity, message):
+        self.source = source
+        self.position = position
+        self.slug = slug
+        self.rule = rule
+        self.severity = severity
+        self.message = message
+
+    def __repr__(self):
+        return f"{self.source}#{self.position} {self.slug}: {self.severity} {self.rule}: {self.message}"
+
+
+def is_placeholder(key, value, record):
+    """True for the "<name> - AI 도구" stub collect-500-ai-services.mjs puts in description."""
+    return key == 'description' and value == f"{record.get('name')}{PLACEHOLDER_SUFFIX}"
+
+
+def _valid_url(value):
+    try:
+        parts = urlsplit(value)
+    except ValueError:
+        return False
+    return parts.scheme in ('http', 'https') and '.' in parts.netloc and ' ' not in value
+
+
+def lint_tool(tool):
+    """[(rule, severity, message)] for one tool record."""
+    problems = []
+
+    description = tool.get('description') or ''
+    if len(description) < DESCRIPTION_MIN:
+        problems.append(('description-length', ERROR if not description else WARNING,
+                         f"description is {len(description)} chars (min {DESCRIPTION_MIN})"))
+    elif len(description) > DESCRIPTION_MAX:
+        problems.append(('description-length', ERROR,
+                         f"description is {len(description)} chars (max {DESCRIPTION_MAX})"))
+
+    long_description = tool.get('long_description') or ''
+    if not long_description:
+        problems.append(('long-description-missing', WARNING, "long_description is empty"))
+    else:
+        if len(long_description) > LONG_DESCRIPTION_MAX:
+            problems.append(('long-description-length', ERROR,
+                             f"long_description is {len(long_description)} chars (max {LONG_DESCRIPTION_MAX})"))
+        if PRICING_SECTION not in long_description:
+            problems.append(('pricing-section', WARNING, f"long_description has no {PRICING_SECTION} section"))
+
+    for field, low, high in COUNT_LIMITS:
+        n = len(tool.get(field) or [])
+        if n < low or n > high:
+            problems.append((f"{field}-count", WARNING, f"{n} {field} (expected {low}-{high})"))
+
+    seen = {}
+    for tag in tool.get('tags') or []:
+        key = tag.strip().casefold() if isinstance(tag, str) else tag
+        if key in seen:
+            problems.append(('duplicate-tag', ERROR, f"tag {tag!r} duplicates {seen[key]!r}"))
+        else:
+            seen[key] = tag
+
+    for field in URL_FIELDS:
+        value = tool.get(field)
+        if value is None and field != 'url':
+            continue
+        if not isinstance(value, str) or not _valid_url(value):
+            problems.append(('url-format', ERROR, f"{field} is not an http(s) URL: {value!r:.60}"))
+
+    return problems
+
+
+def lint_chunk(source, start, tools):
+    findings = []
+    for offset, tool in enumerate(tools):
+        slug = tool.get('slug', '?')
+        for rule, severity, message in lint_tool(tool):
+            findings.append(Finding(source, start + offset, slug, rule, severity, message))
+    return findings
+
+
+def lint_records(sources, jobs=None, chunk_size=64):
+    """Lint every tool of every (source name, tools list) pair.
+
+    Records are split into chunks and fanned out over a ProcessPoolExecutor
+    (jobs=1 runs inline). Findings come back ordered by source, then position.
+    """
+    chunks = [
+        (source, start, tools[start:start + chunk_size])
+        for source, tools in sources
+        for start in range(0, len(tools), chunk_size)
+    ]
+    if jobs == 1 or len(chunks) <= 1:
+        results = [lint_chunk(*chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs or min(len(chunks), os.cpu_count() or 1)) as pool:
+            results = list(pool.map(lint_chunk, *zip(*chunks)))
+    return [finding for chunk_findings in results for finding in chunk_findings]
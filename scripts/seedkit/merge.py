@@ -0,0 +1,296 @@
+"""Merge candidate tools (data/ai-tools-500.json) into a seed file
+
+Candidates are matched to seed tools by a hash join on slug, then on
+normalized URL domain (hostname, lowercased, without www.; owner/repo is
+kept for code hosts) for candidates whose slug is not in the seed. Only the
+seed's slug and url are read for the join (through LazySeed); the merged file
+is then written in one streaming pass (seedkit.stream), so the seed document
+is never held in memory.
+
+Per-field precedence for a matched pair:
+- KEEP_SEED fields (identity, pipeline-computed metrics) always keep the seed value.
+- Fields passed as `prefer` take the candidate's value when it has one.
+- Everything else keeps the seed value and only fills it when the seed's is empty,
+  so enriched text is never overwritten by a candidate's None or [].
+
+Where both sides hold different non-empty values the resolution is recorded
+as a conflict. Placeholder descriptions of collected candidates ("<name> - AI
+도구") count as empty.
+
+Candidates that match no seed tool are added with a UUID id (uuid5 of the
+slug, so reruns give the same ids), a category_id from the seed's categories
+(retired ids are mapped as unify-categories.mjs did; a candidate left without
+a category is rejected) and a primary tool_categories row. The merged file is
+checked for referential integrity as it is written, and the write is abandoned
+if the merge introduced a broken reference.
+"""
+import os
+import uuid
+from urllib.parse import urlsplit
+
+from seedkit import journal
+from seedkit.engine import HashingWriter
+from seedkit.integrity import IntegrityChecker, check_sections
+from seedkit.lazy import LazySeed
+from seedkit.lint import is_placeholder
+from seedkit.storage import atomic_write
+from seedkit.stream import StreamedArray, SeedWriter, iter_sections
+
+KEEP_SEED = frozenset((
+    'id', 'slug', 'created_at', 'updated_at',
+    'rating_avg', 'review_count', 'visit_count', 'upvote_count', 'bookmark_count',
+    'ranking_score', 'weekly_visit_delta', 'prev_ranking',
+    'hybrid_score', 'external_score', 'internal_score', 'trend_direction', 'trend_magnitude',
+    'confidence_level', 'confidence_source_count', 'rating_sources', 'is_editor_pick',
+))
+# Hosts serving many products; their first two path segments are part of the join key
+SHARED_HOSTS = frozenset(('github.com', 'gitlab.com', 'huggingface.co'))
+# Values for fields a candidate record lacks when it is added as a new tool
+NEW_TOOL_DEFAULTS = {
+    'bookmark_count': 0,
+    'confidence_level': 'none',
+    'confidence_source_count': 0,
+    'rating_sources': [],
+}
+
+# Category ids retired by unify-categories.mjs -> the category that absorbed them (None: dropped)
+RETIRED_CATEGORIES = {
+    'abdcd10c-02d6-4830-bb06-f0db65093353': '61b550b2-1563-407b-a059-b8957ba0fa5d',  # voice -> music
+    'ca1a1250-a8e3-4dd6-8994-bda300aec46a': '8dc40214-996b-401f-a8bd-fead730c4292',  # data-analysis -> data
+    '8fe946e1-e686-4efa-a51a-2aff6d240f88': None,  # learning
+    '98d51ac5-bd69-45f6-8651-48346755cfc6': 'e052e3cb-1613-4dc3-95c9-8fb66fa1bda8',  # entertainment -> chat
+    'e9f8c3a1-4b6d-4f2e-9c5a-7e8d9f0a1b2c': '118a92a9-2e3e-490a-a5ca-059026ceb89c',  # -> coding
+    'f1a2b3c4-5d6e-4f7a-8b9c-0d1e2f3a4b5c': '8dc40214-996b-401f-a8bd-fead730c4292',  # -> data
+    'c3d4e5f6-7a8b-4c9d-0e1f-2a3b4c5d6e7f': '61b550b2-1563-407b-a059-b8957ba0fa5d',  # -> music
+    'd83f8a62-2f56-43a6-8c8b-3f40c4d8f6d0': 'b4c4412f-805c-409b-8cd4-de074f47ee58',  # -> automation
+}
+# uuid5 namespace of the ids given to added tools
+TOOL_ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, 'seed:tools')
+
+
+class MergeError(Exception):
+    """The merged seed would have broken references; nothing was written."""
+
+
+def normalize_domain(url):
+    """Hostname of `url`, lowercased and without a leading www. (merge-with-existing.mjs normalizeUrl)."""
+    if not url:
+        return None
+    parts = urlsplit(url if '//' in url else f"//{url}")
+    host = parts.hostname
+    if not host:
+        return url.strip().lower()
+    host = host[4:] if host.startswith('www.') else host
+    if host in SHARED_HOSTS:
+        path = [p for p in parts.path.lower().split('/') if p][:2]
+        return '/'.join([host] + path)
+    return host
+
+
+def is_empty(value):
+    return value is None or value == '' or value == [] or value == {}
+
+
+def resolve_category(category_id, category_ids):
+    """`category_id` if the seed has it, else its replacement from RETIRED_CATEGORIES, else None."""
+    if category_id in category_ids:
+        return category_id
+    category_id = RETIRED_CATEGORIES.get(category_id)
+    return category_id if category_id in category_ids else None
+
+
+class MergeReport:
+    """Outcome of merge_candidates()."""
+
+    def __init__(self):
+        self.path = None
+        # seed slug -> (candidate slug, 'slug' | 'domain')
+        self.matched = {}
+        self.added = []
+        # (seed slug, field) for every empty seed field filled from a candidate
+        self.filled = []
+        # (seed slug, field, seed value, candidate value, kept: 'seed' | 'candidate')
+        self.conflicts = []
+        # (candidate slug, reason, detail) for candidates neither merged nor added
+        self.rejected = []
+        # (candidate slug, category_id as collected, category_id used)
+        self.recategorized = []
+        # seedkit.integrity.IntegrityReport of the merged seed
+        self.integrity = None
+        self.digest = None
+
+    def __repr__(self):
+        return (f"MergeReport(matched={len(self.matched)}, added={len(self.added)}, "
+                f"filled={len(self.filled)}, conflicts={len(self.conflicts)}, "
+                f"rejected={len(self.rejected)})")
+
+
+def merge_fields(tool, candidate, report, prefer=()):
+    """Apply the field precedence of one matched candidate onto `tool` in place."""
+    slug = tool['slug']
+    for key, theirs in candidate.items():
+        if key in KEEP_SEED or is_empty(theirs) or is_placeholder(key, theirs, candidate):
+            continue
+        ours = tool.get(key)
+        if is_empty(ours) or is_placeholder(key, ours, tool):
+            tool[key] = theirs
+            report.filled.append((slug, key))
+        elif ours != theirs:
+            if key == 'url' and normalize_domain(ours) == normalize_domain(theirs):
+                continue
+            kept = 'candidate' if key in prefer else 'seed'
+            if kept == 'candidate':
+                tool[key] = theirs
+            report.conflicts.append((slug, key, ours, theirs, kept))
+
+
+def join(seed_keys, candidates, report):
+    """Hash-join candidates onto seed positions.
+
+    `seed_keys` is [(slug, domain)] in seed order. Returns ({seed position:
+    candidate}, [candidates to add]).
+    """
+    by_slug = {slug: pos for pos, (slug, _) in enumerate(seed_keys)}
+    by_domain = {}
+    for pos, (_, domain) in enumerate(seed_keys):
+        if domain:
+            by_domain.setdefault(domain, []).append(pos)
+
+    matches = {}
+    new = []
+    seen = set()
+    # Slug matches first, so a domain match can't claim a tool another candidate owns by slug
+    ordered = sorted(candidates, key=lambda c: c.get('slug') not in by_slug)
+    for candidate in ordered:
+        slug = candidate.get('slug')
+        if slug in seen:
+            report.rejected.append((slug, 'duplicate-candidate', 'slug already seen in candidates'))
+            continue
+        seen.add(slug)
+        pos, how = by_slug.get(slug), 'slug'
+        if pos is None:
+            domain = normalize_domain(candidate.get('url'))
+            positions = by_domain.get(domain, [])
+            if len(positions) > 1:
+                owners = ', '.join(seed_keys[p][0] for p in positions)
+                report.rejected.append((slug, 'ambiguous-domain', f"{domain}: {owners}"))
+                continue
+            pos, how = (positions[0], 'domain') if positions else (None, None)
+        if pos is None:
+            new.append(candidate)
+        elif pos in matches:
+            report.rejected.append((slug, 'already-matched',
+                                    f"{seed_keys[pos][0]} matched {matches[pos].get('slug')}"))
+        else:
+            matches[pos] = candidate
+            report.matched[seed_keys[pos][0]] = (slug, how)
+    # Added tools keep the candidates' file order
+    order = {id(c): i for i, c in enumerate(candidates)}
+    new.sort(key=lambda c: order[id(c)])
+    return matches, new
+
+
+def new_tool(candidate, template_keys, used_ids):
+    """A candidate shaped like a seed tool: seed key order, defaults for missing fields.
+
+    The candidate's own id (tool-N) is replaced by a UUID derived from its slug.
+    """
+    tool = {key: candidate.get(key, NEW_TOOL_DEFAULTS.get(key)) for key in template_keys}
+    tool.update((key, value) for key, value in candidate.items() if key not in tool)
+    tool['id'] = str(uuid.uuid5(TOOL_ID_NAMESPACE, tool['slug']))
+    if tool['id'] in used_ids:
+        raise MergeError(f"{tool['slug']}: generated id {tool['id']} is already in the seed")
+    used_ids.add(tool['id'])
+    return tool
+
+
+def category_row(tool):
+    """The primary tool_categories row of an added tool."""
+    return {'tool_id': tool['id'], 'category_id': tool['category_id'], 'is_primary': True,
+            'sort_order': 0, 'created_at': tool.get('created_at')}
+
+
+def recategorize(candidates, category_ids, report):
+    """Candidates with category_id resolved against the seed's categories (copies where changed).
+
+    A matched candidate without a usable category just doesn't bring one;
+    report.recategorized lists every id that was mapped or dropped.
+    """
+    out = []
+    for candidate in candidates:
+        collected = candidate.get('category_id')
+        resolved = resolve_category(collected, category_ids)
+        if resolved != collected:
+            report.recategorized.append((candidate.get('slug'), collected, resolved))
+            candidate = {**candidate, 'category_id': resolved}
+        out.append(candidate)
+    return out
+
+
+def _problems(check):
+    """Broken references of an IntegrityReport, without positions, for before/after comparison."""
+    return ({(section, field, value) for section, _, field, value in check.dangling + check.orphans}
+            | set(check.duplicates))
+
+
+def merge_candidates(seed_path, candidates, out_path, prefer=()):
+    """Write seed_path merged with `candidates` to out_path (may be seed_path itself).
+
+    `prefer` names fields where a non-empty candidate value wins over the seed's.
+    Raises MergeError, leaving out_path untouched, if the merged seed has a
+    broken reference the input did not have.
+    """
+    if os.path.exists(journal.journal_path(seed_path)):
+        raise journal.JournalError(
+            f"{journal.journal_path(seed_path)} has pending entries; compact it before merging")
+    prefer = frozenset(prefer) - KEEP_SEED
+    report = MergeReport()
+    report.path = out_path
+    with LazySeed(seed_path) as lazy:
+        seed_keys = [(t.get('slug'), normalize_domain(t.get('url'))) for t in lazy.tools]
+        used_ids = {t.get('id') for t in lazy.tools}
+        template_keys = list(lazy.tools[0].keys()) if len(lazy.tools) else list(candidates[0])
+        category_ids = {c.get('id') for c in lazy['categories']} if 'categories' in lazy else set()
+        has_tool_categories = 'tool_categories' in lazy
+    candidates = recategorize(candidates, category_ids, report)
+    matches, new = join(seed_keys, candidates, report)
+    for candidate in new:
+        if candidate.get('category_id') is None:
+            report.rejected.append((candidate.get('slug'), 'no-category',
+                                    'category_id is not one of the seed categories'))
+    new = [c for c in new if c.get('category_id') is not None]
+    added = [new_tool(candidate, template_keys, used_ids) for candidate in new]
+    report.added = [tool['slug'] for tool in added]
+    baseline = _problems(check_sections(iter_sections(seed_path)))
+    checker = IntegrityChecker()
+
+    with atomic_write(out_path) as f:
+        hashing = HashingWriter(f)
+        writer = SeedWriter(hashing)
+        for name, value in iter_sections(seed_path):
+            if name not in ('tools', 'tool_categories'):
+                if isinstance(value, StreamedArray):
+                    writer.write_array(name, checker.add_rows(name, value))
+                else:
+                    writer.write_value(name, value)
+                continue
+            writer.begin_array(name)
+            for pos, row in enumerate(value):
+                if name == 'tools' and pos in matches:
+                    merge_fields(row, matches[pos], report, prefer)
+                checker.add(name, row)
+                writer.write_item(row)
+            for row in (added if name == 'tools' else map(category_row, added)):
+                checker.add(name, row)
+                writer.write_item(row)
+            writer.end_array()
+        if not has_tool_categories and added:
+            writer.write_array('tool_categories', checker.add_rows('tool_categories', map(category_row, added)))
+        writer.close()
+        report.integrity = checker.finish()
+        introduced = _problems(report.integrity) - baseline
+        if introduced:
+            raise MergeError("merge would break references: " + ', '.join(
+                f"{section}.{field} = {value!r}" for section, field, value in sorted(introduced, key=repr)))
+    report.digest = hashing.sha.hexdigest()
+    return report
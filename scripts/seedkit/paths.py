@@ -0,0 +1,39 @@
+"""Repo-relative locations of the seed files, with env/CLI overrides"""
+import os
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DATA_DIR = os.path.join(REPO_ROOT, 'data')
+SEED_PATH = os.path.join(DATA_DIR, 'seed.json')
+
+# Seed variants a batch can be applied to alongside the canonical seed.json
+SEED_VARIANTS = ('seed.json', 'seed-merged.json', 'seed-fixed-showcases.json')
+
+# os.pathsep-separated list of seed files, used when no --seed flag is given
+SEED_ENV_VAR = 'AIPICK_SEED_PATH'
+
+
+def resolve_seed_path(path):
+    """Absolute path for `path`; bare names that don't exist in the cwd are looked up in data/."""
+    path = os.path.expanduser(path)
+    if os.path.isabs(path) or os.path.exists(path):
+        return os.path.abspath(path)
+    return os.path.join(DATA_DIR, path)
+
+
+def resolve_seed_paths(paths=None, variants=False):
+    """Seed files to operate on: explicit paths, else $AIPICK_SEED_PATH, else data/seed.json.
+
+    With variants=True the SEED_VARIANTS files in data/ are added. Duplicates
+    are dropped, order is preserved.
+    """
+    if not paths:
+        env = os.environ.get(SEED_ENV_VAR)
+        paths = [p for p in env.split(os.pathsep) if p] if env else [SEED_PATH]
+    if variants:
+        paths = list(paths) + list(SEED_VARIANTS)
+    resolved = []
+    for path in paths:
+        path = resolve_seed_path(path)
+        if path not in resolved:
+            resolved.append(path)
+    return resolved
@@ -0,0 +1,128 @@
+"""Offline port of lib/pipeline/rating-aggregator.ts over the whole catalog at once
+
+aggregate_ratings() computes rating_avg, review_count, rating_sources,
+confidence_level and confidence_source_count for every tool from
+tool_external_scores.raw_data, the way /api/cron/aggregate-ratings does per
+tool. Inputs are laid out as one column per source (see seedkit.columns) and
+reduced source by source, which keeps the floating-point operations in the
+same order as the TS reduce() calls, so results should match it bit for
+bit; scripts/check_rating_parity.py runs the real TS module over a seed and
+checks that, in CI (.github/workflows/rating-parity.yml).
+
+rating_sources follows aggregateRating()'s fixed source order. Values that
+generate-ratings.mjs wrote keep each tool's own order (gamma has
+['product_hunt', 'g2']), so recomputing reorders them without changing the
+rating.
+"""
+import math
+from array import array
+
+from seedkit.columns import NAN, scores_table, tools_table
+
+# lib/constants.ts: DEFAULT_RATING_WEIGHTS, RATING_MIN_REVIEWS, CONFIDENCE_THRESHOLDS
+RATING_WEIGHTS = {
+    'app_store': 30,
+    'play_store': 25,
+    'g2': 20,
+    'trustpilot': 10,
+    'product_hunt': 10,
+    'aipick': 5,
+}
+RATING_MIN_REVIEWS = {
+    'app_store': 100,
+    'play_store': 100,
+    'g2': 10,
+    'trustpilot': 20,
+    'product_hunt': 5,
+    'aipick': 5,
+}
+CONFIDENCE_THRESHOLDS = (('high', 5), ('medium', 3), ('low', 1))
+# Aggregation order of aggregateRating(); buildRatingDataFromScores() never fills aipick
+RATING_SOURCES = tuple(RATING_WEIGHTS)
+SCORE_SOURCES = ('app_store', 'play_store', 'g2', 'trustpilot', 'product_hunt')
+
+
+def js_round(x):
+    """Math.round(): nearest integer, halves toward +infinity (Python's round() goes to even)."""
+    r = math.floor(x)
+    return r + 1 if x - r >= 0.5 else r
+
+
+def js_number(x):
+    """A float as JSON.stringify would print it: integral values lose their '.0'."""
+    return int(x) if x.is_integer() else x
+
+
+def confidence(source_count):
+    for level, minimum in CONFIDENCE_THRESHOLDS:
+        if source_count >= minimum:
+            return level
+    return 'none'
+
+
+def source_columns(data):
+    """Per-source rating and review columns aligned with data['tools'].
+
+    Like buildRatingDataFromScores(), a later tool_external_scores row for the
+    same tool and source replaces an earlier one; a missing rating is NaN (null)
+    and a missing review_count is 0.
+    """
+    tools = tools_table(data)
+    scores = scores_table(data)
+    n = len(tools)
+    ratings = {key: array('d', [NAN]) * n for key in RATING_SOURCES}
+    reviews = {key: array('d', [0.0]) * n for key in RATING_SOURCES}
+    rows = [tools['slug'].code(slug) for slug in scores['tool'].labels]
+    sources = [key if key in SCORE_SOURCES else None for key in scores['source_key'].labels]
+    for tool, source, rating, count in zip(scores['tool'].codes, scores['source_key'].codes,
+                                           scores['rating'], scores['review_count']):
+        if tool < 0 or source < 0 or sources[source] is None:
+            continue
+        key, row = sources[source], rows[tool]
+        ratings[key][row] = rating
+        reviews[key][row] = 0.0 if count != count else count
+    return tools, ratings, reviews
+
+
+def aggregate_ratings(data, weights=None):
+    """aggregateRating() for every tool. Returns {slug: fields} for tools with at least one source.
+
+    `weights` overrides RATING_WEIGHTS per source, like the rating_agg_* keys of
+    scoring_weights. Tools with no usable source are left out, as the cron
+    skips them.
+    """
+    weights = {**RATING_WEIGHTS, **(weights or {})}
+    tools, ratings, reviews = source_columns(data)
+    n = len(tools)
+    weighted = array('d', [0.0]) * n
+    total_weight = array('d', [0.0]) * n
+    total_reviews = array('d', [0.0]) * n
+    used = [[] for _ in range(n)]
+
+    for key in RATING_SOURCES:
+        weight = weights[key]
+        minimum = RATING_MIN_REVIEWS.get(key, 0)
+        rating_col, review_col = ratings[key], reviews[key]
+        for i in range(n):
+            rating, count = rating_col[i], review_col[i]
+            total_reviews[i] += count
+            # NaN fails every comparison, like the null check in the TS filter
+            if 0 < rating <= 5 and count >= minimum and weight > 0:
+                weighted[i] += min(rating, 5) * weight
+                total_weight[i] += weight
+                used[i].append(key)
+
+    slugs = tools['slug']
+    results = {}
+    for i in range(n):
+        if not used[i]:
+            continue
+        rating = js_round(weighted[i] / total_weight[i] * 10) / 10
+        results[slugs[i]] = {
+            'rating_avg': js_number(max(1.0, min(5.0, rating))),
+            'review_count': js_number(total_reviews[i]),
+            'rating_sources': used[i],
+            'confidence_level': confidence(len(used[i])),
+            'confidence_source_count': len(used[i]),
+        }
+    return results
@@ -0,0 +1,185 @@
+"""Per-tool read model: one precomputed JSON document per tool slug
+
+The web app's seed fallback (lib/supabase/queries.ts) rebuilds a tool page
+from the whole seed on every request: attachCategoriesToTools() scans
+tool_categories, getToolExternalScores()/getToolBenchmarks()/getToolUpdates()
+filter their sections by tool_id, getToolShowcases() filters tool_showcases
+by slug and looks up each category showcase. build_documents() does the same
+joins once, over SeedIndex groupings, and write_read_model() stores the
+result as <dir>/<slug>.json next to a manifest, so a detail page can load a
+few KB instead of importing all of seed.json. The package.json prebuild
+script runs build_read_model.py when python3 is available (the build goes on
+without it). getToolBySlug(), getToolShowcases(), getToolBenchmarks(),
+getToolExternalScores(), getToolUpdates() and getSimilarTools() (which follows
+the document's similar_tools slugs) read data/tools/<slug>.json, and
+getToolSlugs() the manifest, falling back to the seed when they are missing.
+
+Every document carries the sha256 of the seed file it was built from
+(seed_sha256), and a small stamp (_stamp.json; not a valid slug) records
+that sha256 with the file's size and mtime. queries.ts compares the stamp
+with a stat() of data/seed.json and the document with the stamp, falling
+back to the seed joins on any mismatch, so a stale read model is never served
+after a seed edit and the seed is never read or hashed at request time.
+
+Documents are written compactly and only when their bytes change; the
+manifest records each file's sha256 and the seed state it was built from.
+The stamp is written last.
+"""
+import hashlib
+import json
+import os
+import re
+
+from seedkit.index import SeedIndex
+from seedkit.storage import atomic_write, file_digest
+
+MANIFEST = 'manifest.json'
+STAMP = '_stamp.json'
+FORMAT = 2
+
+_SAFE_SLUG = re.compile(r'[a-z0-9][a-z0-9._-]*$')
+
+
+def tool_categories(tool, index, categories):
+    """categories/primary_category_id as attachCategoriesToTools() computes them."""
+    rows = index.rows('tool_categories', tool['slug'])
+    if not rows:
+        category = categories.get(tool.get('category_id'))
+        return ([{**category, 'is_primary': True}] if category else []), tool.get('category_id')
+    attached = [{**categories[row['category_id']], 'is_primary': row.get('is_primary')}
+                for row in rows if row.get('category_id') in categories]
+    attached.sort(key=lambda c: not c['is_primary'])
+    primary = next((c for c in attached if c['is_primary']), None)
+    return attached, primary['id'] if primary else None
+
+
+class SimilarTools:
+    """Slugs getSimilarTools() ranks for a tool: its primary category's tools by rating_avg."""
+
+    def __init__(self, data):
+        self.tools = data['tools']
+        links = data.get('tool_categories')
+        # No tool_categories section at all: the legacy category_id branch
+        self.members = None if links is None else {}
+        for row in links or []:
+            if row.get('is_primary'):
+                self.members.setdefault(row.get('category_id'), set()).add(row.get('tool_id'))
+        self._ranked = {}
+
+    def ranked(self, category_id):
+        # Legacy branch also when the tool has no primary category, as in queries.ts
+        legacy = self.members is None or category_id is None
+        ranked = self._ranked.get((legacy, category_id))
+        if ranked is None:
+            if legacy:
+                tools = [t for t in self.tools if t.get('category_id') == category_id]
+            else:
+                ids = self.members.get(category_id, ())
+                tools = [t for t in self.tools if t['id'] in ids]
+            # Stable, like Array.prototype.sort: ties keep seed order
+            tools.sort(key=lambda t: -(t.get('rating_avg') or 0))
+            ranked = self._ranked[legacy, category_id] = [(t['id'], t['slug']) for t in tools]
+        return ranked
+
+    def of(self, tool, attached):
+        primary = next((c for c in attached if c['is_primary']), attached[0] if attached else None)
+        category_id = primary['id'] if primary else None
+        return [slug for tool_id, slug in self.ranked(category_id) if tool_id != tool['id']]
+
+
+def build_document(tool, index, categories, showcases, similar, seed_sha256=None):
+    """The read-model document of one tool."""
+    slug = tool['slug']
+    attached, primary = tool_categories(tool, index, categories)
+    return {
+        'seed_sha256': seed_sha256,
+        'tool': {**tool, 'categories': attached, 'primary_category_id': primary},
+        'external_scores': index.rows('tool_external_scores', slug),
+        'benchmark_scores': index.rows('tool_benchmark_scores', slug),
+        'showcases': [{**row, 'showcase': showcases.get(row.get('showcase_id'))}
+                      for row in index.rows('tool_showcases', slug)],
+        # getToolUpdates(): newest first
+        'updates': sorted(index.rows('tool_updates', slug),
+                          key=lambda u: u.get('announced_at') or '', reverse=True),
+        'similar_tools': similar.of(tool, attached),
+    }
+
+
+def build_documents(data, seed_sha256=None):
+    """Yield (slug, document) for every tool, in seed order."""
+    index = SeedIndex(data)
+    categories = {c['id']: c for c in data.get('categories') or []}
+    showcases = {s['id']: s for s in data.get('category_showcases') or []}
+    similar = SimilarTools(data)
+    for tool in data['tools']:
+        yield tool['slug'], build_document(tool, index, categories, showcases, similar, seed_sha256)
+
+
+def encode(document):
+    return json.dumps(document, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def load_manifest(dirpath):
+    try:
+        with open(os.path.join(dirpath, MANIFEST), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return manifest if manifest.get('format') == FORMAT else None
+
+
+def seed_source(path):
+    """The stamp of a seed file: its sha256, size and mtime (ns, as a string: JS numbers can't hold it)."""
+    st = os.stat(path)
+    return {'seed_sha256': file_digest(path), 'seed_size': st.st_size, 'seed_mtime_ns': str(st.st_mtime_ns)}
+
+
+def write_read_model(data, dirpath, source=None):
+    """Write <dirpath>/<slug>.json for every tool and drop files of removed tools.
+
+    `source` describes the seed file the documents came from (as read by
+    load_seed(), without its journal: the app reads the file itself), as
+    seed_source() returns it. It is recorded in the manifest and the stamp,
+    and its seed_sha256 in every document.
+    Returns (written, unchanged, removed) slug lists.
+    """
+    os.makedirs(dirpath, exist_ok=True)
+    previous = (load_manifest(dirpath) or {}).get('tools', {})
+    entries = {}
+    written, unchanged = [], []
+    for slug, document in build_documents(data, source['seed_sha256'] if source else None):
+        if not _SAFE_SLUG.match(slug):
+            raise ValueError(f"slug not usable as a file name: {slug!r}")
+        body = encode(document)
+        entry = {'file': f"{slug}.json", 'sha256': hashlib.sha256(body).hexdigest(), 'bytes': len(body)}
+        entries[slug] = entry
+        path = os.path.join(dirpath, entry['file'])
+        if previous.get(slug) == entry and os.path.exists(path):
+            unchanged.append(slug)
+            continue
+        with atomic_write(path, 'wb') as f:
+            f.write(body)
+        written.append(slug)
+    removed = [slug for slug in previous if slug not in entries]
+    for slug in removed:
+        try:
+            os.unlink(os.path.join(dirpath, previous[slug]['file']))
+        except FileNotFoundError:
+            pass
+    manifest = {'format': FORMAT, 'source': source, 'tools': entries}
+    with atomic_write(os.path.join(dirpath, MANIFEST)) as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    with atomic_write(os.path.join(dirpath, STAMP)) as f:
+        json.dump(source, f)
+    return written, unchanged, removed
+
+
+def read_document(dirpath, slug):
+    """Load one tool's document, or None if the read model has no such slug."""
+    if not _SAFE_SLUG.match(slug):
+        return None
+    try:
+        with open(os.path.join(dirpath, f"{slug}.json"), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
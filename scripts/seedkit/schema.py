@@ -0,0 +1,268 @@
+"""Validate UPDATES payloads against the tools table implied by supabase/migrations
+
+The column list is rebuilt from `CREATE TABLE tools` plus every later
+`ALTER TABLE tools ADD/DROP COLUMN`, then compiled once into one check
+function per column, so validating every batch costs a few dict lookups
+per field and never touches seed.json.
+"""
+import difflib
+import functools
+import glob
+import math
+import os
+import re
+from datetime import datetime
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+
+from seedkit.paths import REPO_ROOT
+
+MIGRATIONS_DIR = os.path.join(REPO_ROOT, 'supabase', 'migrations')
+
+# UPDATES value marking a slug that was intentionally left alone
+SKIP = "SKIP"
+
+# Columns seed.json still carries outside the migrated tools table:
+# category_id was moved to tool_categories in 015 but the seed fallback keeps it,
+# sample_output* are only exposed through get_tools_by_category, and
+# bookmark_count is maintained by the app.
+SEED_ONLY_COLUMNS = {
+    'category_id': 'TEXT',
+    'sample_output': 'TEXT',
+    'sample_output_prompt': 'TEXT',
+    'bookmark_count': 'INT',
+}
+
+SLUG_RE = re.compile(r'[a-z0-9]+(?:-[a-z0-9]+)*')
+_COLUMN_RE = re.compile(r'(\w+)\s+(\w+)\s*(?:\((\d+)\s*(?:,\s*(\d+))?\))?\s*(\[\])?', re.I)
+_CHECK_IN_RE = re.compile(r'CHECK\s*\(\s*\w+\s+IN\s*\(([^)]*)\)\s*\)', re.I)
+
+
+class SchemaError(ValueError):
+    def __init__(self, issues):
+        self.issues = issues
+        super().__init__(f"{len(issues)} invalid UPDATES entries:\n  " + '\n  '.join(issues))
+
+
+class Column:
+    def __init__(self, name, sql_type, precision=None, scale=None, is_array=False,
+                 not_null=False, enum=None):
+        self.name = name
+        self.sql_type = sql_type.upper()
+        self.precision = precision
+        self.scale = scale
+        self.is_array = is_array
+        self.not_null = not_null
+        self.enum = enum
+
+    def __repr__(self):
+        return f"Column({self.name} {self.sql_type}{'[]' if self.is_array else ''})"
+
+
+def _split_top_level(body):
+    parts, depth, start = [], 0, 0
+    for i, ch in enumerate(body):
+        if ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+        elif ch == ',' and depth == 0:
+            parts.append(body[start:i])
+            start = i + 1
+    parts.append(body[start:])
+    return [p.strip() for p in parts if p.strip()]
+
+
+def parse_column(spec):
+    m = _COLUMN_RE.match(spec)
+    if not m or m.group(1).upper() in ('PRIMARY', 'UNIQUE', 'CONSTRAINT', 'FOREIGN', 'CHECK'):
+        return None
+    name, sql_type, precision, scale, array = m.groups()
+    enum = None
+    check = _CHECK_IN_RE.search(spec)
+    if check:
+        enum = frozenset(re.findall(r"'([^']*)'", check.group(1)))
+    return Column(
+        name, sql_type,
+        precision=int(precision) if precision else None,
+        scale=int(scale) if scale else None,
+        is_array=bool(array),
+        not_null=bool(re.search(r'\bNOT\s+NULL\b', spec, re.I)) or bool(re.search(r'\bPRIMARY\s+KEY\b', spec, re.I)),
+        enum=enum,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def table_schema(table, migrations_dir=MIGRATIONS_DIR):
+    """{column name: Column} for `table` after all migrations, in column order.
+
+    Empty if no migration creates the table.
+    """
+    create = re.compile(rf'CREATE TABLE (?:IF NOT EXISTS )?{re.escape(table)} \((.*)\)$', re.I)
+    alter = re.compile(rf'ALTER TABLE {re.escape(table)} (.*)$', re.I)
+    columns = {}
+    for path in sorted(glob.glob(os.path.join(migrations_dir, '*.sql'))):
+        with open(path, 'r', encoding='utf-8') as f:
+            sql = re.sub(r'--[^\n]*', '', f.read())
+        for statement in sql.split(';'):
+            statement = ' '.join(statement.split())
+            m = create.match(statement)
+            if m:
+                for spec in _split_top_level(m.group(1)):
+                    column = parse_column(spec)
+                    if column:
+                        columns[column.name] = column
+                continue
+            m = alter.match(statement)
+            if not m:
+                continue
+            for action in _split_top_level(m.group(1)):
+                add = re.match(r'ADD COLUMN (?:IF NOT EXISTS )?(.*)$', action, re.I)
+                drop = re.match(r'DROP COLUMN (?:IF EXISTS )?(\w+)', action, re.I)
+                if add:
+                    column = parse_column(add.group(1))
+                    if column:
+                        columns[column.name] = column
+                elif drop:
+                    columns.pop(drop.group(1), None)
+    return columns
+
+
+@functools.lru_cache(maxsize=None)
+def tools_schema(migrations_dir=MIGRATIONS_DIR):
+    """{column name: Column} for the tools table after all migrations, plus SEED_ONLY_COLUMNS."""
+    columns = dict(table_schema('tools', migrations_dir))
+    for name, sql_type in SEED_ONLY_COLUMNS.items():
+        columns.setdefault(name, Column(name, sql_type))
+    return columns
+
+
+def _is_int(v):
+    return isinstance(v, int) and not isinstance(v, bool)
+
+
+def _is_number(v):
+    return isinstance(v, (int, float)) and not isinstance(v, bool)
+
+
+def _is_timestamp(v):
+    if not isinstance(v, str):
+        return False
+    try:
+        datetime.fromisoformat(v.replace('Z', '+00:00'))
+    except ValueError:
+        return False
+    return True
+
+
+def _fits_numeric(v, quantum, limit):
+    """Whether `v` fits NUMERIC(p,s) once rounded to s digits, as Postgres stores it.
+
+    Postgres rounds the decimal text half away from zero first, so 9.95 in a
+    NUMERIC(2,1) is 10.0 and overflows. repr() of a float is the shortest
+    text that reads back as it, i.e. what json.dumps() sends.
+    """
+    if isinstance(v, float) and not math.isfinite(v):
+        return False
+    try:
+        rounded = Decimal(repr(v)).quantize(quantum, rounding=ROUND_HALF_UP)
+    except InvalidOperation:  # more digits than the decimal context holds
+        return False
+    return abs(rounded) < limit
+
+
+_SCALAR_CHECKS = {
+    'TEXT': (lambda v: isinstance(v, str), 'a string'),
+    'UUID': (lambda v: isinstance(v, str), 'a string id'),
+    'INT': (_is_int, 'an integer'),
+    'INTEGER': (_is_int, 'an integer'),
+    'BIGINT': (_is_int, 'an integer'),
+    'NUMERIC': (_is_number, 'a number'),
+    'BOOLEAN': (lambda v: isinstance(v, bool), 'true/false'),
+    'TIMESTAMPTZ': (_is_timestamp, 'an ISO-8601 timestamp'),
+    'JSONB': (lambda v: True, 'JSON'),
+}
+
+
+def _compile_column(column):
+    is_type, expected = _SCALAR_CHECKS.get(column.sql_type, (lambda v: True, column.sql_type))
+    limit = None
+    if column.sql_type == 'NUMERIC' and column.precision:
+        limit = 10 ** (column.precision - (column.scale or 0))
+        quantum = Decimal(1).scaleb(-(column.scale or 0))
+
+    def check_scalar(v):
+        if not is_type(v):
+            return f"expected {expected}, got {type(v).__name__} {v!r:.40}"
+        if column.enum is not None and v not in column.enum:
+            return f"{v!r} not in {sorted(column.enum)}"
+        if limit is not None and not _fits_numeric(v, quantum, limit):
+            return f"{v} exceeds NUMERIC({column.precision},{column.scale or 0})"
+        return None
+
+    def check(v):
+        if v is None:
+            return "NULL not allowed" if column.not_null else None
+        if not column.is_array:
+            return check_scalar(v)
+        if not isinstance(v, list):
+            return f"expected a {column.sql_type}[] list, got {type(v).__name__}"
+        for i, item in enumerate(v):
+            if item is None:
+                return f"[{i}] is null"
+            error = check_scalar(item)
+            if error:
+                return f"[{i}] {error}"
+        return None
+
+    return check
+
+
+@functools.lru_cache(maxsize=None)
+def compile_validator(migrations_dir=MIGRATIONS_DIR):
+    """{column name: check(value) -> error message or None}."""
+    return {name: _compile_column(column) for name, column in tools_schema(migrations_dir).items()}
+
+
+def validate_updates(updates, name='UPDATES', checks=None):
+    """Problems with one UPDATES dict, as 'name:slug.field: message' strings."""
+    if checks is None:
+        checks = compile_validator()
+    if not isinstance(updates, dict):
+        return [f"{name}: expected a dict of slug -> fields, got {type(updates).__name__}"]
+    issues = []
+    for slug, fields in updates.items():
+        where = f"{name}:{slug}"
+        if not isinstance(slug, str) or not SLUG_RE.fullmatch(slug):
+            issues.append(f"{where}: invalid slug")
+        if fields == SKIP:
+            continue
+        if not isinstance(fields, dict):
+            issues.append(f"{where}: expected a dict of fields or \"{SKIP}\", got {fields!r:.40}")
+            continue
+        for field, value in fields.items():
+            check = checks.get(field)
+            if check is None:
+                hint = difflib.get_close_matches(field, checks, n=1)
+                issues.append(f"{where}.{field}: unknown column"
+                              + (f" (did you mean {hint[0]!r}?)" if hint else ""))
+                continue
+            error = check(value)
+            if not error and field == 'slug' and not (isinstance(value, str) and SLUG_RE.fullmatch(value)):
+                error = f"invalid slug {value!r}"
+            if error:
+                issues.append(f"{where}.{field}: {error}")
+    return issues
+
+
+def check_batches(batches, names=None):
+    """Raise SchemaError listing every problem across `batches`; return None if all are valid."""
+    checks = compile_validator()
+    issues = []
+    for i, updates in enumerate(batches):
+        if names:
+            name = names[i]
+        else:
+            name = 'UPDATES' if len(batches) == 1 else f"UPDATES[{i}]"
+        issues.extend(validate_updates(updates, name, checks))
+    if issues:
+        raise SchemaError(issues)
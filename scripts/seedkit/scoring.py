@@ -0,0 +1,263 @@
+"""Batch recompute of hybrid_score, internal/external scores and trends
+
+Weights are the scoring_weights defaults seeded by the migrations: the
+internal_* keys of 004 (AIPICK's own signals) and the hybrid_v2 categories
+of 016 (user reviews, popularity, community, benchmarks). As in
+rating-aggregator.ts, a missing signal's weight is redistributed over the
+signals that are present, and a tool with no external data at all is scored
+on internal signals alone. Count-like inputs are log-scaled before
+normalizeToScale() against the catalog maximum, otherwise one 355M-visit
+tool would push every other tool to zero.
+
+score_catalog() hashes each tool's inputs (plus its current score fields and
+the catalog-wide normalization context) and, given the state of the last
+run, only recomputes tools whose hash changed.
+
+trend_direction/trend_magnitude follow /api/cron/trends, but against this
+job's own history: tools are ranked by rating_avg as that route does, the
+state keeps one {slug: rank} snapshot per run date, and each tool's rank is
+compared with the newest snapshot at least TREND_WINDOW_DAYS old. Without such
+a snapshot the trend fields are left as they are. ranking_score and
+prev_ranking belong to /api/cron/ranking and are not touched.
+"""
+import hashlib
+import json
+import math
+from datetime import date, timedelta
+
+from seedkit.ratings import js_number, js_round
+
+# 004_external_data_pipeline.sql: internal_* (category 'internal')
+INTERNAL_WEIGHTS = {
+    'visit_count': 15,
+    'rating_avg': 15,
+    'review_count': 10,
+    'bookmark_count': 5,
+    'upvote_count': 5,
+}
+# 016_rating_scoring_redesign.sql: cat_* and their sub-weights (category 'hybrid_v2')
+CATEGORY_WEIGHTS = {
+    'user_reviews': 40,
+    'popularity': 25,
+    'community': 25,
+    'benchmarks': 10,
+}
+SIGNAL_WEIGHTS = {
+    'user_reviews': {'app_store': 30, 'play_store': 25, 'g2': 20, 'trustpilot': 10, 'product_hunt': 15},
+    'popularity': {'tranco': 50, 'open_pagerank': 50},
+    'community': {'product_hunt_upvotes': 35, 'github_stars': 40, 'hackernews': 25},
+    'benchmarks': {'lmsys_arena': 50, 'huggingface': 50},
+}
+# 004: "internal 50 + external 50 = 100"
+INTERNAL_SHARE = 0.5
+
+EXTERNAL_SOURCES = ('app_store', 'play_store', 'g2', 'trustpilot', 'product_hunt',
+                    'tranco', 'open_pagerank', 'hackernews')
+BENCHMARK_SLOTS = {'lmsys_chatbot_arena': 'lmsys_arena'}
+LOG_SCALED = ('visit_count', 'review_count', 'bookmark_count', 'upvote_count',
+              'product_hunt_upvotes', 'github_stars')
+SCORE_FIELDS = ('hybrid_score', 'internal_score', 'external_score')
+STATE_SUFFIX = '.scores-state.json'
+STATE_VERSION = 3
+# /api/cron/trends: ranks are compared with the snapshot from 7 days earlier
+TREND_WINDOW_DAYS = 7
+
+
+def state_path(seed_path):
+    return f"{seed_path}{STATE_SUFFIX}"
+
+
+def round_score(value):
+    """lib/scoring roundScore(): two decimals with Math.round semantics."""
+    return js_number(js_round(value * 100) / 100)
+
+
+def normalize_to_scale(value, max_value):
+    """lib/scoring normalizeToScale()."""
+    if max_value <= 0:
+        return 0
+    return min(value / max_value * 100, 100)
+
+
+def _number(value):
+    return value if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+
+
+def signals(data):
+    """{slug: {signal: value or None}} from the tool record and its score/benchmark rows.
+
+    A later row for the same tool and source replaces an earlier one.
+    """
+    by_id = {}
+    result = {}
+    for tool in data['tools']:
+        sig = {key: _number(tool.get(key)) or 0 for key in INTERNAL_WEIGHTS}
+        sig.update(dict.fromkeys(EXTERNAL_SOURCES))
+        sig['product_hunt_upvotes'] = _number(tool.get('product_hunt_upvotes'))
+        sig['github_stars'] = _number(tool.get('github_stars'))
+        sig['lmsys_arena'] = sig['huggingface'] = None
+        by_id[tool.get('id')] = result[tool['slug']] = sig
+    for row in data.get('tool_external_scores') or []:
+        sig = by_id.get(row.get('tool_id'))
+        if sig is not None and row.get('source_key') in EXTERNAL_SOURCES:
+            sig[row['source_key']] = _number(row.get('normalized_score'))
+    for row in data.get('tool_benchmark_scores') or []:
+        sig = by_id.get(row.get('tool_id'))
+        if sig is not None:
+            slot = BENCHMARK_SLOTS.get(row.get('benchmark_source'), 'huggingface')
+            sig[slot] = _number(row.get('overall_score'))
+    return result
+
+
+def context(sigs):
+    """Catalog-wide normalization maxima (log-scaled)."""
+    return {key: max((math.log1p(max(s[key] or 0, 0)) for s in sigs.values()), default=0)
+            for key in LOG_SCALED}
+
+
+def _scaled(sig, key, ctx):
+    value = sig[key]
+    if value is None:
+        return None
+    if key in LOG_SCALED:
+        return normalize_to_scale(math.log1p(max(value, 0)), ctx[key])
+    if key == 'rating_avg':
+        return normalize_to_scale(value, 5)
+    return max(0, min(100, value))
+
+
+def _weighted(pairs):
+    """Weighted mean of (weight, value) pairs, skipping missing values; None if nothing is left."""
+    pairs = [(w, v) for w, v in pairs if v is not None and w > 0]
+    total = sum(w for w, _ in pairs)
+    return sum(w * v for w, v in pairs) / total if total else None
+
+
+def score_tool(sig, ctx):
+    internal = _weighted((w, _scaled(sig, key, ctx)) for key, w in INTERNAL_WEIGHTS.items()) or 0
+    categories = {
+        name: _weighted((w, _scaled(sig, key, ctx)) for key, w in SIGNAL_WEIGHTS[name].items())
+        for name in CATEGORY_WEIGHTS
+    }
+    external = _weighted((CATEGORY_WEIGHTS[name], score) for name, score in categories.items())
+    if external is None:
+        hybrid, external = internal, 0
+    else:
+        hybrid = internal * INTERNAL_SHARE + external * (1 - INTERNAL_SHARE)
+    hybrid = round_score(hybrid)
+    return {
+        'hybrid_score': hybrid,
+        'internal_score': round_score(internal),
+        'external_score': round_score(external),
+    }
+
+
+def rank_positions(tools):
+    """{slug: 1-based rank by rating_avg} as /api/cron/trends ranks, ties in catalog order."""
+    order = sorted(tools, key=lambda tool: -(_number(tool.get('rating_avg')) or 0))
+    return {tool['slug']: rank for rank, tool in enumerate(order, 1)}
+
+
+def _baseline(history, cutoff):
+    """Newest snapshot dated on or before `cutoff`, or None."""
+    older = [snap for snap in history if snap['date'] <= cutoff.isoformat()]
+    return max(older, key=lambda snap: snap['date'], default=None)
+
+
+def _created_on(tool):
+    try:
+        return date.fromisoformat(str(tool.get('created_at'))[:10])
+    except ValueError:
+        return None
+
+
+def trends(tools, positions, baseline, cutoff):
+    """{slug: trend fields} as /api/cron/trends computes them against `baseline`.
+
+    A tool created after `cutoff` or missing from the baseline is 'new'.
+    Returns {} when there is no baseline to compare with.
+    """
+    if baseline is None:
+        return {}
+    old_ranks = baseline['ranks']
+    result = {}
+    for tool in tools:
+        slug = tool['slug']
+        created = _created_on(tool)
+        old = old_ranks.get(slug)
+        if (created is not None and created > cutoff) or old is None:
+            result[slug] = {'trend_direction': 'new', 'trend_magnitude': 0}
+            continue
+        delta = old - positions[slug]
+        if delta > 0:
+            result[slug] = {'trend_direction': 'up', 'trend_magnitude': delta}
+        elif delta < 0:
+            result[slug] = {'trend_direction': 'down', 'trend_magnitude': -delta}
+        else:
+            result[slug] = {'trend_direction': 'stable', 'trend_magnitude': 0}
+    return result
+
+
+def _digest(*parts):
+    text = json.dumps(parts, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
+def score_catalog(data, state=None, today=None):
+    """Score every tool whose inputs changed since `state`; trends are re-ranked for all.
+
+    Returns (updates, new_state, recomputed): UPDATES-style {slug: fields}
+    holding only fields whose value differs from the seed, the state to pass
+    to the next run once the updates are written, and the slugs that were
+    scored. state=None (or a state from other weights or normalization
+    maxima) rescores everything; the rank history survives a weight change.
+    `today` (a date) dates this run's rank snapshot.
+    """
+    tools = data['tools']
+    today = today or date.today()
+    sigs = signals(data)
+    ctx = context(sigs)
+    ctx_hash = _digest(STATE_VERSION, ctx, INTERNAL_WEIGHTS, CATEGORY_WEIGHTS, SIGNAL_WEIGHTS)
+    previous, history = {}, []
+    if state and state.get('version') == STATE_VERSION:
+        history = [snap for snap in state.get('history', []) if snap['date'] != today.isoformat()]
+        if state.get('context') == ctx_hash:
+            previous = state.get('tools', {})
+
+    def tool_hash(slug, fields):
+        return _digest(sigs[slug], [fields.get(key) for key in SCORE_FIELDS])
+
+    scores = {}
+    recomputed = []
+    for tool in tools:
+        slug = tool['slug']
+        if previous.get(slug) == tool_hash(slug, tool):
+            scores[slug] = {key: tool.get(key) for key in SCORE_FIELDS}
+            continue
+        scores[slug] = score_tool(sigs[slug], ctx)
+        recomputed.append(slug)
+
+    positions = rank_positions(tools)
+    cutoff = today - timedelta(days=TREND_WINDOW_DAYS)
+    baseline = _baseline(history, cutoff)
+    trend = trends(tools, positions, baseline, cutoff)
+    updates = {}
+    for tool in tools:
+        slug = tool['slug']
+        fields = {**scores[slug], **trend.get(slug, {})}
+        diff = {key: value for key, value in fields.items()
+                if not (type(tool.get(key)) is type(value) and tool.get(key) == value)}
+        if diff:
+            updates[slug] = diff
+
+    # snapshots older than the current baseline can never be a baseline again
+    if baseline is not None:
+        history = [snap for snap in history if snap['date'] >= baseline['date']]
+    history.append({'date': today.isoformat(), 'ranks': positions})
+    new_state = {
+        'version': STATE_VERSION,
+        'context': ctx_hash,
+        'tools': {tool['slug']: tool_hash(tool['slug'], scores[tool['slug']]) for tool in tools},
+        'history': sorted(history, key=lambda snap: snap['date']),
+    }
+    return updates, new_state, recomputed
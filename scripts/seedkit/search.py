@@ -0,0 +1,231 @@
+"""Inverted index over the tools catalog, persisted next to the seed as <seed>.index.json
+
+Terms are field-prefixed: tag:<tag>, model:<model id>, pricing:<type>,
+korean:true|false, and text:<token> for description/long_description, where
+Hangul runs become their syllables and character bigrams (Korean has no
+reliable word spacing) and Latin/digit runs become lowercase words,
+hyphenated ones also split into their parts ("gpt-4o" -> gpt-4o, gpt, 4o).
+Queries intersect posting sets. A Hangul query matches through its bigrams,
+or its syllable when it is one syllable long, so every tool containing the
+phrase as a substring is returned (plus the rare tool that has all its
+bigrams apart). Latin/digit queries match whole words or hyphen parts only.
+
+Documents are keyed by tool id, so a slug rename replaces the old entry; an
+id change drops the entry under the old id (matched by slug, or through the
+patch's renamed map). The file records the seed digest and journal length it
+reflects; the patch engine calls update_index_file() after each write so an
+existing index stays current without a rebuild.
+"""
+import hashlib
+import json
+import os
+import re
+
+from seedkit.storage import atomic_write
+
+INDEX_SUFFIX = '.index.json'
+INDEX_VERSION = 3
+INDEXED_FIELDS = ('slug', 'tags', 'model_identifiers', 'pricing_type', 'supports_korean',
+                  'description', 'long_description')
+
+_HANGUL = re.compile(r'[가-힣]+')
+_WORD = re.compile(r'[a-z0-9]+(?:[.\-][a-z0-9]+)*')
+
+
+def index_path(seed_path):
+    return f"{seed_path}{INDEX_SUFFIX}"
+
+
+def text_tokens(text, query=False):
+    """Hangul syllables and bigrams, and lowercase Latin/digit words with their hyphen parts.
+
+    Documents index every syllable; a query only uses the syllable of a
+    one-syllable run, since a longer run is matched by its bigrams.
+    """
+    tokens = set()
+    for run in _HANGUL.findall(text):
+        if not query or len(run) == 1:
+            tokens.update(run)
+        tokens.update(run[i:i + 2] for i in range(len(run) - 1))
+    for word in _WORD.findall(text.lower()):
+        tokens.add(word)
+        if '-' in word:
+            tokens.update(word.split('-'))
+    return tokens
+
+
+def _norm(value):
+    return ' '.join(str(value).split()).lower()
+
+
+def tool_terms(tool):
+    terms = {f"tag:{_norm(tag)}" for tag in tool.get('tags') or []}
+    terms.update(f"model:{_norm(model)}" for model in tool.get('model_identifiers') or [])
+    if tool.get('pricing_type'):
+        terms.add(f"pricing:{_norm(tool['pricing_type'])}")
+    terms.add(f"korean:{'true' if tool.get('supports_korean') else 'false'}")
+    for field in ('description', 'long_description'):
+        terms.update(f"text:{token}" for token in text_tokens(tool.get(field) or ''))
+    return terms
+
+
+def _fingerprint(tool):
+    text = json.dumps([tool.get(field) for field in INDEXED_FIELDS], ensure_ascii=False)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
+class SearchIndex:
+    """Posting sets term -> {tool id}, with a forward map for incremental updates."""
+
+    def __init__(self):
+        self.source = None
+        # id -> (slug, fingerprint, terms)
+        self.docs = {}
+        self.postings = {}
+
+    def __len__(self):
+        return len(self.docs)
+
+    def _remove(self, tool_id):
+        _, _, terms = self.docs.pop(tool_id)
+        for term in terms:
+            ids = self.postings[term]
+            ids.discard(tool_id)
+            if not ids:
+                del self.postings[term]
+
+    def _add(self, tool, fingerprint):
+        terms = tool_terms(tool)
+        self.docs[tool['id']] = (tool['slug'], fingerprint, terms)
+        for term in terms:
+            self.postings.setdefault(term, set()).add(tool['id'])
+
+    def update(self, tools, renamed=None):
+        """(Re)index `tools`; unchanged records are skipped. Returns how many were reindexed.
+
+        A document left under a tool's previous id is dropped: one with the
+        same slug as an incoming tool, or one whose id is a key of
+        renamed['id'] (PatchReport.renamed), for tools whose id and slug both
+        changed.
+        """
+        tools = list(tools)
+        incoming = {tool['id'] for tool in tools}
+        slugs = {tool['slug'] for tool in tools}
+        stale = set((renamed or {}).get('id', ()))
+        stale.update(tool_id for tool_id, (slug, _, _) in self.docs.items() if slug in slugs)
+        for tool_id in stale - incoming:
+            if tool_id in self.docs:
+                self._remove(tool_id)
+        count = 0
+        for tool in tools:
+            fingerprint = _fingerprint(tool)
+            old = self.docs.get(tool['id'])
+            if old is not None:
+                if old[1] == fingerprint:
+                    continue
+                self._remove(tool['id'])
+            self._add(tool, fingerprint)
+            count += 1
+        return count
+
+    def sync(self, tools):
+        """Make the index match `tools` exactly: reindex changed records, drop vanished ones."""
+        tools = list(tools)
+        for tool_id in self.docs.keys() - {tool['id'] for tool in tools}:
+            self._remove(tool_id)
+        return self.update(tools)
+
+    @classmethod
+    def build(cls, tools):
+        index = cls()
+        index.update(tools)
+        return index
+
+    def ids(self, term):
+        return self.postings.get(term, set())
+
+    def query(self, tags=(), models=(), pricing=None, korean=None, text=None):
+        """Slugs of tools matching every given condition, sorted.
+
+        A `text` with no indexable tokens (e.g. only punctuation) matches nothing.
+        """
+        terms = [f"tag:{_norm(tag)}" for tag in tags]
+        terms += [f"model:{_norm(model)}" for model in models]
+        if pricing is not None:
+            terms.append(f"pricing:{_norm(pricing)}")
+        if korean is not None:
+            terms.append(f"korean:{'true' if korean else 'false'}")
+        if text is not None:
+            tokens = text_tokens(text, query=True)
+            if not tokens:
+                return []
+            terms += [f"text:{token}" for token in tokens]
+        if not terms:
+            return sorted(slug for slug, _, _ in self.docs.values())
+        # Intersect from the rarest term up
+        postings = sorted((self.ids(term) for term in terms), key=len)
+        result = set(postings[0])
+        for ids in postings[1:]:
+            if not result:
+                break
+            result &= ids
+        return sorted(self.docs[tool_id][0] for tool_id in result)
+
+    def vocabulary(self, prefix):
+        """Indexed values of one field with their document counts, e.g. vocabulary('tag:')."""
+        return {term[len(prefix):]: len(ids) for term, ids in self.postings.items()
+                if term.startswith(prefix)}
+
+    def save(self, path):
+        """Write the index file; terms are stored once and referenced by number."""
+        table = {term: i for i, term in enumerate(sorted(self.postings))}
+        payload = {
+            'version': INDEX_VERSION,
+            'source': self.source,
+            'terms': list(table),
+            'docs': {tool_id: [slug, fingerprint, sorted(table[t] for t in terms)]
+                     for tool_id, (slug, fingerprint, terms) in self.docs.items()},
+        }
+        with atomic_write(path) as f:
+            json.dump(payload, f, ensure_ascii=False, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path):
+        """The index stored at `path`, or None if it is missing or from another format version."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+        except FileNotFoundError:
+            return None
+        if payload.get('version') != INDEX_VERSION:
+            return None
+        index = cls()
+        index.source = payload['source']
+        terms = payload['terms']
+        for tool_id, (slug, fingerprint, term_ids) in payload['docs'].items():
+            doc_terms = {terms[i] for i in term_ids}
+            index.docs[tool_id] = (slug, fingerprint, doc_terms)
+            for term in doc_terms:
+                index.postings.setdefault(term, set()).add(tool_id)
+        return index
+
+
+def update_index_file(seed_path, tools, old_source, new_source, renamed=None):
+    """Reindex `tools` in the seed's index file, if one exists. Returns whether it did.
+
+    Called by the patch engine after a write with the seed's freshness key
+    ([digest, journal entries]) before and after it, and the patch's renamed
+    keys. An index that was not current before the write loses its key, so
+    the next reader resyncs it.
+    """
+    path = index_path(seed_path)
+    if not os.path.exists(path):
+        return False
+    index = SearchIndex.load(path)
+    if index is None:
+        os.remove(path)
+        return False
+    index.update(tools, renamed)
+    index.source = new_source if index.source == old_source else None
+    index.save(path)
+    return True
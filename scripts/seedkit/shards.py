@@ -0,0 +1,218 @@
+"""Per-category shards of a seed file, with a manifest of shard hashes
+
+split_seed() puts every tool into the shard of its category_id
+(category-<slug>.json), rows of the sections that join against tools
+(seedkit.index TOOL_ID_SECTIONS / TOOL_SLUG_SECTIONS) into the shard of the
+tool they belong to, and everything else (categories, news, guides, rows of
+unknown tools...) into common.json. The manifest records, per shard, its
+category_id, sha256, size and tool slugs, plus the interleaving of shards in
+each sharded section, so join_shards() rebuilds the seed row for row.
+
+write_shards() and patch_shards() only rewrite shards whose bytes changed,
+and patch_shards() only reads the shards holding the tools a batch touches.
+"""
+import hashlib
+import json
+import os
+
+from seedkit.canonical import canonicalize
+from seedkit.engine import apply_updates, tool_stats
+from seedkit.index import TOOL_ID_SECTIONS, TOOL_SLUG_SECTIONS
+from seedkit.schema import check_batches
+from seedkit.storage import atomic_write
+
+MANIFEST = 'manifest.json'
+FORMAT = 1
+COMMON = 'common'
+UNCATEGORIZED = 'uncategorized'
+
+
+class ShardError(Exception):
+    """A shard directory is missing, incomplete or out of step with its manifest."""
+
+
+def shard_names(data):
+    """category_id -> shard name."""
+    return {c['id']: f"category-{c['slug']}" for c in data.get('categories') or []}
+
+
+def split_seed(data):
+    """Split a loaded seed into shards.
+
+    Returns (shards, order): shards is {name: {section: rows}} with sections in
+    seed order; order is {section: [[shard, run length], ...]} for every
+    section split across shards.
+    """
+    names = shard_names(data)
+    by_id, by_slug = {}, {}
+    for tool in data.get('tools') or []:
+        name = names.get(tool.get('category_id'), UNCATEGORIZED)
+        by_id[tool.get('id')] = by_slug[tool.get('slug')] = name
+
+    shards = {COMMON: {}}
+    order = {}
+    for section, rows in data.items():
+        if section == 'tools':
+            field, owners, default = 'slug', by_slug, UNCATEGORIZED
+        elif section in TOOL_ID_SECTIONS:
+            field, owners, default = 'tool_id', by_id, COMMON
+        elif section in TOOL_SLUG_SECTIONS:
+            field, owners, default = 'tool_slug', by_slug, COMMON
+        else:
+            shards[COMMON][section] = rows
+            continue
+        runs = order[section] = []
+        for row in rows:
+            name = owners.get(row.get(field), default)
+            shards.setdefault(name, {}).setdefault(section, []).append(row)
+            if runs and runs[-1][0] == name:
+                runs[-1][1] += 1
+            else:
+                runs.append([name, 1])
+    return shards, order
+
+
+def join_sections(sections, shards, order):
+    """Inverse of split_seed(): reassemble the seed dict in its original order."""
+    data = {}
+    for section in sections:
+        if section not in order:
+            data[section] = shards[COMMON][section]
+            continue
+        rows = {name: iter(shard.get(section, ())) for name, shard in shards.items()}
+        data[section] = [next(rows[name]) for name, n in order[section] for _ in range(n)]
+    return data
+
+
+def encode(shard):
+    """Shard file bytes, in the seed's own canonical layout (indent=2, UTF-8)."""
+    return json.dumps(canonicalize(shard), ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def load_manifest(dirpath):
+    path = os.path.join(dirpath, MANIFEST)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        raise ShardError(f"{path} not found; split a seed first") from None
+    if manifest.get('format') != FORMAT:
+        raise ShardError(f"{path}: unsupported shard format {manifest.get('format')!r}")
+    return manifest
+
+
+def read_shard(dirpath, manifest, name, check=True):
+    entry = manifest['shards'][name]
+    with open(os.path.join(dirpath, entry['file']), 'rb') as f:
+        body = f.read()
+    if check and hashlib.sha256(body).hexdigest() != entry['sha256']:
+        raise ShardError(f"{entry['file']} does not match the manifest hash; was it edited by hand?")
+    return json.loads(body)
+
+
+def _write_shard(dirpath, name, shard, previous, category_id):
+    """Write one shard unless its bytes are unchanged. Returns (manifest entry, written)."""
+    body = encode(shard)
+    entry = {
+        'file': f"{name}.json",
+        'category_id': category_id,
+        'sha256': hashlib.sha256(body).hexdigest(),
+        'bytes': len(body),
+        'tools': [t.get('slug') for t in shard.get('tools', ())],
+    }
+    path = os.path.join(dirpath, entry['file'])
+    if previous == entry and os.path.exists(path):
+        return entry, False
+    with atomic_write(path, 'wb') as f:
+        f.write(body)
+    return entry, True
+
+
+def _write_manifest(dirpath, manifest):
+    with atomic_write(os.path.join(dirpath, MANIFEST)) as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+
+def write_shards(data, dirpath):
+    """Shard `data` into dirpath. Returns (written, unchanged, removed) shard names."""
+    os.makedirs(dirpath, exist_ok=True)
+    try:
+        previous = load_manifest(dirpath)['shards']
+    except ShardError:
+        previous = {}
+    categories = {name: cid for cid, name in shard_names(data).items()}
+    shards, order = split_seed(data)
+    entries = {}
+    written, unchanged = [], []
+    for name, shard in shards.items():
+        entries[name], changed = _write_shard(dirpath, name, shard, previous.get(name),
+                                              categories.get(name))
+        (written if changed else unchanged).append(name)
+    removed = [name for name in previous if name not in entries]
+    for name in removed:
+        try:
+            os.unlink(os.path.join(dirpath, previous[name]['file']))
+        except FileNotFoundError:
+            pass
+    _write_manifest(dirpath, {'format': FORMAT, 'sections': list(data), 'order': order,
+                              'shards': entries})
+    return written, unchanged, removed
+
+
+def join_shards(dirpath, check=True):
+    """Load every shard and reassemble the seed dict."""
+    manifest = load_manifest(dirpath)
+    shards = {name: read_shard(dirpath, manifest, name, check) for name in manifest['shards']}
+    return join_sections(manifest['sections'], shards, manifest['order'])
+
+
+def patch_shards(dirpath, *batches, verify=False, validate=True):
+    """Apply UPDATES batches to a shard directory, reading and rewriting only the shards involved.
+
+    The tools of the shards that hold a batch slug are patched with
+    apply_updates(); a patch that moves a tool to another category falls back
+    to joining all shards and resharding. report.shards lists the shard files
+    rewritten. No integrity check runs here (report.integrity stays None):
+    run check_integrity() on join_shards() for that.
+    """
+    if validate:
+        check_batches(batches)
+    manifest = load_manifest(dirpath)
+    owner = {slug: name for name, entry in manifest['shards'].items() for slug in entry['tools']}
+    needed = sorted({owner[slug] for updates in batches for slug in updates if slug in owner})
+    shards = {name: read_shard(dirpath, manifest, name) for name in needed}
+
+    tools, spans = [], []
+    for name in needed:
+        shard_tools = shards[name].get('tools', [])
+        spans.append((name, len(tools), len(tools) + len(shard_tools)))
+        tools.extend(shard_tools)
+    report = apply_updates({'tools': tools}, *batches)
+    report.path = dirpath
+
+    if report.changed:
+        names = {entry['category_id']: name for name, entry in manifest['shards'].items()
+                 if entry['category_id']}
+        moved = any(names.get(tools[i].get('category_id'), UNCATEGORIZED) != name
+                    for name, start, end in spans for i in range(start, end))
+        if moved:
+            data = join_shards(dirpath)
+            report = apply_updates(data, *batches)
+            report.path = dirpath
+            report.shards, _, _ = write_shards(data, dirpath)
+            tools = data['tools']
+        else:
+            for name, start, end in spans:
+                shards[name]['tools'] = tools[start:end]
+                entry, written = _write_shard(dirpath, name, shards[name], manifest['shards'][name],
+                                              manifest['shards'][name]['category_id'])
+                manifest['shards'][name] = entry
+                if written:
+                    report.shards.append(name)
+            if report.shards:
+                _write_manifest(dirpath, manifest)
+        report.written = bool(report.shards)
+    if verify:
+        by_slug = {t['slug']: t for t in tools}
+        report.stats = [tool_stats(by_slug[slug]) for slug in report.updated if slug in by_slug]
+    return report
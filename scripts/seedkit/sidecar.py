@@ -0,0 +1,97 @@
+"""Binary sidecar cache of a seed file: seed.json.marshal next to seed.json
+
+The JSON stays canonical (the Next.js import reads it); the sidecar only saves
+Python tooling the cost of parsing it. It holds the decoded document in
+marshal format behind a small header naming the JSON file it was built from
+(mtime_ns, size, sha256) and the interpreter's cache tag, since marshal's
+format is only stable within one Python version.
+
+Sidecars are only written from write paths (engine.dump_seed), which hash
+the JSON as they write it; reading a seed never creates one. marshal keeps
+tuples and non-str dict keys that JSON turns into lists and strings, so a
+sidecar is only written for canonical data (seedkit.canonical), which is
+exactly what its own JSON decodes to by construction. Loading a sidecar is
+therefore indistinguishable from json.load(), without re-encoding or
+re-decoding anything on each write.
+"""
+import contextlib
+import marshal
+import os
+import struct
+import sys
+
+from seedkit.storage import atomic_write, file_digest
+
+SIDECAR_SUFFIX = '.marshal'
+MAGIC = b'SEEDKIT\x01'
+FORMAT = 1
+_LENGTH = struct.Struct('<I')
+
+
+def sidecar_path(path):
+    return f"{path}{SIDECAR_SUFFIX}"
+
+
+def _source_key(path):
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def read_sidecar(path):
+    """Return the document cached for `path`, or None if there is no valid sidecar.
+
+    A sidecar whose mtime/size no longer match is still accepted when the JSON's
+    sha256 does (e.g. after a checkout that rewrote identical bytes).
+    """
+    try:
+        with open(sidecar_path(path), 'rb') as f:
+            blob = f.read()
+    except FileNotFoundError:
+        return None
+    # marshal.load() on a file object reads in small pieces; slicing one bytes read is faster
+    view = memoryview(blob)
+    start = len(MAGIC) + _LENGTH.size
+    if blob[:len(MAGIC)] != MAGIC or len(blob) < start:
+        return None
+    end = start + _LENGTH.unpack_from(blob, len(MAGIC))[0]
+    try:
+        header = marshal.loads(view[start:end])
+        if (not isinstance(header, dict) or header.get('format') != FORMAT
+                or header.get('python') != sys.implementation.cache_tag):
+            return None
+        if (header['mtime_ns'], header['size']) != _source_key(path):
+            if header['sha256'] != file_digest(path):
+                return None
+        return marshal.loads(view[end:])
+    except (EOFError, ValueError, TypeError, KeyError, OSError):
+        return None
+
+
+def write_sidecar(path, data, digest):
+    """Cache `data` as the decoded form of `path`.
+
+    `data` must be canonical data that was just serialized to `path` and
+    `digest` the sha256 of the bytes written, as dump_seed() passes them;
+    neither is re-checked here. The sidecar gets the seed file's permissions.
+    """
+    key = _source_key(path)
+    blob = marshal.dumps(data)
+    header = {
+        'format': FORMAT,
+        'python': sys.implementation.cache_tag,
+        'mtime_ns': key[0],
+        'size': key[1],
+        'sha256': digest,
+    }
+    header = marshal.dumps(header)
+    with atomic_write(sidecar_path(path), 'wb') as f:
+        f.write(MAGIC)
+        f.write(_LENGTH.pack(len(header)))
+        f.write(header)
+        f.write(blob)
+    os.chmod(sidecar_path(path), os.stat(path).st_mode & 0o777)
+
+
+def discard(path):
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(sidecar_path(path))
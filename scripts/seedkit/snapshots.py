@@ -0,0 +1,198 @@
+"""Content-addressed snapshot store for seed files
+
+Every record of every list section is stored once, keyed by the sha256 of
+its compact JSON encoding with sorted keys, so reordering a record's keys
+(as the canonical layout of seedkit.canonical does) neither stores it again
+nor shows up in diff(). A snapshot is a small manifest under snapshots/
+listing, per section, the hashes of its records in order, plus one pack file
+under packs/ holding the records no earlier snapshot stored (one
+"<sha256> <json>" line each), so taking a snapshot of a seed that differs
+from an earlier one in a few tools only adds those tools' records, in two
+files.
+
+The pack keeps the first encoding seen of each record, key order included,
+so restore() is byte-identical unless a record's keys were reordered between
+snapshots; it reports which.
+"""
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+
+from seedkit.paths import DATA_DIR
+from seedkit.storage import atomic_write, file_digest
+
+STORE_DIR = os.path.join(DATA_DIR, 'snapshots')
+
+# Fields that identify a row when diffing, tried in order
+IDENTITY_KEYS = (('id',), ('slug',), ('tool_id', 'category_id'), ('tool_id', 'source_key'))
+
+
+def encode_record(record):
+    return json.dumps(record, ensure_ascii=False, separators=(',', ':'))
+
+
+def record_hash(record):
+    """Content hash of a record, independent of its key order."""
+    text = json.dumps(record, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def record_identity(record, fallback):
+    if isinstance(record, dict):
+        for keys in IDENTITY_KEYS:
+            if all(record.get(k) is not None for k in keys):
+                return '/'.join(str(record[k]) for k in keys)
+    return fallback
+
+
+class SnapshotStore:
+    def __init__(self, root=STORE_DIR):
+        self.root = root
+        self.packs_dir = os.path.join(root, 'packs')
+        self.snapshots_dir = os.path.join(root, 'snapshots')
+        # hash -> encoded record, across every pack; loaded on first use
+        self._packed = None
+
+    # ── objects ──
+
+    def _pack_path(self, name):
+        return os.path.join(self.packs_dir, name + '.jsonl')
+
+    def _objects(self):
+        if self._packed is None:
+            self._packed = {}
+            if os.path.isdir(self.packs_dir):
+                for entry in sorted(os.listdir(self.packs_dir)):
+                    with open(os.path.join(self.packs_dir, entry), 'r', encoding='utf-8') as f:
+                        for line in f:
+                            digest, _, encoded = line.rstrip('\n').partition(' ')
+                            self._packed[digest] = encoded
+        return self._packed
+
+    def has(self, digest):
+        return digest in self._objects()
+
+    def get(self, digest):
+        return json.loads(self._objects()[digest])
+
+    def write_pack(self, name, pending):
+        """Store {hash: encoded record} as the pack of snapshot `name`."""
+        os.makedirs(self.packs_dir, exist_ok=True)
+        with atomic_write(self._pack_path(name)) as f:
+            for digest, encoded in pending.items():
+                f.write(f"{digest} {encoded}\n")
+        self._objects().update(pending)
+
+    # ── snapshots ──
+
+    def _manifest_path(self, name):
+        return os.path.join(self.snapshots_dir, name + '.json')
+
+    def take(self, seed_path, name=None):
+        """Snapshot a seed file. Returns the manifest (with 'new_objects' set).
+
+        Records not yet in the store go into one new pack, written before the manifest.
+        """
+        with open(seed_path, 'rb') as f:
+            raw = f.read()
+        data = json.loads(raw)
+        created_at = datetime.now(timezone.utc)
+        if name is None:
+            stem = os.path.splitext(os.path.basename(seed_path))[0]
+            name = f"{created_at.strftime('%Y%m%dT%H%M%SZ')}-{stem}"
+        if os.path.exists(self._manifest_path(name)):
+            raise FileExistsError(f"snapshot already exists: {name}")
+
+        # hash -> encoded record, for records the store doesn't have yet
+        pending = {}
+
+        def put(record):
+            digest = record_hash(record)
+            if digest not in pending and not self.has(digest):
+                pending[digest] = encode_record(record)
+            return digest
+
+        sections = []
+        for section, value in data.items():
+            if isinstance(value, list):
+                sections.append([section, [put(record) for record in value]])
+            else:
+                sections.append([section, put(value)])
+        if pending:
+            self.write_pack(name, pending)
+
+        manifest = {
+            'name': name,
+            'created_at': created_at.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'source': os.path.basename(seed_path),
+            'digest': hashlib.sha256(raw).hexdigest(),
+            'trailing_newline': raw.endswith(b'\n'),
+            'sections': sections,
+        }
+        os.makedirs(self.snapshots_dir, exist_ok=True)
+        with atomic_write(self._manifest_path(name)) as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=1)
+        manifest['new_objects'] = len(pending)
+        return manifest
+
+    def manifest(self, name):
+        with open(self._manifest_path(name), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def list(self):
+        """All snapshot manifests, oldest first."""
+        if not os.path.isdir(self.snapshots_dir):
+            return []
+        manifests = [self.manifest(os.path.splitext(entry)[0])
+                     for entry in os.listdir(self.snapshots_dir) if entry.endswith('.json')]
+        return sorted(manifests, key=lambda m: (m['created_at'], m['name']))
+
+    def materialize(self, name):
+        """Rebuild the seed document of a snapshot."""
+        data = {}
+        for section, hashes in self.manifest(name)['sections']:
+            if isinstance(hashes, list):
+                data[section] = [self.get(digest) for digest in hashes]
+            else:
+                data[section] = self.get(hashes)
+        return data
+
+    def restore(self, name, out_path):
+        """Write a snapshot back out as a seed file. Returns True if the bytes match the original."""
+        manifest = self.manifest(name)
+        data = self.materialize(name)
+        with atomic_write(out_path) as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            if manifest['trailing_newline']:
+                f.write('\n')
+        return file_digest(out_path) == manifest['digest']
+
+    def diff(self, old_name, new_name):
+        """Per-section record changes between two snapshots.
+
+        Returns {section: {'added': [...], 'removed': [...], 'changed': [...]}}
+        listing record identities (id, slug, or a composite key), only for
+        sections that differ. Only differing records are loaded from the store.
+        """
+        old = dict((s, h) for s, h in self.manifest(old_name)['sections'])
+        new = dict((s, h) for s, h in self.manifest(new_name)['sections'])
+        result = {}
+        for section in list(old) + [s for s in new if s not in old]:
+            before, after = old.get(section, []), new.get(section, [])
+            if before == after:
+                continue
+            if not isinstance(before, list) or not isinstance(after, list):
+                result[section] = {'added': [], 'removed': [], 'changed': [section]}
+                continue
+            before_set, after_set = set(before), set(after)
+            gone = [h for h in before if h not in after_set]
+            came = [h for h in after if h not in before_set]
+            gone_ids = {record_identity(self.get(h), h): h for h in gone}
+            came_ids = {record_identity(self.get(h), h): h for h in came}
+            result[section] = {
+                'added': [i for i in came_ids if i not in gone_ids],
+                'removed': [i for i in gone_ids if i not in came_ids],
+                'changed': [i for i in came_ids if i in gone_ids],
+            }
+        return result
@@ -0,0 +1,71 @@
+"""Crash-safe file writes: stream into a sibling temp file, fsync, then rename over the target"""
+import contextlib
+import hashlib
+import os
+import tempfile
+
+
+class AbortWrite(Exception):
+    """Raise inside atomic_write() to drop the temp file and leave the target untouched."""
+
+
+def _fsync_dir(dirpath):
+    # Directory fsync makes the rename durable; not supported on Windows.
+    if os.name != 'posix':
+        return
+    fd = os.open(dirpath, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _umask():
+    # The umask can only be read by setting it; put it straight back
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+@contextlib.contextmanager
+def atomic_write(path, mode='w', encoding='utf-8'):
+    """Open a temp file next to `path` for writing and atomically replace `path` on success.
+
+    Readers see either the old file or the complete new one, never a truncated
+    write. The new file keeps the old one's permission bits, or gets the
+    umask's default for a file that did not exist yet. On any exception the temp file is removed and `path` is untouched;
+    AbortWrite does the same without propagating.
+    """
+    dirpath = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(path)}.", suffix='.tmp', dir=dirpath,
+    )
+    try:
+        with open(fd, mode, encoding=None if 'b' in mode else encoding) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            mode = os.stat(path).st_mode & 0o777
+        except FileNotFoundError:
+            # A new file gets what open() would have given it, not mkstemp's 0600
+            mode = 0o666 & ~_umask()
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except AbortWrite:
+        os.unlink(tmp_path)
+        return
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
+    _fsync_dir(dirpath)
+
+
+def file_digest(path, chunk_size=1 << 20):
+    """sha256 hex digest of a file, read in chunks."""
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
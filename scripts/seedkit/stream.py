@@ -0,0 +1,308 @@
+"""Streaming access to seed.json: read sections record by record, patch in constant memory
+
+iter_sections() walks the top-level object with the stdlib decoder's raw_decode
+over a sliding text buffer, so only the record being looked at is ever parsed.
+SeedWriter emits the same (canonical) bytes dump_seed() would, one record at a
+time, and stream_patch() combines the two into a filter that
+applies UPDATES batches without holding the document in memory.
+"""
+import json
+import os
+import re
+
+from seedkit import canonical, journal, search
+from seedkit.engine import (HashingWriter, PatchReport, apply_fields, patch_seed,
+                            record_diff, tool_stats)
+from seedkit.integrity import IntegrityChecker
+from seedkit.schema import SKIP, check_batches
+from seedkit.storage import AbortWrite, atomic_write, file_digest
+
+CHUNK_SIZE = 1 << 16
+# Seeds at least this large are patched with stream_patch() instead of patch_seed()
+STREAM_THRESHOLD = 64 * 1024 * 1024
+
+_WS = re.compile(r'[ \t\n\r]*')
+_decoder = json.JSONDecoder()
+
+
+# ── Reading ──
+
+class _Reader:
+    """Sliding window over a text file; values are decoded with raw_decode."""
+
+    def __init__(self, f, chunk_size):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self):
+        data = self.f.read(self.chunk_size)
+        if not data:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Skip whitespace and return the next character ('' at end of file)."""
+        while True:
+            self.pos = _WS.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, chars):
+        ch = self.peek()
+        if not ch or ch not in chars:
+            raise json.JSONDecodeError(f"Expecting one of {chars!r}", self.buf, self.pos)
+        self.pos += 1
+        return ch
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                # Most likely the value runs past the buffer; at EOF it is a real error.
+                if not self._fill():
+                    raise
+                continue
+            # A number ending exactly at the buffer edge may continue in the next chunk.
+            if end == len(self.buf) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return obj
+
+
+class StreamedArray:
+    """A top-level array being read lazily. Iterable once, in file order."""
+
+    def __init__(self, reader, name):
+        self.name = name
+        self._items = self._generate(reader)
+
+    @staticmethod
+    def _generate(reader):
+        if reader.peek() == ']':
+            reader.pos += 1
+            return
+        while True:
+            yield reader.value()
+            if reader.expect(',]') == ']':
+                return
+
+    def __iter__(self):
+        return self._items
+
+    def drain(self):
+        for _ in self._items:
+            pass
+
+    def __repr__(self):
+        return f"StreamedArray({self.name!r})"
+
+
+def iter_sections(path, chunk_size=CHUNK_SIZE):
+    """Yield (name, value) for each top-level key of a seed file, in file order.
+
+    Array values come as StreamedArray and must be consumed before the next
+    section is requested; whatever is left is skipped. Other values are decoded
+    whole.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        reader = _Reader(f, chunk_size)
+        reader.expect('{')
+        if reader.peek() == '}':
+            return
+        while True:
+            name = reader.value()
+            if not isinstance(name, str):
+                raise json.JSONDecodeError("Expecting property name", reader.buf, reader.pos)
+            reader.expect(':')
+            if reader.peek() == '[':
+                reader.pos += 1
+                array = StreamedArray(reader, name)
+                yield name, array
+                array.drain()
+            else:
+                yield name, reader.value()
+            if reader.expect(',}') == '}':
+                return
+
+
+def iter_section(path, name, chunk_size=CHUNK_SIZE):
+    """Yield the records of one top-level array (nothing if the section is absent)."""
+    for section, value in iter_sections(path, chunk_size):
+        if section == name:
+            yield from value
+            return
+
+
+def iter_tools(path, chunk_size=CHUNK_SIZE):
+    return iter_section(path, 'tools', chunk_size)
+
+
+# ── Writing ──
+
+class SeedWriter:
+    """Write a top-level object section by section in json.dump(indent=2) layout.
+
+    Records are encoded one at a time (canonicalized like dump_seed() does
+    unless canonical=False), so the output is byte-identical to dump_seed() on
+    the same data while only one record is ever in memory.
+    """
+
+    def __init__(self, f, canonical=True):
+        self.f = f
+        self.canonical = canonical
+        self._sections = 0
+        self._items = None
+        self._section = None
+
+    def _key(self, name):
+        self.f.write(',\n' if self._sections else '{\n')
+        self._sections += 1
+        self._section = name
+        if self.canonical:
+            name = canonical.text(name)
+        self.f.write(f"  {json.dumps(name, ensure_ascii=False)}: ")
+
+    def write_value(self, name, value):
+        self._key(name)
+        if self.canonical:
+            value = canonical.canonical_section(name, value)
+        text = json.dumps(value, ensure_ascii=False, indent=2)
+        self.f.write(text.replace('\n', '\n  '))
+
+    def begin_array(self, name):
+        self._key(name)
+        self.f.write('[')
+        self._items = 0
+
+    def write_item(self, item):
+        self.f.write(',\n' if self._items else '\n')
+        self._items += 1
+        if self.canonical:
+            item = canonical.canonical_row(self._section, item)
+        text = json.dumps(item, ensure_ascii=False, indent=2)
+        self.f.write('    ' + text.replace('\n', '\n    '))
+
+    def end_array(self):
+        self.f.write('\n  ]' if self._items else ']')
+        self._items = None
+
+    def write_array(self, name, items):
+        self.begin_array(name)
+        for item in items:
+            self.write_item(item)
+        self.end_array()
+
+    def close(self):
+        self.f.write('\n}' if self._sections else '{}')
+
+
+# ── Patching ──
+
+def stream_patch(path, *batches, verify=False, validate=True, chunk_size=CHUNK_SIZE):
+    """patch_seed() as a single pass: read a record, patch it, write it.
+
+    Memory stays bounded by the largest record rather than the document. The
+    report carries the same fields, ops, digest and stats as patch_seed(); the
+    write is abandoned (file untouched) when nothing changed.
+
+    The integrity check runs on the records as they are written, so
+    report.integrity costs no extra pass.
+
+    Differences from patch_seed(): a pending journal is refused rather than
+    replayed (compact it first), and a batch that renames a slug does not
+    redirect later batches to the new slug.
+    """
+    if validate:
+        check_batches(batches)
+    if os.path.exists(journal.journal_path(path)):
+        raise journal.JournalError(
+            f"{journal.journal_path(path)} has pending entries; compact it before streaming")
+
+    # slug -> batch entries in apply order; first mention fixes report order
+    plan = {}
+    for updates in batches:
+        for slug, fields in updates.items():
+            plan.setdefault(slug, []).append(fields)
+
+    status = {}
+    stats = {}
+    changed = []
+    report = PatchReport()
+    report.path = path
+    indexed = os.path.exists(search.index_path(path))
+    base = file_digest(path) if indexed else None
+    checker = IntegrityChecker()
+
+    with atomic_write(path) as f:
+        hashing = HashingWriter(f)
+        writer = SeedWriter(hashing)
+        for name, value in iter_sections(path, chunk_size):
+            if name != 'tools' or not isinstance(value, StreamedArray):
+                if isinstance(value, StreamedArray):
+                    writer.write_array(name, checker.add_rows(name, value))
+                else:
+                    writer.write_value(name, value)
+                continue
+            writer.begin_array(name)
+            for pos, tool in enumerate(value):
+                slug = tool.get('slug')
+                entries = plan.get(slug)
+                if entries:
+                    before = {}
+                    for fields in entries:
+                        if fields == SKIP:
+                            status.setdefault(slug, 'skipped')
+                            continue
+                        apply_fields(tool, fields, before)
+                        status[slug] = 'updated'
+                    if status[slug] == 'updated':
+                        record_diff(report, slug, pos, tool, before)
+                        if report.fields[slug]['changed'] or report.fields[slug]['new']:
+                            changed.append(tool)
+                        if verify:
+                            stats[slug] = tool_stats(tool)
+                checker.add(name, tool)
+                writer.write_item(tool)
+            writer.end_array()
+        writer.close()
+        if not report.changed:
+            raise AbortWrite
+
+    for slug in plan:
+        getattr(report, status.get(slug, 'not_found')).append(slug)
+    # record_diff ran in file order; re-key report.fields to batch order
+    report.fields = {slug: report.fields[slug] for slug in report.updated}
+    if report.changed:
+        report.digest = hashing.sha.hexdigest()
+        report.written = True
+        report.integrity = checker.finish(report.renamed)
+        if indexed:
+            search.update_index_file(path, changed, [base, 0], [report.digest, 0], report.renamed)
+    if verify:
+        report.stats = [stats[slug] for slug in report.updated]
+        if report.written:
+            report.verified = file_digest(path) == report.digest
+    return report
+
+
+def auto_patch(path, *batches, stream=None, verify=False, journal_only=False, validate=True):
+    """Patch with stream_patch() for seeds of STREAM_THRESHOLD bytes or more, else patch_seed().
+
+    stream=True/False forces the choice. Journal runs, and seeds with a pending
+    journal, always take the in-memory path.
+    """
+    if stream is None:
+        stream = os.path.getsize(path) >= STREAM_THRESHOLD
+    if stream and not journal_only and not os.path.exists(journal.journal_path(path)):
+        return stream_patch(path, *batches, verify=verify, validate=validate)
+    return patch_seed(path, *batches, verify=verify, journal_only=journal_only, validate=validate)
@@ -0,0 +1,85 @@
+"""Synthetic seeds shaped like data/seed.json, for benchmarking at larger catalog sizes"""
+import copy
+import random
+
+from seedkit.index import TOOL_ID_SECTIONS, TOOL_SLUG_SECTIONS
+
+
+def _suffix(value, k):
+    return value if k == 0 else f"{value}-x{k}"
+
+
+def synthesize(template, n_tools):
+    """Grow (or shrink) a real seed to `n_tools` tools.
+
+    Tools are cloned round-robin from the template; clone k of a tool gets
+    "-x<k>" appended to its id and slug (k=0 keeps the original, so real
+    UPDATES batches still hit). Rows of the tool-referencing sections and
+    news.related_tool_id are cloned along with their tool; every other
+    section is copied as-is.
+    """
+    base_tools = template['tools']
+    clones = {}  # original id -> [clone ks]
+    tools = []
+    for j in range(n_tools):
+        src = base_tools[j % len(base_tools)]
+        k = j // len(base_tools)
+        tool = copy.deepcopy(src)
+        tool['id'] = _suffix(src['id'], k)
+        tool['slug'] = _suffix(src['slug'], k)
+        if k:
+            tool['name'] = f"{src['name']} {k}"
+            tool['visit_count'] = (src.get('visit_count') or 0) + k
+        tools.append(tool)
+        clones.setdefault(src['id'], []).append(k)
+    slug_clones = {t['slug']: clones[t['id']] for t in base_tools if t['id'] in clones}
+
+    data = {}
+    for section, rows in template.items():
+        if section == 'tools':
+            data[section] = tools
+        elif section in TOOL_ID_SECTIONS or section in TOOL_SLUG_SECTIONS or section == 'news':
+            key = {'news': 'related_tool_id'}.get(
+                section, 'tool_id' if section in TOOL_ID_SECTIONS else 'tool_slug')
+            lookup = slug_clones if key == 'tool_slug' else clones
+            out = []
+            for row in rows:
+                ref = row.get(key)
+                if ref not in lookup:
+                    if section == 'news' or ref is None:
+                        out.append(copy.deepcopy(row))
+                    continue
+                for k in lookup[ref]:
+                    clone = copy.deepcopy(row)
+                    clone[key] = _suffix(ref, k)
+                    if 'id' in clone:
+                        clone['id'] = _suffix(clone['id'], k)
+                    out.append(clone)
+            data[section] = out
+        else:
+            data[section] = copy.deepcopy(rows)
+    return data
+
+
+def synthesize_candidates(template, n_records, seed=0):
+    """`n_records` collected-candidate-sized records (a made-up name and a few words).
+
+    Names are random syllable strings. Like data/ai-tools-500.json, most
+    descriptions are the "<name> - AI 도구" placeholder; the rest are random
+    picks from the template's description words. The records pair up only by
+    chance; for checking how dedup scales.
+    """
+    rng = random.Random(seed)
+    words = sorted({w for tool in template['tools'] for w in (tool.get('description') or '').split()})
+    syllables = [c + v for c in 'bcdfghklmnprstvz' for v in 'aeiou']
+    records = []
+    for i in range(n_records):
+        name = ''.join(rng.choice(syllables) for _ in range(rng.randint(2, 4))).capitalize()
+        records.append({
+            'id': f"synth-{i}",
+            'slug': f"{name.lower()}-{i}",
+            'name': name,
+            'description': (f"{name} - AI 도구" if rng.random() < 0.6
+                            else ' '.join(rng.choice(words) for _ in range(rng.randint(2, 4)))),
+        })
+    return records
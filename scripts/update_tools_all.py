@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Apply every update_tools_* batch to seed.json in one process (one load, one dump)
+
+Batches are applied in file-name order. Where two batches set the same field
+of the same tool to different values, the batch named in
+seedkit.batches.PRECEDENCE for that slug wins, otherwise the later file does;
+every such conflict is listed with its winner. --strict refuses to write
+instead when a conflict is not covered by PRECEDENCE.
+"""
+import argparse
+import os
+import sys
+
+from seedkit.batches import PRECEDENCE, find_conflicts, load_batches, resolve_conflicts
+from seedkit.cli import build_parser, patch_from_cli
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def print_conflicts(conflicts, resolved):
+    print(f"  Conflicting values across batches: {len(conflicts)}")
+    for (slug, field, values), (_, _, name) in zip(conflicts, resolved):
+        rule = 'PRECEDENCE' if slug in PRECEDENCE else 'last file'
+        print(f"    ! {slug}.{field}: {name} wins ({rule})")
+        for other, value in values:
+            print(f"        {other:28s} {value!r:.70}")
+
+
+def print_report(report, batches):
+    print("=" * 60)
+    print(f"  {report.path}")
+    print(f"  All batches: {len(batches)} files, "
+          f"{sum(len(updates) for _, updates in batches)} entries")
+    print("=" * 60)
+    print(f"  Updated: {len(report.updated)} tools ({len(report.noop)} already up to date)")
+    for s in report.updated:
+        diff = report.fields[s]
+        if not (diff['changed'] or diff['new']):
+            print(f"    = {s}")
+            continue
+        parts = [f"{kind}: {', '.join(diff[kind])}" for kind in ('changed', 'new') if diff[kind]]
+        print(f"    + {s} ({'; '.join(parts)})")
+    if report.skipped:
+        print(f"  Skipped (already populated): {len(report.skipped)} tools")
+        for s in report.skipped:
+            print(f"    ~ {s}")
+    if report.not_found:
+        print(f"  NOT FOUND in {report.path}: {len(report.not_found)} slugs")
+        for s in report.not_found:
+            print(f"    ! {s}")
+    if report.written:
+        print("  Written.")
+    elif report.journaled:
+        print(f"  Journaled {len(report.ops)} ops; seed file left untouched.")
+    else:
+        print("  No field changed; file left untouched.")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    parser = build_parser(__doc__)
+    parser.formatter_class = argparse.RawDescriptionHelpFormatter
+    parser.add_argument('--strict', action='store_true',
+                        help="write nothing if batches conflict on a slug PRECEDENCE does not settle")
+    args = parser.parse_args()
+
+    batches = load_batches(SCRIPTS_DIR)
+    for name, updates in batches:
+        print(f"  {name:28s} {len(updates):3d} entries")
+
+    # ── Overlapping slug/fields: PRECEDENCE, then the later file wins ──
+    conflicts = find_conflicts(batches)
+    if conflicts:
+        batches, resolved = resolve_conflicts(batches, conflicts)
+        print_conflicts(conflicts, resolved)
+        unsettled = [c for c in conflicts if c[0] not in PRECEDENCE]
+        if args.strict and unsettled:
+            parser.exit(2, f"{len(unsettled)} conflicts not covered by PRECEDENCE; "
+                           f"no seed file was read or written.\n")
+
+    reports = patch_from_cli(__doc__, *(updates for _, updates in batches),
+                             names=[name for name, _ in batches], parser=parser)
+    for report in reports:
+        print_report(report, batches)
@@ -1,11 +1,6 @@
 #!/usr/bin/env python3
 """Batch 3: Video/Content AI tools update"""
-import json
-
-SEED_PATH = "e:/CLAUDE/AIPICK/data/seed.json"
-
-with open(SEED_PATH, 'r', encoding='utf-8') as f:
-    data = json.load(f)
+from seedkit.cli import patch_from_cli
 
 UPDATES = {
     # ── RUNWAY ML ──
@@ -683,16 +678,6 @@ UPDATES = {
     },
 }
 
-# Apply updates
-updated = 0
-for tool in data['tools']:
-    slug = tool['slug']
-    if slug in UPDATES:
-        for key, value in UPDATES[slug].items():
-            tool[key] = value
-        updated += 1
-
-with open(SEED_PATH, 'w', encoding='utf-8') as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
-
-print(f"Updated {updated} tools in seed.json")
+if __name__ == "__main__":
+    for report in patch_from_cli(__doc__, UPDATES):
+        print(f"Updated {len(report.updated)} tools in {report.path}")
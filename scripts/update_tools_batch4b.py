@@ -1,11 +1,6 @@
 #!/usr/bin/env python3
 """Batch 4b: Coding/Dev frameworks, Local LLM runners, AI image/design tools update"""
-import json
-
-SEED_PATH = "e:/CLAUDE/AIPICK/data/seed.json"
-
-with open(SEED_PATH, 'r', encoding='utf-8') as f:
-    data = json.load(f)
+from seedkit.cli import patch_from_cli
 
 UPDATES = {
     # ── LANGCHAIN ──
@@ -419,22 +414,11 @@ UPDATES = {
     },
 }
 
-# ── Apply updates ──
-updated_slugs = []
-for tool in data["tools"]:
-    slug = tool.get("slug")
-    if slug in UPDATES:
-        for key, value in UPDATES[slug].items():
-            tool[key] = value
-        updated_slugs.append(slug)
-
-print(f"Updated {len(updated_slugs)}/{len(UPDATES)} tools: {updated_slugs}")
-
-missing = set(UPDATES.keys()) - set(updated_slugs)
-if missing:
-    print(f"WARNING: Not found in seed.json: {missing}")
+if __name__ == "__main__":
+    for report in patch_from_cli(__doc__, UPDATES):
+        print(f"Updated {len(report.updated)}/{len(UPDATES)} tools: {report.updated}")
 
-with open(SEED_PATH, 'w', encoding='utf-8') as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
+        if report.not_found:
+            print(f"WARNING: Not found in {report.path}: {set(report.not_found)}")
 
-print("seed.json written successfully.")
+        print(f"{report.path} written successfully." if report.written else f"{report.path} already up to date; not rewritten.")
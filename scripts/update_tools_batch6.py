@@ -1,11 +1,6 @@
 #!/usr/bin/env python3
 """Batch 6: Automation/Productivity + SEO + Ad/Marketing tools update"""
-import json
-
-SEED_PATH = "e:/CLAUDE/AIPICK/data/seed.json"
-
-with open(SEED_PATH, 'r', encoding='utf-8') as f:
-    data = json.load(f)
+from seedkit.cli import patch_from_cli
 
 UPDATES = {
     # ═══════════════════════════════════════════════════════════════
@@ -646,14 +641,6 @@ UPDATES = {
 
 # ── bardeen: slug not found in seed.json, skipped ──
 
-updated = 0
-for tool in data['tools']:
-    slug = tool['slug']
-    if slug in UPDATES:
-        for key, value in UPDATES[slug].items():
-            tool[key] = value
-        updated += 1
-
-with open(SEED_PATH, 'w', encoding='utf-8') as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
-print(f"Updated {updated} tools (expected: {len(UPDATES)})")
+if __name__ == "__main__":
+    for report in patch_from_cli(__doc__, UPDATES):
+        print(f"Updated {len(report.updated)} tools (expected: {len(UPDATES)})")
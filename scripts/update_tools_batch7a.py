@@ -1,11 +1,6 @@
 #!/usr/bin/env python3
 """Batch 7a: Data/Analytics + Presentation tools update"""
-import json
-
-SEED_PATH = "e:/CLAUDE/AIPICK/data/seed.json"
-
-with open(SEED_PATH, 'r', encoding='utf-8') as f:
-    data = json.load(f)
+from seedkit.cli import patch_from_cli
 
 UPDATES = {
     # ═══════════════════════════════════════════════════════════════
@@ -566,28 +561,16 @@ UPDATES = {
     },
 }
 
-# ── Apply updates ──
-updated_slugs = []
-for tool in data["tools"]:
-    slug = tool.get("slug")
-    if slug in UPDATES:
-        for key, value in UPDATES[slug].items():
-            tool[key] = value
-        updated_slugs.append(slug)
-
-# ── Write back ──
-with open(SEED_PATH, 'w', encoding='utf-8') as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
-
-# ── Report ──
-print(f"Updated {len(updated_slugs)}/{len(UPDATES)} tools:")
-for s in sorted(updated_slugs):
-    print(f"  ✓ {s}")
+if __name__ == "__main__":
+    for report in patch_from_cli(__doc__, UPDATES):
+        # ── Report ──
+        print(f"Updated {len(report.updated)}/{len(UPDATES)} tools:")
+        for s in sorted(report.updated):
+            print(f"  ✓ {s}")
 
-missing = set(UPDATES.keys()) - set(updated_slugs)
-if missing:
-    print(f"\n⚠ Not found in seed.json ({len(missing)}):")
-    for s in sorted(missing):
-        print(f"  ✗ {s}")
-else:
-    print("\nAll tools updated successfully!")
+        if report.not_found:
+            print(f"\n⚠ Not found in {report.path} ({len(report.not_found)}):")
+            for s in sorted(report.not_found):
+                print(f"  ✗ {s}")
+        else:
+            print("\nAll tools updated successfully!")
@@ -1,14 +1,8 @@
 #!/usr/bin/env python3
 """Remaining batch 1: Translation (9) + Writing (11) + mem tools update"""
-import json
 import sys
 
-sys.stdout.reconfigure(encoding='utf-8')
-
-SEED_PATH = "e:/CLAUDE/AIPICK/data/seed.json"
-
-with open(SEED_PATH, 'r', encoding='utf-8') as f:
-    data = json.load(f)
+from seedkit.cli import patch_from_cli
 
 UPDATES = {
     # ═══════════════════════════════════════════════════════════════
@@ -643,43 +637,20 @@ UPDATES = {
     },
 }
 
-# ─── Apply Updates ───
-updated_slugs = []
-not_found = []
-
-for tool in data['tools']:
-    slug = tool['slug']
-    if slug in UPDATES:
-        for key, value in UPDATES[slug].items():
-            tool[key] = value
-        updated_slugs.append(slug)
-
-for slug in UPDATES:
-    if slug not in updated_slugs:
-        not_found.append(slug)
-
-# ─── Write back ───
-with open(SEED_PATH, 'w', encoding='utf-8') as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
-
-print(f"Updated {len(updated_slugs)} tools: {updated_slugs}")
-if not_found:
-    print(f"NOT FOUND: {not_found}")
-else:
-    print("All slugs matched successfully.")
-
-# ─── Verify ───
-print("\n--- Verification ---")
-with open(SEED_PATH, 'r', encoding='utf-8') as f:
-    verify = json.load(f)
-
-for t in verify['tools']:
-    if t['slug'] in UPDATES:
-        desc_len = len(t.get('description', ''))
-        ld_len = len(t.get('long_description', '') or '')
-        tags_n = len(t.get('tags', []))
-        pros_n = len(t.get('pros', []))
-        cons_n = len(t.get('cons', []))
-        tips_n = len(t.get('usage_tips', []))
-        fqd = 'YES' if t.get('free_quota_detail') else 'NO'
-        print(f"  {t['slug']:20s} | desc={desc_len:3d} | long={ld_len:4d} | tags={tags_n:2d} | pros={pros_n} | cons={cons_n} | tips={tips_n} | fqd={fqd}")
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    for report in patch_from_cli(__doc__, UPDATES, verify=True):
+        print(f"Updated {len(report.updated)} tools: {report.updated}")
+        if report.not_found:
+            print(f"NOT FOUND: {report.not_found}")
+        else:
+            print("All slugs matched successfully.")
+
+        # ─── Verify ───
+        print("\n--- Verification ---")
+        if report.written:
+            print(f"  sha256={report.digest[:12]} | on-disk match: {'YES' if report.verified else 'NO'}")
+        for t in report.stats:
+            fqd = 'YES' if t['fqd'] else 'NO'
+            print(f"  {t['slug']:20s} | desc={t['desc']:3d} | long={t['long']:4d} | tags={t['tags']:2d} | pros={t['pros']} | cons={t['cons']} | tips={t['tips']} | fqd={fqd}")
@@ -1,12 +1,9 @@
 #!/usr/bin/env python3
 """Remaining batch 2: Academic(6) + Education(6) + Customer Service(4) + HR(2) tools update"""
-import json
-import sys
 import io
+import sys
 
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-
-SEED_PATH = "e:/CLAUDE/AIPICK/data/seed.json"
+from seedkit.cli import patch_from_cli
 
 UPDATES = {
     # =====================================================================
@@ -860,30 +857,12 @@ UPDATES = {
     },
 }
 
-# ── Load, update, write ──────────────────────────────────────────────────
-
-with open(SEED_PATH, 'r', encoding='utf-8') as f:
-    data = json.load(f)
-
-updated = []
-not_found = []
-
-for tool in data['tools']:
-    slug = tool['slug']
-    if slug in UPDATES:
-        for key, value in UPDATES[slug].items():
-            tool[key] = value
-        updated.append(slug)
-
-for slug in UPDATES:
-    if slug not in updated:
-        not_found.append(slug)
-
-with open(SEED_PATH, 'w', encoding='utf-8') as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
+if __name__ == "__main__":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
-print(f"Updated {len(updated)} tools: {', '.join(updated)}")
-if not_found:
-    print(f"NOT FOUND: {', '.join(not_found)}")
-else:
-    print("All target slugs found and updated successfully.")
+    for report in patch_from_cli(__doc__, UPDATES):
+        print(f"Updated {len(report.updated)} tools: {', '.join(report.updated)}")
+        if report.not_found:
+            print(f"NOT FOUND: {', '.join(report.not_found)}")
+        else:
+            print("All target slugs found and updated successfully.")
@@ -1,11 +1,6 @@
 #!/usr/bin/env python3
 """Remaining batch 3: HR/Recruiting, Legal, Healthcare, 3D/Game, Social, Image/Design extras"""
-import json
-
-SEED_PATH = "e:/CLAUDE/AIPICK/data/seed.json"
-
-with open(SEED_PATH, 'r', encoding='utf-8') as f:
-    data = json.load(f)
+from seedkit.cli import patch_from_cli
 
 UPDATES = {
     # ===================================================================
@@ -507,43 +502,21 @@ UPDATES = {
     "lex": "SKIP",
 }
 
-# ── Apply Updates ──
-updated = []
-skipped = []
-not_found = []
-
-for tool in data["tools"]:
-    slug = tool["slug"]
-    if slug in UPDATES:
-        update_data = UPDATES[slug]
-        if update_data == "SKIP":
-            skipped.append(slug)
-            continue
-        for key, value in update_data.items():
-            tool[key] = value
-        updated.append(slug)
-
-# Check for slugs in UPDATES that weren't found in tools
-found_slugs = {t["slug"] for t in data["tools"]}
-for slug in UPDATES:
-    if slug not in found_slugs:
-        not_found.append(slug)
-
-with open(SEED_PATH, 'w', encoding='utf-8') as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
-
-print("=" * 60)
-print("  Remaining Batch 3: Update Complete")
-print("=" * 60)
-print(f"  Updated: {len(updated)} tools")
-for s in updated:
-    print(f"    + {s}")
-if skipped:
-    print(f"  Skipped (already populated): {len(skipped)} tools")
-    for s in skipped:
-        print(f"    ~ {s}")
-if not_found:
-    print(f"  NOT FOUND in seed.json: {len(not_found)} slugs")
-    for s in not_found:
-        print(f"    ! {s}")
-print("=" * 60)
+if __name__ == "__main__":
+    for report in patch_from_cli(__doc__, UPDATES):
+        print("=" * 60)
+        print("  Remaining Batch 3: Update Complete")
+        print(f"  {report.path}")
+        print("=" * 60)
+        print(f"  Updated: {len(report.updated)} tools")
+        for s in report.updated:
+            print(f"    + {s}")
+        if report.skipped:
+            print(f"  Skipped (already populated): {len(report.skipped)} tools")
+            for s in report.skipped:
+                print(f"    ~ {s}")
+        if report.not_found:
+            print(f"  NOT FOUND in {report.path}: {len(report.not_found)} slugs")
+            for s in report.not_found:
+                print(f"    ! {s}")
+        print("=" * 60)